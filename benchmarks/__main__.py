@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Run benchmarks against an in-process stand-in node and save the results as JSON
+
+ex) python -m benchmarks --output bench.json
+    python -m benchmarks --suite cli --suite api --baseline bench.json
+"""
+
+import argparse
+import sys
+from typing import List
+
+from governor.utils import print_table
+from .runner import create_report, save_report, load_report, compare_reports
+from .suites import SUITES, run_suites
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="governor benchmarks")
+    parser.add_argument("--suite", action="append", choices=SUITES, help="suite to run [default: all]")
+    parser.add_argument("--filter", type=str, help="run only benchmarks whose names contain it")
+    parser.add_argument("--repeat", type=int, default=5, help="the number of samples per benchmark [default: 5]")
+    parser.add_argument("--output", "-o", type=str, help="path to save the results as JSON")
+    parser.add_argument("--baseline", type=str, help="results of a previous run to compare with")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="ratio of change regarded as a regression [default: 0.2]"
+    )
+    args = parser.parse_args(argv)
+
+    report: dict = create_report(run_suites(args.suite or list(SUITES), args.repeat, args.filter))
+    if args.output:
+        save_report(report, args.output)
+
+    if args.baseline is None:
+        return 0
+
+    baseline: dict = load_report(args.baseline)
+    comparison = compare_reports(baseline, report, args.threshold)
+    rows = [
+        ["*" if regressed else "", name, metric, old, new, f"{(new - old) / old * 100:+.1f}%" if old else "-"]
+        for name, metric, old, new, regressed in comparison
+    ]
+    print(f"baseline: {baseline['version']}, current: {report['version']}")
+    print_table(["", "benchmark", "metric", "baseline", "current", "change"], rows)
+
+    return 1 if any(regressed for *_, regressed in comparison) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
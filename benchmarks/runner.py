@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measurement, persistence and comparison of benchmark results
+
+A result is either latency or throughput
+    latency:    {"n": 5, "min": 1.2, "mean": 1.5, "p50": 1.4, "p90": 1.9, "p99": 2.0, "max": 2.0}  # ms
+    throughput: {"items": 5000, "seconds": 0.8, "perSecond": 6250.0}
+"""
+
+import json
+import math
+import platform
+import time
+from typing import Callable, Dict, List, Tuple
+
+from governor import __about__
+
+PERCENTILES = (50, 90, 99)
+
+
+def percentile(samples: List[float], p: int) -> float:
+    """Nearest-rank percentile of sorted samples
+    """
+    rank: int = max(1, math.ceil(p / 100 * len(samples)))
+    return samples[rank - 1]
+
+
+def summarize(samples: List[float]) -> dict:
+    """
+    :param samples: elapsed seconds
+    :return: latency result in milliseconds
+    """
+    ms = sorted(sample * 1000 for sample in samples)
+
+    ret = {"n": len(ms), "min": ms[0], "mean": sum(ms) / len(ms)}
+    for p in PERCENTILES:
+        ret[f"p{p}"] = percentile(ms, p)
+    ret["max"] = ms[-1]
+
+    return {key: round(value, 3) for key, value in ret.items()}
+
+
+def measure(func: Callable[[], None], repeat: int, warmup: int = 1) -> dict:
+    for _ in range(warmup):
+        func()
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+
+    return summarize(samples)
+
+
+def measure_throughput(func: Callable[[], int]) -> dict:
+    """
+    :param func: return the number of processed items
+    """
+    start = time.perf_counter()
+    items: int = func()
+    seconds: float = time.perf_counter() - start
+
+    return {"items": items, "seconds": round(seconds, 3), "perSecond": round(items / seconds, 1)}
+
+
+def create_report(results: Dict[str, dict]) -> dict:
+    return {
+        "version": __about__.version,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": int(time.time()),
+        "results": results,
+    }
+
+
+def save_report(report: dict, path: str):
+    with open(path, "w") as f:
+        json.dump(report, f, indent=4)
+
+
+def load_report(path: str) -> dict:
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def compare_reports(baseline: dict, report: dict, threshold: float) -> List[Tuple[str, str, float, float, bool]]:
+    """Compare p50 latency and throughput of benchmarks in both reports
+
+    :param baseline:
+    :param report:
+    :param threshold: ratio of change regarded as a regression ex) 0.2
+    :return: [(name, metric, baseline value, new value, regressed)]
+    """
+    ret = []
+
+    for name, result in report["results"].items():
+        old: dict = baseline["results"].get(name)
+        if old is None:
+            continue
+
+        if "p50" in result and "p50" in old:
+            regressed = result["p50"] > old["p50"] * (1 + threshold)
+            ret.append((name, "p50 ms", old["p50"], result["p50"], regressed))
+        elif "perSecond" in result and "perSecond" in old:
+            regressed = result["perSecond"] < old["perSecond"] * (1 - threshold)
+            ret.append((name, "items/s", old["perSecond"], result["perSecond"], regressed))
+
+    return ret
@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark suites run against MockNode
+
+startup: `governor <command> --help` in a new process
+cli:     every non-interactive command end to end in a new process
+api:     GovernanceReader and GovernanceWriter calls in process
+bulk:    throughput of batch reads and the transaction pipeline
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from functools import partial
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from iconsdk.wallet.wallet import KeyWallet
+
+from governor.broadcast import save_signed_transactions
+from governor.bulk import BulkReader, BulkTxResultReader
+from governor.commands import COMMANDS
+from governor.governance import GovernanceWriter, create_icon_service, create_reader
+from governor.pipeline import Operation, TxPipeline
+from tests.node import MockNode
+from .runner import measure, measure_throughput
+
+SUITES = ("startup", "cli", "api", "bulk")
+
+# (name, function which measures and returns the result)
+Benchmark = Tuple[str, Callable[[], dict]]
+
+PASSWORD = "bench1234!"
+
+# Commands which are interactive or keep running
+INTERACTIVE_COMMANDS = ("agent", "shell", "watch")
+
+ADDRESS = "hx" + "1" * 40
+SCORE_ADDRESS = "cx" + "2" * 40
+
+# command -> positional arguments. {name} is replaced with an attribute of BenchContext
+CLI_ARGUMENTS: Dict[str, List[str]] = {
+    "update": ["{score_path}"],
+    "acceptScore": ["{tx_hash}"],
+    "rejectScore": ["{tx_hash}", "benchmark"],
+    "addAuditor": [ADDRESS],
+    "removeAuditor": [ADDRESS],
+    "addDeployer": [ADDRESS],
+    "removeDeployer": [ADDRESS],
+    "addToScoreBlackList": [SCORE_ADDRESS],
+    "removeFromScoreBlackList": [SCORE_ADDRESS],
+    "addImportWhiteList": ["{{'json': []}}"],
+    "removeImportWhiteList": ["{{'json': []}}"],
+    "getScoreStatus": [SCORE_ADDRESS],
+    "getServiceConfig": [],
+    "updateServiceConfig": ["0"],
+    "isDeployer": [ADDRESS],
+    "isInScoreBlackList": [SCORE_ADDRESS],
+    "isInImportWhiteList": ["os"],
+    "setStepCost": ["apiCall", "10000"],
+    "setStepPrice": ["10000000000"],
+    "setMaxStepLimit": ["invoke", "2500000000"],
+    "getStepCosts": [],
+    "getStepPrice": [],
+    "getMaxStepLimit": ["invoke"],
+    "setRevision": ["6", "1.6.0"],
+    "getRevision": [],
+    "getVersion": [],
+    "txresult": ["{tx_hash}"],
+    "snapshot": [],
+    "diff": ["{snapshot_path}", "{url}"],
+    "pipeline": ["{operations_path}"],
+    # Runs after the first resume from its journal
+    "apply": ["{operations_path}"],
+    "sync": ["{state_path}"],
+    # Transactions sent by the first run are already on the node afterwards
+    "broadcast": ["{signed_path}"],
+    "auditQueue": [],
+    "auditBatch": ["accept", "{tx_hash}"],
+}
+
+# diff exits with 1 when the state has changed since the snapshot
+EXIT_CODES: Dict[str, Tuple[int, ...]] = {"diff": (0, 1)}
+
+
+class BenchContext(object):
+    """MockNode and the files which commands need
+    """
+
+    def __init__(self):
+        self.node = MockNode()
+        self.directory = tempfile.mkdtemp()
+        self.wallet = KeyWallet.create()
+
+        self.keystore_path = os.path.join(self.directory, "keystore.json")
+        self.score_path = os.path.join(self.directory, "governance")
+        self.snapshot_path = os.path.join(self.directory, "snapshot.json")
+        self.operations_path = os.path.join(self.directory, "operations.json")
+        self.state_path = os.path.join(self.directory, "state.json")
+        self.signed_path = os.path.join(self.directory, "signed.ndjson")
+        self.tx_hash: Optional[str] = None
+
+        # Caches of governor are kept apart from the user's
+        self.env = dict(os.environ, GOVERNOR_CACHE_DIR=os.path.join(self.directory, "cache"))
+        # The CLI runs in the workspace, where it writes governor.log
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.env["PYTHONPATH"] = os.pathsep.join(filter(None, (root, os.environ.get("PYTHONPATH"))))
+
+    @property
+    def url(self) -> str:
+        return self.node.url
+
+    def __enter__(self) -> 'BenchContext':
+        self.node.start()
+        try:
+            self._prepare()
+        except BaseException as e:
+            self.__exit__(type(e), e, None)
+            raise e
+
+        return self
+
+    def _prepare(self):
+        self.wallet.store(self.keystore_path, PASSWORD)
+
+        os.makedirs(self.score_path)
+        with open(os.path.join(self.score_path, "package.json"), "w") as f:
+            json.dump({"version": "1.0.0", "main_module": "governance", "main_score": "Governance"}, f)
+        with open(os.path.join(self.score_path, "governance.py"), "w") as f:
+            f.write("# governance SCORE\n" * 1000)
+
+        with open(self.operations_path, "w") as f:
+            operations = [{"command": "addDeployer", "params": {"address": f"hx{i:040x}"}} for i in range(10)]
+            json.dump(operations, f)
+
+        with open(self.state_path, "w") as f:
+            state = {"deployers": [f"hx{i:040x}" for i in range(100)], "stepCosts": {"apiCall": 10000}}
+            json.dump(state, f)
+
+        signer = self.create_writer()
+        signer.set_sign_only(True)
+        save_signed_transactions(self.signed_path, [signer.add_deployer(f"hx{i:040x}") for i in range(10)])
+
+        self.tx_hash = self.create_writer().add_deployer(ADDRESS)
+        self.run_cli(["snapshot", self.snapshot_path, "--url", self.url])
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.node.stop()
+        shutil.rmtree(self.directory)
+
+    def create_writer(self) -> GovernanceWriter:
+        writer = GovernanceWriter(create_icon_service(self.url), 3, self.wallet)
+        writer.set_on_send_request(lambda content: True)
+        return writer
+
+    def get_cli_argv(self, name: str) -> List[str]:
+        argv = [name] + [argument.format(**vars(self), url=self.url) for argument in CLI_ARGUMENTS[name]]
+        argv += ["--url", self.url]
+
+        if "invoke" in _find_parents(name):
+            argv += ["-k", self.keystore_path, "-p", PASSWORD, "-y"]
+
+        return argv
+
+    def run_cli(self, argv: List[str]):
+        process = subprocess.run(
+            [sys.executable, "-m", "governor"] + argv,
+            cwd=self.directory, env=self.env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+        )
+        if process.returncode not in EXIT_CODES.get(argv[0], (0,)):
+            raise RuntimeError(f"governor {' '.join(argv)} failed: {process.stderr.decode()[-500:]}")
+
+
+def _find_parents(name: str) -> Tuple[str, ...]:
+    return next(command.parents for command in COMMANDS if command.name == name)
+
+
+def run_startup(ctx: BenchContext, repeat: int) -> Iterator[Benchmark]:
+    yield "startup.help", partial(measure, partial(ctx.run_cli, ["--help"]), repeat)
+
+    for command in COMMANDS:
+        yield f"startup.{command.name}", partial(measure, partial(ctx.run_cli, [command.name, "--help"]), repeat)
+
+
+def run_cli(ctx: BenchContext, repeat: int) -> Iterator[Benchmark]:
+    for command in COMMANDS:
+        if command.name in INTERACTIVE_COMMANDS:
+            continue
+
+        argv: List[str] = ctx.get_cli_argv(command.name)
+        yield f"cli.{command.name}", partial(measure, partial(ctx.run_cli, argv), repeat)
+
+
+def run_api(ctx: BenchContext, repeat: int) -> Iterator[Benchmark]:
+    reader = create_reader(ctx.url, 3)
+    calls = {
+        "get_version": partial(reader.get_version),
+        "get_revision": partial(reader.get_revision),
+        "get_service_config": partial(reader.get_service_config),
+        "get_step_costs": partial(reader.get_step_costs),
+        "get_max_step_limit": partial(reader.get_max_step_limit, "invoke"),
+        "is_deployer": partial(reader.is_deployer, ADDRESS),
+        "get_tx_result": partial(reader.get_tx_result, ctx.tx_hash),
+    }
+    for name, call in calls.items():
+        yield f"api.reader.{name}", partial(measure, call, repeat * 20)
+
+    def read_in_batch():
+        batch = reader.batch()
+        for method in ("get_version", "get_revision", "get_service_config", "get_step_costs", "get_step_price"):
+            getattr(batch, method)()
+        batch.execute()
+
+    yield "api.reader.batch", partial(measure, read_in_batch, repeat * 20)
+
+    writer = ctx.create_writer()
+    yield "api.writer.set_step_price", partial(measure, partial(writer.set_step_price, 10 ** 10), repeat * 10)
+
+    signer = ctx.create_writer()
+    signer.set_sign_only(True)
+    yield "api.writer.sign", partial(measure, partial(signer.set_step_price, 10 ** 10), repeat * 10)
+
+
+def run_bulk(ctx: BenchContext, repeat: int) -> Iterator[Benchmark]:
+    reader = create_reader(ctx.url, 3)
+    addresses = [f"hx{i:040x}" for i in range(1000 * repeat)]
+
+    def check_deployers() -> int:
+        return sum(1 for _ in BulkReader(reader, "is_deployer").run(addresses))
+
+    def read_tx_results() -> int:
+        tx_hashes = list(ctx.node.tx_results)
+        return sum(1 for _ in BulkTxResultReader(reader).run(tx_hashes))
+
+    def run_pipeline() -> int:
+        operations = [Operation("addDeployer", {"address": address}) for address in addresses[:50 * repeat]]
+        return len(TxPipeline(ctx.create_writer()).run(operations))
+
+    yield "bulk.is_deployer", partial(measure_throughput, check_deployers)
+    yield "bulk.pipeline", partial(measure_throughput, run_pipeline)
+    yield "bulk.txresult", partial(measure_throughput, read_tx_results)
+
+
+def run_suites(suites: List[str], repeat: int, name_filter: Optional[str] = None) -> Dict[str, dict]:
+    """
+    :param suites: names in SUITES
+    :param repeat: the number of samples per benchmark. Bulk sizes are scaled by it
+    :param name_filter: run only benchmarks whose names contain it
+    :return: benchmark name -> result
+    """
+    runners = {"startup": run_startup, "cli": run_cli, "api": run_api, "bulk": run_bulk}
+    results = {}
+
+    with BenchContext() as ctx:
+        for suite in suites:
+            for name, benchmark in runners[suite](ctx, repeat):
+                if name_filter and name_filter not in name:
+                    continue
+
+                results[name] = benchmark()
+                print(f"{name}: {results[name]}", file=sys.stderr)
+
+    return results
@@ -15,30 +15,43 @@
 # limitations under the License.
 
 import argparse
-import json
 import logging
 import sys
-import time
-from typing import Optional
+from typing import List, Optional
 
 from governor.constants import PREDEFINED_URLS
-from . import revision_command
-from . import score_command
-from . import step_command
-from . import txresult_command
-from .constants import DEFAULT_URL, DEFAULT_NID, COLUMN
-from .governance import create_icon_service
-from .utils import print_title, print_tx_result, print_response, get_url
+from .commands import COMMANDS, find_command
+from .constants import DEFAULT_URL, DEFAULT_NID, WAIT_TIMEOUT, STEP_MARGIN, READ_CACHE_BACKENDS, OUTPUT_FORMATS
+from .utils import print_diagnostic, print_tx_result, print_response, get_output, get_url, set_output
 from . import __about__
 
 
 def main() -> int:
-    handlers = [
-        score_command.init,
-        step_command.init,
-        revision_command.init,
-        txresult_command.init
-    ]
+    argv: List[str] = sys.argv[1:]
+    parser = create_parser(argv=argv)
+
+    if len(argv) == 0:
+        parser.print_help(sys.stderr)
+        return 1
+
+    args = parser.parse_args(argv)
+    return run(args)
+
+
+def create_parser(url: str = DEFAULT_URL,
+                  nid: int = DEFAULT_NID,
+                  keystore: Optional[str] = None,
+                  argv: Optional[List[str]] = None) -> argparse.ArgumentParser:
+    """Create the parser for subcommands
+
+    :param url: default url
+    :param nid: default nid
+    :param keystore: default keystore path. keystore option is required if it is None
+    :param argv: arguments to parse. Only the subcommand in argv is fully built.
+        Every subcommand is built if None
+    :return:
+    """
+    chosen = find_command(argv[0]) if argv else None
 
     parser = argparse.ArgumentParser(
         prog=__about__.name,
@@ -47,29 +60,76 @@ def main() -> int:
         epilog=_get_epilog())
     sub_parser = parser.add_subparsers(title="subcommands")
 
-    common_parent_parser = create_common_parser()
-    invoke_parent_parser = create_invoke_parser()
+    common_parent_parser = create_common_parser(url, nid)
+    invoke_parent_parser = create_invoke_parser(keystore)
 
-    for handler in handlers:
-        handler(sub_parser, common_parent_parser, invoke_parent_parser)
+    parent_parsers = {"common": common_parent_parser, "invoke": invoke_parent_parser}
+
+    for command in COMMANDS:
+        if argv is None or command is chosen:
+            command.add_parser(sub_parser, parent_parsers)
+        else:
+            command.add_stub_parser(sub_parser)
+
+    return parser
 
-    if len(sys.argv) == 1:
-        parser.print_help(sys.stderr)
-        return 1
 
-    args = parser.parse_args()
+def run(args) -> int:
+    set_output(getattr(args, "output", OUTPUT_FORMATS[0]))
     _print_arguments(args)
 
     _init_logger(args)
 
+    timings: bool = getattr(args, "timings", False)
+    trace_file: Optional[str] = getattr(args, "trace_file", None)
+    if not (timings or trace_file):
+        return _run(args)
+
+    from .timings import disable_timings, enable_timings, span
+
+    tracer = enable_timings()
+    try:
+        with span("command", command=args.command):
+            return _run(args)
+    finally:
+        # Commands run later in a shell don't record to the tracer
+        disable_timings()
+        if timings:
+            tracer.print_summary()
+        if trace_file:
+            tracer.save(trace_file)
+
+
+def _run(args) -> int:
+    from .fan_out import is_fan_out, run_fan_out
+    if is_fan_out(args):
+        return run_fan_out(args)
+
     ret: Optional[int, str] = args.func(args)
-    if isinstance(ret, str):
-        print_response(ret)
+    sign_only: Optional[str] = getattr(args, "sign_only", None)
 
-        if not args.no_result:
-            ret = _print_tx_result(args, tx_hash=ret)
+    if getattr(args, "estimate", False) and isinstance(ret, int):
+        # Write commands return the estimated step instead of tx_hash
+        if get_output() == "table":
+            print_response(f"Estimate step: {ret}, {hex(ret)}")
         else:
+            print_response({"step": hex(ret)})
+        ret = 0
+    elif sign_only and not isinstance(ret, (int, str)):
+        from .broadcast import save_signed_transactions
+
+        records = save_signed_transactions(sign_only, [ret])
+        print_response({"path": sign_only, "txHash": records[0]["txHash"]})
+        ret = 0
+    elif isinstance(ret, str):
+        if args.no_result:
+            print_response(ret if get_output() == "table" else {"txHash": ret})
             ret = 0
+        else:
+            # Only the transaction result, which has txHash, is written in machine-readable outputs
+            if get_output() == "table":
+                print_response(ret)
+            ret = _print_tx_result(args, tx_hash=ret)
 
     return ret
 
@@ -95,45 +155,39 @@ def _init_logger(args):
 
 
 def _print_arguments(args):
-    print_title("Arguments", COLUMN)
-
     arguments = {}
     for name, value in args._get_kwargs():
         if name == "func":
             value = value.__name__
-        elif name == "url":
+        elif name == "url" and value != "all":
             value = get_url(value)
         arguments[name] = value
 
-    print(f"{json.dumps(arguments, indent=4)}\n")
+    print_diagnostic("Arguments", arguments)
 
 
 def _print_tx_result(args, tx_hash: str) -> int:
-    ret = 1
-
     if not (tx_hash.startswith("0x") and len(tx_hash) == 66):
-        print(tx_hash)
-        return ret
+        print(tx_hash, file=sys.stderr)
+        return 1
 
-    # Waite to finish the requested transaction on blockchain
-    time.sleep(3)
+    from .governance import create_icon_service
+    from .waiter import TxResultWaiter, TxResultTimeoutError
+
+    from .timings import span
 
     icon_service = create_icon_service(args.url)
-    repeat = 3
-
-    for i in range(repeat):
-        try:
-            tx_result: dict = icon_service.get_transaction_result(tx_hash)
-            print_tx_result(tx_result)
-            break
-        except:
-            if i + 1 == repeat:
-                print(f"Failed to get the transaction result: {tx_hash}")
-            else:
-                print(f"Retrying {i + 2}/{repeat} after 2 seconds...")
-                time.sleep(2)
+    waiter = TxResultWaiter(icon_service, timeout=args.wait_timeout)
 
-    return ret
+    try:
+        with span("tx.wait"):
+            tx_result: dict = waiter.wait(tx_hash)
+    except TxResultTimeoutError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    print_tx_result(tx_result)
+    return 0
 
 
 def _get_epilog() -> str:
@@ -145,27 +199,65 @@ def _get_epilog() -> str:
     return "\n".join(words)
 
 
-def create_common_parser() -> argparse.ArgumentParser:
+def create_common_parser(url: str = DEFAULT_URL, nid: int = DEFAULT_NID) -> argparse.ArgumentParser:
     parent_parser = argparse.ArgumentParser(add_help=False)
     parent_parser.add_argument(
         "--url", "-u",
         type=str,
         required=False,
-        default=DEFAULT_URL,
-        help=f"node url default) {DEFAULT_URL}"
+        default=url,
+        help=(
+            f"node url, or 'all' for every predefined url default) {url}\n"
+            "comma-separated urls of the same network to fail over among them ex) node1,node2"
+        )
+    )
+    parent_parser.add_argument(
+        "--urls",
+        type=str,
+        required=False,
+        default=None,
+        help="comma-separated node urls to read from at once ex) mainnet,testnet"
     )
     parent_parser.add_argument(
         "--nid", "-n",
         type=int,
         required=False,
-        default=DEFAULT_NID,
-        help=f"networkId default({DEFAULT_NID} ex) mainnet(1), testnet(2)"
+        default=nid,
+        help=f"networkId default({nid} ex) mainnet(1), testnet(2)"
     )
     parent_parser.add_argument(
         "--verbose", "-v",
         required=False,
         action="store_true"
     )
+    parent_parser.add_argument(
+        "--output",
+        choices=OUTPUT_FORMATS,
+        default=OUTPUT_FORMATS[0],
+        required=False,
+        help=(
+            "format of results written to stdout. Arguments and requests are written to stderr\n"
+            "json: a compact json per result, ndjson: a json per line, quiet: exit code only"
+        )
+    )
+    parent_parser.add_argument(
+        "--timings",
+        action="store_true",
+        required=False,
+        help="print wall and CPU time of each phase and RPC"
+    )
+    parent_parser.add_argument(
+        "--trace-file",
+        type=str,
+        required=False,
+        help="write the timing of each phase and RPC in Chrome trace event format"
+    )
+    parent_parser.add_argument(
+        "--read-cache",
+        choices=READ_CACHE_BACKENDS,
+        required=False,
+        help="serve queries from a cache which is valid until the next block. 'disk' is shared by processes"
+    )
     parent_parser.add_argument(
         "--log",
         type=str,
@@ -179,9 +271,10 @@ def create_common_parser() -> argparse.ArgumentParser:
     return parent_parser
 
 
-def create_invoke_parser() -> argparse.ArgumentParser:
+def create_invoke_parser(keystore: Optional[str] = None) -> argparse.ArgumentParser:
     """Common options for invoke commands
 
+    :param keystore: default keystore path
     :return:
     """
 
@@ -197,15 +290,48 @@ def create_invoke_parser() -> argparse.ArgumentParser:
     parent_parser.add_argument(
         "--keystore", "-k",
         type=str,
-        required=True,
+        required=keystore is None,
+        default=keystore,
         help="keystore file path"
     )
+    parent_parser.add_argument(
+        "--agent",
+        action="store_true",
+        required=False,
+        help="Sign with the key held by 'governor agent' instead of decrypting keystore"
+    )
     parent_parser.add_argument(
         "--no-result",
         action="store_true",
         required=False,
         help="Display transaction result automatically after invoking is done"
     )
+    parent_parser.add_argument(
+        "--wait-timeout",
+        type=float,
+        required=False,
+        default=WAIT_TIMEOUT,
+        help=f"seconds to wait for the transaction result default) {WAIT_TIMEOUT}"
+    )
+    parent_parser.add_argument(
+        "--sign-only",
+        type=str,
+        required=False,
+        metavar="PATH",
+        help="Append the signed transaction to a file instead of sending it. Send it later with broadcast"
+    )
+    parent_parser.add_argument(
+        "--estimate",
+        action="store_true",
+        required=False,
+        help="Print the estimated step instead of sending a transaction"
+    )
+    parent_parser.add_argument(
+        "--auto-step-limit",
+        action="store_true",
+        required=False,
+        help=f"Set stepLimit to the estimated step plus {int(STEP_MARGIN * 100)}%% margin"
+    )
     parent_parser.add_argument(
         "--yes", "-y",
         action="store_true",
@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Local signing agent which keeps decrypted keys in memory
+
+Loading a keystore file costs a heavy scrypt key derivation.
+The agent pays for it once and signs transactions for later governor invocations
+through a unix domain socket which only its owner can access.
+"""
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import stat
+import tempfile
+import threading
+import time
+from typing import Dict, Tuple, Optional
+
+from iconsdk.exception import IconServiceBaseException
+from iconsdk.wallet.wallet import Wallet, KeyWallet
+
+from .constants import AGENT_TTL
+
+# Environment variable to specify the socket path of the agent
+AGENT_SOCK_ENV = "GOVERNOR_AGENT_SOCK"
+
+
+class AgentError(Exception):
+    pass
+
+
+def get_agent_socket_path() -> str:
+    path: Optional[str] = os.environ.get(AGENT_SOCK_ENV)
+    if path:
+        return path
+
+    return os.path.join(tempfile.gettempdir(), f"governor-{os.getuid()}", "agent.sock")
+
+
+def _prepare_socket_directory(directory: str):
+    """Create the directory of the socket which only its owner can access, or check the existing one
+
+    An existing directory is never chmod-ed: it may be shared like /tmp or created by another user
+    """
+    parent: str = os.path.dirname(os.path.abspath(directory))
+    os.makedirs(parent, mode=0o700, exist_ok=True)
+
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        st = os.lstat(directory)
+        if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077 != 0:
+            raise AgentError(
+                f"Socket directory has to be a directory which only the current user can access: {directory}"
+            )
+    else:
+        # The mode of mkdir() is masked by umask
+        os.chmod(directory, 0o700)
+
+
+def _get_key(keystore_path: str) -> str:
+    return os.path.realpath(keystore_path)
+
+
+class KeyAgent(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server holding wallets with TTL
+
+    A request and its response are a json object in a line
+        {"method": "add", "keystore": path, "password": password, "ttl": seconds}
+        {"method": "address", "keystore": path}
+        {"method": "sign", "keystore": path, "data": hex string}
+        {"method": "status"}
+        {"method": "stop"}
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path: str):
+        _prepare_socket_directory(os.path.dirname(path) or ".")
+        if os.path.exists(path):
+            os.unlink(path)
+
+        super().__init__(path, _AgentRequestHandler)
+        os.chmod(path, 0o600)
+
+        self._path = path
+        self._lock = threading.Lock()
+        # keystore path -> (wallet, expiration time)
+        self._wallets: Dict[str, Tuple[KeyWallet, float]] = {}
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def add_wallet(self, keystore_path: str, wallet: KeyWallet, ttl: float = AGENT_TTL):
+        with self._lock:
+            self._wallets[_get_key(keystore_path)] = (wallet, time.monotonic() + ttl)
+
+    def get_wallet(self, keystore_path: str) -> KeyWallet:
+        with self._lock:
+            item = self._wallets.get(_get_key(keystore_path))
+
+        if item is None or item[1] < time.monotonic():
+            raise AgentError(f"No key for keystore: {keystore_path}")
+        return item[0]
+
+    def service_actions(self):
+        """Called in every loop of serve_forever(): remove expired keys
+        """
+        now = time.monotonic()
+        with self._lock:
+            for key in [key for key, (_, expire) in self._wallets.items() if expire < now]:
+                logging.info(f"KeyAgent: key expired: {key}")
+                del self._wallets[key]
+
+    def handle_request_object(self, request: dict) -> dict:
+        method: str = request.get("method")
+
+        if method == "sign":
+            wallet = self.get_wallet(request["keystore"])
+            signature: bytes = wallet.sign(bytes.fromhex(request["data"]))
+            return {"signature": signature.hex()}
+        if method == "address":
+            wallet = self.get_wallet(request["keystore"])
+            return {"address": wallet.get_address()}
+        if method == "add":
+            wallet = KeyWallet.load(request["keystore"], request["password"])
+            self.add_wallet(request["keystore"], wallet, request.get("ttl", AGENT_TTL))
+            return {"address": wallet.get_address()}
+        if method == "status":
+            now = time.monotonic()
+            with self._lock:
+                keys = {key: int(expire - now) for key, (_, expire) in self._wallets.items() if expire >= now}
+            return {"pid": os.getpid(), "keys": keys}
+        if method == "stop":
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {}
+
+        raise AgentError(f"Invalid method: {method}")
+
+    def server_close(self):
+        super().server_close()
+
+        with self._lock:
+            self._wallets.clear()
+        if os.path.exists(self._path):
+            os.unlink(self._path)
+
+
+class _AgentRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            try:
+                response = self.server.handle_request_object(json.loads(line))
+            except (Exception, IconServiceBaseException) as e:
+                response = {"error": str(e)}
+
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class AgentClient(object):
+    def __init__(self, path: str = None):
+        self._path = path if path else get_agent_socket_path()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def is_running(self) -> bool:
+        try:
+            self.request({"method": "status"})
+            return True
+        except (OSError, AgentError):
+            return False
+
+    def request(self, request: dict) -> dict:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(self._path)
+            with sock.makefile("rwb") as f:
+                f.write(json.dumps(request).encode() + b"\n")
+                f.flush()
+                line: bytes = f.readline()
+
+        if not line:
+            raise AgentError("No response from agent")
+
+        response: dict = json.loads(line)
+        if "error" in response:
+            raise AgentError(response["error"])
+        return response
+
+    def add(self, keystore_path: str, password: str, ttl: float = AGENT_TTL) -> str:
+        response = self.request(
+            {"method": "add", "keystore": _get_key(keystore_path), "password": password, "ttl": ttl}
+        )
+        return response["address"]
+
+    def status(self) -> dict:
+        return self.request({"method": "status"})
+
+    def stop(self):
+        self.request({"method": "stop"})
+
+
+class AgentWallet(Wallet):
+    """Wallet which asks the agent to sign data with the key of a given keystore
+    """
+
+    def __init__(self, client: AgentClient, keystore_path: str):
+        self._client = client
+        self._keystore_path = _get_key(keystore_path)
+
+        response = client.request({"method": "address", "keystore": self._keystore_path})
+        self._address: str = response["address"]
+
+    def get_address(self) -> str:
+        return self._address
+
+    def sign(self, data: bytes) -> bytes:
+        response = self._client.request(
+            {"method": "sign", "keystore": self._keystore_path, "data": data.hex()}
+        )
+        return bytes.fromhex(response["signature"])
+
+
+def load_agent_wallet(keystore_path: str) -> Optional[AgentWallet]:
+    """Return a wallet backed by the running agent
+
+    :return: None if the agent is not running or doesn't hold the key of keystore_path
+    """
+    try:
+        return AgentWallet(AgentClient(), keystore_path)
+    except (OSError, AgentError) as e:
+        logging.info(f"Agent is not available: {e}")
+        return None
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import getpass
+import os
+import sys
+
+from iconsdk.wallet.wallet import KeyWallet
+
+from .agent import AgentClient, KeyAgent, AGENT_SOCK_ENV
+from .utils import get_output, print_response
+
+
+def _run_agent(args) -> int:
+    action: str = args.action
+    client = AgentClient()
+
+    if action == "start":
+        return _start_agent(args, client)
+    if action == "add":
+        address: str = client.add(args.keystore, _get_password(args), args.ttl)
+        print_response(f"Added: {address}" if get_output() == "table" else {"address": address})
+    elif action == "status":
+        print_response(client.status())
+    elif action == "stop":
+        client.stop()
+        print_response("Stopped" if get_output() == "table" else {"status": "stopped"})
+
+    return 0
+
+
+def _get_password(args) -> str:
+    if args.keystore is None:
+        raise ValueError("keystore is required")
+
+    password: str = args.password
+    if password is None:
+        password = getpass.getpass("> Password: ")
+
+    return password
+
+
+def _start_agent(args, client: AgentClient) -> int:
+    if client.is_running():
+        print(f"Agent is already running: {client.path}")
+        if args.keystore:
+            client.add(args.keystore, _get_password(args), args.ttl)
+        return 0
+
+    server = KeyAgent(client.path)
+    if args.keystore:
+        wallet = KeyWallet.load(args.keystore, _get_password(args))
+        server.add_wallet(args.keystore, wallet, args.ttl)
+
+    print(f"{AGENT_SOCK_ENV}={server.path}; export {AGENT_SOCK_ENV};")
+    sys.stdout.flush()
+
+    if not args.foreground and os.fork() > 0:
+        # Parent process: the child process serves on the socket
+        server.socket.close()
+        return 0
+
+    if not args.foreground:
+        os.setsid()
+        _redirect_stdio()
+
+    try:
+        server.serve_forever(poll_interval=1)
+    finally:
+        server.server_close()
+
+    if not args.foreground:
+        os._exit(0)
+    return 0
+
+
+def _redirect_stdio():
+    fd = os.open(os.devnull, os.O_RDWR)
+    for i in range(3):
+        os.dup2(fd, i)
+    os.close(fd)
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import List
+
+from .governance import create_writer_by_args
+from .plan import Journal, Plan, StepResult, PlanExecutor, load_plan
+from .utils import print_response, print_table
+
+
+def _apply(args) -> int:
+    if args.estimate:
+        raise ValueError("apply doesn't support --estimate")
+    if args.sign_only:
+        # Steps are sent only after the steps which they depend on have succeeded
+        raise ValueError("apply doesn't support --sign-only")
+
+    plan: Plan = load_plan(args.path)
+    journal = Journal(args.journal if args.journal else f"{args.path}.journal.json")
+
+    if args.dry_run:
+        _print_plan(plan, journal)
+        return 0
+
+    executor = PlanExecutor(
+        create_writer_by_args(args),
+        journal,
+        max_in_flight=args.max_in_flight,
+        timeout=args.wait_timeout,
+    )
+    results: List[StepResult] = executor.run(plan)
+
+    print_response({"journal": journal.path, "results": [result.to_dict() for result in results]})
+
+    return 0 if len(results) > 0 and all(result.success for result in results) else 1
+
+
+def _print_plan(plan: Plan, journal: Journal):
+    rows = []
+    for step_id in plan.order:
+        step = plan.get_step(step_id)
+        entry = journal.get(step)
+        deps = [dep for dep in plan.order if dep in plan.dependencies[step_id]]
+
+        rows.append([step_id, step.command, ",".join(deps), entry["status"] if entry else ""])
+
+    print_table(["id", "command", "depends_on", "journal"], rows)
@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Asyncio version of GovernanceReader and GovernanceWriter
+
+Every read and write method of AsyncGovernanceReader and AsyncGovernanceWriter
+returns a coroutine. aiohttp is required: pip install governor[async]
+
+ex)
+    reader = create_async_reader(url, nid)
+    version, revision = await asyncio.gather(reader.get_version(), reader.get_revision())
+    await reader.close()
+"""
+
+import asyncio
+import json
+import logging
+from json.decoder import JSONDecodeError
+from typing import List, Any, Optional
+from urllib.parse import urlparse
+
+from iconsdk.builder.transaction_builder import Transaction
+from iconsdk.exception import HTTPError
+from iconsdk.signed_transaction import SignedTransaction
+from iconsdk.wallet.wallet import KeyWallet
+
+from .constants import EOA_ADDRESS, GOVERNANCE_ADDRESS
+from .governance import (
+    Call,
+    GovernanceReader,
+    GovernanceBatchReader,
+    GovernanceWriter,
+    TxHandler,
+    _is_audit_enabled,
+    _to_block_height,
+    _to_tx_result,
+)
+from .provider import RpcRequest, _to_batch_results, _to_exception
+from .step_estimator import StepEstimator, get_step_estimate_cache
+from .utils import get_url
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# The maximum number of simultaneous connections per node
+ASYNC_POOL_SIZE = 100
+
+
+class AsyncHTTPProvider(object):
+    """JSON-RPC provider running on aiohttp
+
+    The client session is created lazily in the running event loop and has to be closed by close()
+    """
+
+    def __init__(self, base_domain_url: str, version: int, pool_size: int = ASYNC_POOL_SIZE, timeout: int = 10):
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for async governance API: pip install aiohttp")
+
+        self._rpc_url = f"{base_domain_url}/api/v{version}"
+        self._debug_url = f"{base_domain_url}/api/v{version}d"
+        self._pool_size = pool_size
+        self._timeout = timeout
+        self._session: Optional['aiohttp.ClientSession'] = None
+        self._id = 0
+
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=self._pool_size),
+                timeout=aiohttp.ClientTimeout(total=self._timeout),
+                headers={"Content-Type": "application/json"},
+            )
+
+        return self._session
+
+    def _next_id(self) -> int:
+        self._id += 1
+        return self._id
+
+    async def _post(self, url: str, data) -> Any:
+        async with self._get_session().post(url, data=json.dumps(data)) as response:
+            body: bytes = await response.read()
+
+        try:
+            return json.loads(body)
+        except JSONDecodeError:
+            raise HTTPError(body.decode(), response.status)
+
+    async def make_request(self, method: str, params: dict = None) -> Any:
+        rpc_dict = {"jsonrpc": "2.0", "method": method, "id": self._next_id()}
+        if params:
+            rpc_dict["params"] = params
+
+        url = self._debug_url if method.startswith("debug_") else self._rpc_url
+        content: dict = await self._post(url, rpc_dict)
+
+        if "error" in content:
+            raise _to_exception(content)
+        return content.get("result")
+
+    async def make_batch_request(self, requests_: List[RpcRequest]) -> List[Any]:
+        """Coroutine version of BatchHTTPProvider.make_batch_request()
+        """
+        if len(requests_) == 0:
+            return []
+
+        rpc_list = []
+        for i, (method, params) in enumerate(requests_):
+            rpc_dict = {"jsonrpc": "2.0", "method": method, "id": i}
+            if params:
+                rpc_dict["params"] = params
+            rpc_list.append(rpc_dict)
+
+        contents = await self._post(self._rpc_url, rpc_list)
+        if not isinstance(contents, list):
+            raise _to_exception(contents)
+
+        results: List[Any] = _to_batch_results(contents, len(requests_))
+
+        return results
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class AsyncIconService(object):
+    """Subset of IconService APIs which governor uses, as coroutines
+    """
+
+    def __init__(self, provider: AsyncHTTPProvider):
+        self._provider = provider
+
+    @property
+    def provider(self) -> AsyncHTTPProvider:
+        return self._provider
+
+    async def call(self, call: Call) -> Any:
+        return await self._provider.make_request("icx_call", call.to_params())
+
+    async def get_transaction_result(self, tx_hash: str) -> dict:
+        params = {"txHash": tx_hash}
+        result = await self._provider.make_request("icx_getTransactionResult", params)
+        return _to_tx_result(result)
+
+    async def get_last_block(self) -> dict:
+        return await self._provider.make_request("icx_getLastBlock")
+
+    async def get_block_by_height(self, height: int) -> dict:
+        return await self._provider.make_request("icx_getBlockByHeight", {"height": hex(height)})
+
+    async def send_transaction(self, signed_transaction: SignedTransaction) -> str:
+        params = signed_transaction.signed_transaction_dict
+        return await self._provider.make_request("icx_sendTransaction", params)
+
+    async def estimate_step(self, transaction: Transaction) -> int:
+        params = SignedTransaction.convert_tx_to_jsonrpc_request(transaction)
+        del params["stepLimit"]
+
+        result = await self._provider.make_request("debug_estimateStep", params)
+        return int(result, 16)
+
+    async def batch_request(self, requests_: List[RpcRequest]) -> List[Any]:
+        return await self._provider.make_batch_request(requests_)
+
+    async def close(self):
+        await self._provider.close()
+
+
+class AsyncTxHandler(TxHandler):
+    async def _run(self, transaction: Transaction, owner: KeyWallet, estimate: bool):
+        logging.debug("AsyncTxHandler._run() start")
+
+        if estimate:
+            ret = await self._icon_service.estimate_step(transaction)
+        else:
+            if self._step_estimator is not None:
+                transaction.step_limit = await self._step_estimator.get_step_limit(transaction)
+
+            if self._sign_only:
+                ret = self._sign_transaction(owner, transaction)
+            else:
+                ret = await self._send_transaction(owner, transaction)
+
+        logging.debug("AsyncTxHandler._run() end")
+        return ret
+
+    async def _send_transaction(self, owner: KeyWallet, transaction: Transaction):
+        ret = self._call_on_send_request(self._to_request_content(transaction))
+        if ret:
+            ret = await self._icon_service.send_transaction(SignedTransaction(transaction, owner))
+
+        return ret
+
+
+class AsyncGovernanceReader(GovernanceReader):
+    def __init__(self, service: AsyncIconService, nid: int, address: str = EOA_ADDRESS):
+        super().__init__(service, nid, address)
+
+    async def _call(self, method, params=None):
+        call = self._build_call(method, params)
+
+        if self.on_send_request:
+            self.on_send_request(call.to_dict())
+
+        return await self._icon_service.call(call)
+
+    async def check_if_audit_enabled(self):
+        service_config = await self.get_service_config()
+        return _is_audit_enabled(service_config)
+
+    async def get_tx_result(self, tx_hash: str) -> dict:
+        return await self._icon_service.get_transaction_result(tx_hash)
+
+    async def get_block_height(self) -> int:
+        block: dict = await self._icon_service.get_last_block()
+        return _to_block_height(block)
+
+    async def get_block(self, height: int) -> dict:
+        return await self._icon_service.get_block_by_height(height)
+
+    def batch(self) -> 'AsyncGovernanceBatchReader':
+        reader = AsyncGovernanceBatchReader(self._icon_service, self._nid, self._from)
+        reader.set_on_send_request(self.on_send_request)
+
+        return reader
+
+    async def close(self):
+        await self._icon_service.close()
+
+
+class AsyncGovernanceBatchReader(GovernanceBatchReader):
+    async def execute(self, return_exceptions: bool = False) -> list:
+        requests_ = self._requests
+        self._requests = []
+
+        results = await self._icon_service.batch_request(
+            [(method, params) for method, params, _ in requests_]
+        )
+        return self._convert_results(requests_, results, return_exceptions)
+
+
+class AsyncStepEstimator(StepEstimator):
+    """StepEstimator whose estimates are requested through AsyncIconService
+    """
+
+    async def estimate(self, transaction: Transaction) -> int:
+        key: str = self._get_key(transaction, await self._get_revision())
+
+        step: Optional[int] = self._cache.get(key)
+        if step is None:
+            step = await self._icon_service.estimate_step(transaction)
+            self._cache.put(key, step)
+
+        return step
+
+    async def get_step_limit(self, transaction: Transaction) -> int:
+        return self._to_step_limit(await self.estimate(transaction))
+
+    async def _get_revision(self) -> str:
+        # Coroutines run in a single thread
+        if self._revision is None:
+            reader = AsyncGovernanceReader(self._icon_service, self._nid)
+            self._revision = (await reader.get_revision())["code"]
+
+        return self._revision
+
+
+class AsyncGovernanceWriter(GovernanceWriter):
+    def __init__(self, service: AsyncIconService, nid: int, owner):
+        super().__init__(service, nid, owner)
+
+    def _create_tx_handler(self) -> AsyncTxHandler:
+        return AsyncTxHandler(
+            self._icon_service, self._nid, self.on_send_request, self._sign_only, self._step_estimator
+        )
+
+    async def update(self, score_path: str, step_limit: int = 0x80000000, estimate: bool = False) -> str:
+        # Zipping SCORE is done in an executor not to block the event loop
+        loop = asyncio.get_running_loop()
+        content: bytes = await loop.run_in_executor(None, self._load_content, score_path)
+
+        estimate = estimate or self._estimate
+        tx_handler = self._create_tx_handler()
+        return await tx_handler.update(
+            self._owner, GOVERNANCE_ADDRESS, content, step_limit=step_limit, estimate=estimate
+        )
+
+    async def get_tx_result(self, tx_hash: str) -> dict:
+        return await self._icon_service.get_transaction_result(tx_hash)
+
+    async def close(self):
+        await self._icon_service.close()
+
+
+def create_async_icon_service(url: str) -> AsyncIconService:
+    url: str = get_url(url)
+    o = urlparse(url)
+
+    return AsyncIconService(AsyncHTTPProvider(f"{o.scheme}://{o.netloc}", 3))
+
+
+def create_async_reader(url: str, nid: int) -> AsyncGovernanceReader:
+    icon_service = create_async_icon_service(url)
+    return AsyncGovernanceReader(icon_service, nid)
+
+
+def create_async_writer(url: str,
+                        nid: int,
+                        keystore_path: str,
+                        password: str,
+                        auto_step_limit: bool = False) -> AsyncGovernanceWriter:
+    """
+    :param auto_step_limit: set stepLimit of each transaction to its estimated step plus margin
+    """
+    icon_service = create_async_icon_service(url)
+
+    owner_wallet = KeyWallet.load(keystore_path, password)
+    writer = AsyncGovernanceWriter(icon_service, nid, owner_wallet)
+    writer.set_on_send_request(lambda content: True)
+    if auto_step_limit:
+        writer.set_step_estimator(AsyncStepEstimator(icon_service, nid, get_step_estimate_cache()))
+
+    return writer
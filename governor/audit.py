@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Audit queue: deploy transactions waiting for acceptScore or rejectScore
+
+Blocks are scanned only once from the checkpoint saved with the queue,
+and fetched in batch requests by a bounded number of workers.
+
+ex) queue file
+    {
+        "url": "https://ctz.solidwallet.io/api/v3",
+        "nid": 1,
+        "height": 12345,
+        "queue": [{"txHash": "0x...", "blockHeight": 12340, "from": "hx...", "scoreAddress": "cx...", ...}]
+    }
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Dict, List, Optional, Set
+
+from .bulk import BulkReader, in_order
+from .constants import AUDIT_BATCH_SIZE, BULK_WORKERS
+from .governance import GovernanceReader
+from .utils import get_cache_dir, save_json
+
+
+def get_audit_queue_path(url: str, nid: int) -> str:
+    name: str = hashlib.sha256(f"{url}:{nid}".encode()).hexdigest()[:16]
+    return os.path.join(get_cache_dir("audit"), f"{name}.json")
+
+
+class AuditQueue(object):
+    def __init__(self, path: str, url: str, nid: int):
+        """
+        :param path: file where the queue and the checkpoint are kept
+        :param url:
+        :param nid:
+        """
+        self._path = path
+        self._url = url
+        self._nid = nid
+
+        # The last block height scanned. None if no block is scanned yet
+        self.height: Optional[int] = None
+        self.entries: List[dict] = []
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @classmethod
+    def load(cls, path: str, url: str, nid: int) -> 'AuditQueue':
+        queue = cls(path, url, nid)
+
+        if os.path.isfile(path):
+            with open(path, "r") as f:
+                data: dict = json.load(f)
+
+            if data.get("url") != url or data.get("nid") != nid:
+                raise ValueError(f"Audit queue of another network: {path} {data.get('url')} {data.get('nid')}")
+
+            queue.height = data.get("height")
+            queue.entries = data.get("queue", [])
+
+        return queue
+
+    def save(self):
+        save_json(self._path, {"url": self._url, "nid": self._nid, "height": self.height, "queue": self.entries})
+
+    def add(self, entries: List[dict]):
+        tx_hashes = {entry["txHash"] for entry in self.entries}
+        self.entries += [entry for entry in entries if entry["txHash"] not in tx_hashes]
+
+    def remove(self, tx_hashes: List[str]):
+        tx_hashes = set(tx_hashes)
+        self.entries = [entry for entry in self.entries if entry["txHash"] not in tx_hashes]
+
+
+def find_deploy_transactions(block: dict) -> List[dict]:
+    ret = []
+
+    for tx in block.get("confirmed_transaction_list") or []:
+        if tx.get("dataType") != "deploy":
+            continue
+
+        data: dict = tx.get("data") or {}
+        ret.append({
+            "txHash": tx.get("txHash") or tx.get("tx_hash"),
+            "blockHeight": block["height"],
+            "from": tx.get("from"),
+            "to": tx.get("to"),
+            "contentType": data.get("contentType"),
+        })
+
+    return ret
+
+
+class AuditScanner(object):
+    def __init__(self, reader: GovernanceReader, batch_size: int = AUDIT_BATCH_SIZE, workers: int = BULK_WORKERS):
+        self._reader = reader
+        self._batch_size = batch_size
+        self._workers = workers
+
+    def _create_bulk_reader(self, method: str, batch_size: Optional[int] = None) -> BulkReader:
+        return BulkReader(self._reader, method, batch_size or self._batch_size, self._workers)
+
+    def scan(self, queue: AuditQueue, start: int, end: int):
+        """Add deploy transactions in blocks from start to end to the queue
+
+        The checkpoint of the queue advances block by block in order,
+        so it stays at the last block before a failed one
+
+        :exception: the error of the first failed block
+        """
+        logging.debug(f"AuditScanner.scan() start: {start} {end}")
+
+        heights = list(range(start, end + 1))
+        for height, block in in_order(self._create_bulk_reader("get_block").run(heights), heights):
+            if isinstance(block, BaseException):
+                raise block
+
+            queue.add(find_deploy_transactions(block))
+            queue.height = height
+
+        logging.debug("AuditScanner.scan() end")
+
+    def refresh(self, entries: List[dict]) -> List[dict]:
+        """Keep only the entries whose SCORE is still pending
+
+        An entry whose status is not known because of an error is kept
+        """
+        logging.debug(f"AuditScanner.refresh() start: {len(entries)}")
+
+        unknown = [entry["txHash"] for entry in entries if not entry.get("scoreAddress")]
+        results: Dict[str, dict] = dict(self._create_bulk_reader("get_tx_result", 100).run(unknown))
+
+        failed: Set[str] = set()
+        for entry in entries:
+            tx_result = results.get(entry["txHash"])
+            if not isinstance(tx_result, dict):
+                continue
+            if tx_result.get("status") == 0:
+                # A failed deploy has no SCORE to audit
+                failed.add(entry["txHash"])
+            elif tx_result.get("scoreAddress"):
+                entry["scoreAddress"] = tx_result["scoreAddress"]
+        entries = [entry for entry in entries if entry["txHash"] not in failed]
+
+        addresses = list({entry["scoreAddress"] for entry in entries if entry.get("scoreAddress")})
+        statuses: Dict[str, dict] = dict(self._create_bulk_reader("get_score_status", 100).run(addresses))
+
+        ret = []
+        for entry in entries:
+            status = statuses.get(entry.get("scoreAddress"))
+            if not isinstance(status, dict) or _is_pending(status, entry["txHash"]):
+                ret.append(entry)
+
+        logging.debug(f"AuditScanner.refresh() end: {len(ret)}")
+        return ret
+
+
+def _is_pending(status: dict, tx_hash: str) -> bool:
+    next_: dict = status.get("next") or {}
+    return next_.get("status") == "pending" and next_.get("deployTxHash") == tx_hash
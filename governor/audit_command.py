@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+from typing import List
+
+from .audit import AuditQueue, AuditScanner, get_audit_queue_path
+from .constants import AUDIT_SCAN_BLOCKS, COLUMN
+from .governance import create_reader, create_writer_by_args
+from .pipeline import Operation, PipelineResult, TxPipeline
+from .pipeline_command import sign_to_file
+from .utils import get_output, get_url, print_response, print_table, print_title
+
+
+def _load_queue(args) -> AuditQueue:
+    url: str = get_url(args.url)
+    path: str = args.state if args.state else get_audit_queue_path(url, args.nid)
+
+    return AuditQueue.load(path, url, args.nid)
+
+
+def _audit_queue(args) -> int:
+    reader = create_reader(get_url(args.url), args.nid)
+    queue = _load_queue(args)
+    scanner = AuditScanner(reader, args.batch_size, args.workers)
+
+    end: int = reader.get_block_height()
+    if args.from_height is not None:
+        start: int = args.from_height
+    elif queue.height is not None:
+        start: int = queue.height + 1
+    else:
+        start: int = max(end - AUDIT_SCAN_BLOCKS + 1, 0)
+
+    try:
+        scanner.scan(queue, start, end)
+    finally:
+        # Blocks scanned before a failure are not scanned again
+        queue.save()
+
+    queue.entries = scanner.refresh(queue.entries)
+    queue.save()
+
+    if get_output() == "table":
+        print_title("Audit queue", COLUMN)
+        print(f"Scanned: {start} ~ {queue.height}, state: {queue.path}\n")
+    print_table(
+        ["txHash", "blockHeight", "from", "scoreAddress", "contentType"],
+        [
+            [entry["txHash"], entry["blockHeight"], entry["from"], entry.get("scoreAddress"), entry["contentType"]]
+            for entry in queue.entries
+        ]
+    )
+
+    return 0
+
+
+def _audit_batch(args) -> int:
+    if args.estimate:
+        raise ValueError("auditBatch doesn't support --estimate")
+
+    queue = _load_queue(args)
+    tx_hashes: List[str] = [entry["txHash"] for entry in queue.entries] if args.all else args.tx_hashes
+    if len(tx_hashes) == 0:
+        print("No transactions to audit", file=sys.stderr)
+        return 1
+
+    if args.action == "accept":
+        operations = [Operation("acceptScore", {"tx_hash": tx_hash}) for tx_hash in tx_hashes]
+    else:
+        operations = [Operation("rejectScore", {"tx_hash": tx_hash, "reason": args.reason}) for tx_hash in tx_hashes]
+
+    wait_result: bool = not args.no_result
+    pipeline = TxPipeline(
+        create_writer_by_args(args),
+        workers=args.workers,
+        max_in_flight=args.max_in_flight,
+        timeout=args.wait_timeout,
+        wait_result=wait_result,
+    )
+    if args.sign_only:
+        # The queue is left as it is until the transactions are broadcast
+        return sign_to_file(pipeline, operations, args.sign_only)
+
+    results: List[PipelineResult] = pipeline.run(operations)
+
+    print_response({"results": [result.to_dict() for result in results]})
+
+    if wait_result:
+        done = [tx_hash for tx_hash, result in zip(tx_hashes, results) if result.success]
+        queue.remove(done)
+        queue.save()
+        ok = len(done) == len(results)
+    else:
+        ok = all(result.error is None for result in results)
+
+    return 0 if len(results) > 0 and ok else 1
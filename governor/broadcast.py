@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Signed transactions kept in a file, and the broadcaster which sends them
+
+Transactions are signed offline with --sign-only and appended to a file, a transaction per line.
+'governor broadcast' sends them later from a machine connected to the network.
+
+ex) a line of the file
+    {"txHash": "0x...", "params": {"version": "0x3", "from": "hx...", ..., "signature": "..."}}
+"""
+
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha3_256
+from typing import TYPE_CHECKING, List, Optional
+
+from iconsdk.exception import IconServiceBaseException, JSONRPCException
+
+from .constants import MAX_IN_FLIGHT, WAIT_TIMEOUT
+from .waiter import TxResultWaiter
+
+if TYPE_CHECKING:
+    from iconsdk.signed_transaction import SignedTransaction
+    from .provider import BatchIconService
+
+# Error message of icx_sendTransaction for a transaction which the node has already
+DUPLICATE_TRANSACTION = "duplicate transaction"
+
+
+def get_tx_hash(params: dict) -> str:
+    """Calculate the hash of a signed transaction as a node does
+    """
+    from iconsdk.libs.serializer import serialize
+
+    data = {key: value for key, value in params.items() if key != "signature"}
+    return f"0x{sha3_256(serialize(data)).hexdigest()}"
+
+
+def to_record(signed_transaction: 'SignedTransaction') -> dict:
+    params: dict = signed_transaction.signed_transaction_dict
+    return {"txHash": get_tx_hash(params), "params": params}
+
+
+def save_signed_transactions(path: str, signed_transactions: List['SignedTransaction']) -> List[dict]:
+    """Append signed transactions to a file, so that several commands are able to fill the same file
+
+    :return: records written
+    """
+    records = [to_record(signed_transaction) for signed_transaction in signed_transactions]
+
+    with open(path, "a") as f:
+        f.write("".join(f"{json.dumps(record)}\n" for record in records))
+
+    return records
+
+
+def load_signed_transactions(path: str) -> List[dict]:
+    records = []
+
+    with open(path, "r") as f:
+        for i, line in enumerate(f, start=1):
+            if len(line.strip()) == 0:
+                continue
+
+            record = json.loads(line)
+            params = record.get("params") if isinstance(record, dict) else None
+            if not isinstance(params, dict) or "signature" not in params:
+                raise ValueError(f"Invalid signed transaction: {path}:{i}")
+
+            records.append({"txHash": get_tx_hash(params), "params": params})
+
+    return records
+
+
+def get_age(params: dict, now: Optional[float] = None) -> float:
+    """Seconds since a transaction was signed
+    """
+    if now is None:
+        now = time.time()
+
+    return now - int(params["timestamp"], 16) / 1_000_000
+
+
+def find_stale_transactions(records: List[dict], max_age: float) -> List[str]:
+    """Transactions which a node rejects for their timestamps, signed too long ago or ahead of the clock
+
+    :return: tx hashes
+    """
+    now: float = time.time()
+    return [record["txHash"] for record in records if abs(get_age(record["params"], now)) > max_age]
+
+
+class RateLimiter(object):
+    """Spread calls evenly at a given rate
+    """
+
+    def __init__(self, rate: float):
+        """
+        :param rate: the maximum number of calls per second. 0 for no limit
+        """
+        self._interval: float = 1 / rate if rate > 0 else 0
+        self._lock = threading.Lock()
+        self._next: float = 0
+
+    def acquire(self):
+        if self._interval == 0:
+            return
+
+        with self._lock:
+            now: float = time.monotonic()
+            start: float = max(now, self._next)
+            self._next = start + self._interval
+
+        if start > now:
+            time.sleep(start - now)
+
+
+class BroadcastResult(object):
+    def __init__(self, record: dict):
+        self.record = record
+        self.tx_hash: Optional[str] = None
+        self.tx_result: Optional[dict] = None
+        self.error: Optional[BaseException] = None
+
+    @property
+    def success(self) -> bool:
+        return self.tx_result is not None and self.tx_result.get("status") == 1
+
+    def to_dict(self) -> dict:
+        params: dict = self.record["params"]
+        ret = {"txHash": self.tx_hash or self.record["txHash"]}
+
+        data = params.get("data")
+        if isinstance(data, dict) and "method" in data:
+            ret["method"] = data["method"]
+
+        if self.tx_result is not None:
+            ret["status"] = self.tx_result.get("status")
+            ret["blockHeight"] = self.tx_result.get("blockHeight")
+            if "failure" in self.tx_result:
+                ret["failure"] = self.tx_result["failure"]
+        if self.error is not None:
+            ret["error"] = str(self.error)
+
+        return ret
+
+
+def is_duplicate(e: BaseException) -> bool:
+    """Whether a node has rejected a transaction because it has the transaction already
+    """
+    # Only the error which a node answers with. ex) "Duplicate transaction: 0x..."
+    return isinstance(e, JSONRPCException) and DUPLICATE_TRANSACTION in str(e.message).lower()
+
+
+class Broadcaster(object):
+    """Send signed transactions concurrently at a limited rate and collect their results
+
+    A transaction which the node already has is not an error, so a broadcast is able to be run again
+    """
+
+    def __init__(self,
+                 service: 'BatchIconService',
+                 rate: float = 0,
+                 max_in_flight: int = MAX_IN_FLIGHT,
+                 timeout: float = WAIT_TIMEOUT,
+                 wait_result: bool = True):
+        self._icon_service = service
+        self._rate_limiter = RateLimiter(rate)
+        self._max_in_flight = max_in_flight
+        self._waiter = TxResultWaiter(service, timeout=timeout)
+        self._wait_result = wait_result
+
+    def run(self, records: List[dict]) -> List[BroadcastResult]:
+        """
+        :param records: loaded by load_signed_transactions()
+        :return: results in the same order as records
+        """
+        logging.debug(f"Broadcaster.run() start: {len(records)}")
+
+        with ThreadPoolExecutor(max_workers=self._max_in_flight) as executor:
+            ret = list(executor.map(self._send, records))
+
+        logging.debug("Broadcaster.run() end")
+        return ret
+
+    def _send(self, record: dict) -> BroadcastResult:
+        result = BroadcastResult(record)
+
+        try:
+            self._rate_limiter.acquire()
+            try:
+                result.tx_hash = self._icon_service.send_raw_transaction(record["params"])
+            except (Exception, IconServiceBaseException) as e:
+                if not is_duplicate(e):
+                    raise e
+                result.tx_hash = record["txHash"]
+
+            if self._wait_result:
+                result.tx_result = self._waiter.wait(result.tx_hash)
+        except (Exception, IconServiceBaseException) as e:
+            logging.warning(f"Broadcaster._send(): {record['txHash']} {e}")
+            result.error = e
+
+        return result
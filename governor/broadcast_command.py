@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import List
+
+from .broadcast import Broadcaster, BroadcastResult, find_stale_transactions, load_signed_transactions
+from .constants import POOL_SIZE
+from .governance import create_icon_service
+from .utils import print_response
+
+
+def _broadcast(args) -> int:
+    records: List[dict] = load_signed_transactions(args.path)
+
+    others = [record["txHash"] for record in records if record["params"].get("nid") != hex(args.nid)]
+    if len(others) > 0:
+        raise ValueError(f"Signed for another network than nid {args.nid}: {', '.join(others)}")
+
+    # Checked before sending any of them, as a node rejects them with no hint of the reason
+    stale: List[str] = find_stale_transactions(records, args.max_age)
+    if len(stale) > 0:
+        raise ValueError(
+            f"Timestamps differ from now by more than {args.max_age:g} seconds, sign them again: {', '.join(stale)}"
+        )
+
+    wait_result: bool = not args.no_result
+    broadcaster = Broadcaster(
+        create_icon_service(args.url, max(POOL_SIZE, args.max_in_flight)),
+        rate=args.rate,
+        max_in_flight=args.max_in_flight,
+        timeout=args.wait_timeout,
+        wait_result=wait_result,
+    )
+    results: List[BroadcastResult] = broadcaster.run(records)
+
+    print_response({"results": [result.to_dict() for result in results]})
+
+    if wait_result:
+        ok = all(result.success for result in results)
+    else:
+        ok = all(result.error is None for result in results)
+
+    return 0 if len(results) > 0 and ok else 1
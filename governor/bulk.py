@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Bulk reads: isDeployer, isInScoreBlackList, isInImportWhiteList and txresult
+
+Inputs are read from a file or stdin, deduplicated and validated up front,
+then queried in batch requests sent by a bounded number of workers.
+Results are written as NDJSON or CSV lines as soon as each batch arrives,
+or in input order for txresult unless --unordered is given.
+"""
+
+import csv
+import itertools
+import logging
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Iterable, Iterator, List, TextIO, Tuple
+
+from iconsdk.exception import IconServiceBaseException, JSONRPCException
+
+from .constants import BULK_BATCH_SIZE, BULK_WORKERS, WAIT_TIMEOUT
+from .governance import GovernanceReader, create_reader
+from .utils import dumps, get_url
+
+_ADDRESS_PATTERN = re.compile(r"^(hx|cx)[0-9a-f]{40}$")
+_TX_HASH_PATTERN = re.compile(r"^0x[0-9a-f]{64}$")
+
+# JSON-RPC error codes for a transaction whose result is not available yet
+_PENDING_CODES = (
+    JSONRPCException.SYSTEM_TX_PENDING,
+    JSONRPCException.SYSTEM_TX_EXECUTING,
+    JSONRPCException.SYSTEM_TX_NOT_FOUND,
+)
+
+# (input, result or exception)
+CheckResult = Tuple[str, Any]
+
+
+def is_address_valid(address: str) -> bool:
+    return _ADDRESS_PATTERN.match(address) is not None
+
+
+def is_tx_hash_valid(tx_hash: str) -> bool:
+    return _TX_HASH_PATTERN.match(tx_hash) is not None
+
+
+def is_import_stmt_valid(import_stmt: str) -> bool:
+    return len(import_stmt) > 0
+
+
+def read_items(f: TextIO) -> Iterator[str]:
+    """Yield an item per line, skipping blank lines and comments starting with '#'
+    """
+    for line in f:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line
+
+
+def dedupe(items: Iterable[str]) -> List[str]:
+    """Remove duplicates keeping the first occurrence
+    """
+    return list(dict.fromkeys(items))
+
+
+def in_order(results: Iterable[CheckResult], items: List[str]) -> Iterator[CheckResult]:
+    """Reorder results which arrive out of order in the order of items
+
+    A result is yielded as soon as all the results before it have arrived
+    """
+    arrived = {}
+    i = 0
+
+    for item, result in results:
+        arrived[item] = result
+        while i < len(items) and items[i] in arrived:
+            yield items[i], arrived.pop(items[i])
+            i += 1
+
+
+class BulkReader(object):
+    def __init__(self,
+                 reader: GovernanceReader,
+                 method: str,
+                 batch_size: int = BULK_BATCH_SIZE,
+                 workers: int = BULK_WORKERS):
+        """
+        :param reader:
+        :param method: GovernanceReader method name which takes an item ex) is_deployer
+        :param batch_size: the number of items in a batch request
+        :param workers: the maximum number of batch requests in flight
+        """
+        self._reader = reader
+        self._method = method
+        self._batch_size = max(1, batch_size)
+        self._workers = max(1, workers)
+
+    def run(self, items: List[str]) -> Iterator[CheckResult]:
+        """Yield results of batches in the order they arrive
+
+        Items in a batch keep their order, but batches may arrive out of order
+        """
+        logging.debug(f"BulkReader.run() start: {self._method} {len(items)}")
+
+        chunks = [items[i:i + self._batch_size] for i in range(0, len(items), self._batch_size)]
+
+        with ThreadPoolExecutor(max_workers=self._workers) as executor:
+            pending = set()
+            for chunk in chunks:
+                if len(pending) >= self._workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    yield from self._collect(done)
+
+                pending.add(executor.submit(self._read, chunk))
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from self._collect(done)
+
+        logging.debug("BulkReader.run() end")
+
+    @staticmethod
+    def _collect(futures) -> Iterator[CheckResult]:
+        for future in futures:
+            yield from future.result()
+
+    def _read(self, chunk: List[str]) -> List[CheckResult]:
+        return list(zip(chunk, self._request(chunk)))
+
+    def _request(self, chunk: List[str]) -> list:
+        batch = self._reader.batch()
+        for item in chunk:
+            getattr(batch, self._method)(item)
+
+        try:
+            return batch.execute(return_exceptions=True)
+        except (Exception, IconServiceBaseException) as e:
+            # The whole batch failed. ex) connection error
+            logging.warning(f"BulkReader._request(): {e}")
+            return [e] * len(chunk)
+
+
+def is_pending(result: Any) -> bool:
+    """Check if a transaction result is not available yet
+    """
+    if not isinstance(result, JSONRPCException):
+        return False
+
+    if result.rpc_code in _PENDING_CODES:
+        return True
+
+    # loopchain replies "Pending transaction" with -32602
+    return "pending" in str(result.message).lower()
+
+
+class BulkTxResultReader(BulkReader):
+    """Read transaction results, retrying pending ones with backoff until timeout
+    """
+
+    def __init__(self,
+                 reader: GovernanceReader,
+                 batch_size: int = BULK_BATCH_SIZE,
+                 workers: int = BULK_WORKERS,
+                 timeout: float = WAIT_TIMEOUT,
+                 interval: float = 0.2,
+                 max_interval: float = 2.0):
+        super().__init__(reader, "get_tx_result", batch_size, workers)
+        self._timeout = timeout
+        self._interval = interval
+        self._max_interval = max_interval
+
+    def _read(self, chunk: List[str]) -> List[CheckResult]:
+        deadline: float = time.monotonic() + self._timeout
+        interval: float = self._interval
+        results = {}
+
+        while True:
+            retries = []
+            for tx_hash, result in zip(chunk, self._request(chunk)):
+                results[tx_hash] = result
+                if is_pending(result):
+                    retries.append(tx_hash)
+
+            remaining: float = deadline - time.monotonic()
+            if len(retries) == 0 or remaining <= 0:
+                break
+
+            logging.debug(f"BulkTxResultReader._read(): {len(retries)} pending")
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, self._max_interval)
+            chunk = retries
+
+        return list(results.items())
+
+
+def _to_bool(result: str) -> bool:
+    return int(result, 16) == 1
+
+
+def _to_record(item: str, result: Any, convert: Callable[[Any], Any]) -> dict:
+    if isinstance(result, BaseException):
+        return {"input": item, "error": str(result)}
+
+    return {"input": item, "result": convert(result)}
+
+
+class NDJSONWriter(object):
+    def __init__(self, f: TextIO):
+        self._f = f
+
+    def write(self, record: dict):
+        self._f.write(dumps(record) + "\n")
+        self._f.flush()
+
+
+class CSVWriter(object):
+    def __init__(self, f: TextIO):
+        self._f = f
+        self._writer = csv.writer(f)
+        self._writer.writerow(["input", "result", "error"])
+
+    def write(self, record: dict):
+        result = record.get("result", "")
+        if isinstance(result, (dict, list)):
+            result = dumps(result)
+
+        self._writer.writerow([record["input"], result, record.get("error", "")])
+        self._f.flush()
+
+
+def get_writer(output_format: str, f: TextIO):
+    return CSVWriter(f) if output_format == "csv" else NDJSONWriter(f)
+
+
+def _read_input(path: str) -> List[str]:
+    if path == "-":
+        return dedupe(read_items(sys.stdin))
+
+    with open(path, "r") as f:
+        return dedupe(read_items(f))
+
+
+def _run_bulk(args,
+              reader: BulkReader,
+              validator: Callable[[str], bool],
+              convert: Callable[[Any], Any],
+              ordered: bool) -> int:
+    """
+    :return: 0 if every item is valid and read, 1 otherwise
+    """
+    items: List[str] = _read_input(args.input)
+    invalid = {item for item in items if not validator(item)}
+
+    # Invalid items are reported before any request is sent
+    results = itertools.chain(
+        ((item, ValueError("Invalid input")) for item in items if item in invalid),
+        reader.run([item for item in items if item not in invalid])
+    )
+    if ordered:
+        results = in_order(results, items)
+
+    ok = True
+    writer = get_writer(args.format, sys.stdout)
+    for item, result in results:
+        record: dict = _to_record(item, result, convert)
+        ok = ok and "error" not in record
+        writer.write(record)
+
+    return 0 if ok else 1
+
+
+def run_bulk_check(args, method: str, validator: Callable[[str], bool]) -> int:
+    """Handle a membership command with --input
+    """
+    reader = BulkReader(create_reader(get_url(args.url), args.nid), method, args.batch_size, args.workers)
+    return _run_bulk(args, reader, validator, _to_bool, ordered=False)
+
+
+def run_bulk_tx_result(args) -> int:
+    """Handle txresult with --input
+    """
+    reader = BulkTxResultReader(
+        create_reader(get_url(args.url), args.nid), args.batch_size, args.workers, args.wait_timeout
+    )
+    return _run_bulk(args, reader, is_tx_hash_valid, lambda result: result, ordered=not args.unordered)
@@ -0,0 +1,576 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Declarative table of subcommands
+
+Only the subparser of the command to run is fully built,
+and the module implementing a command is imported only when the command is chosen.
+"""
+
+import argparse
+import importlib
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from .constants import (
+    AGENT_TTL, AUDIT_BATCH_SIZE, BULK_BATCH_SIZE, BULK_WORKERS, MAX_IN_FLIGHT, TX_TIMESTAMP_THRESHOLD, WAIT_TIMEOUT,
+    WATCH_INTERVAL
+)
+
+
+class Argument(object):
+    """Arguments of ArgumentParser.add_argument()
+    """
+
+    def __init__(self, *names: str, **kwargs):
+        self.names = names
+        self.kwargs = kwargs
+
+
+class Command(object):
+    def __init__(self,
+                 name: str,
+                 handler: str,
+                 help: Optional[str] = None,
+                 parents: Tuple[str, ...] = ("common",),
+                 arguments: Sequence[Argument] = (),
+                 query: Optional[Tuple[str, ...]] = None):
+        """
+        :param name: subcommand name
+        :param handler: "<module>:<function>" in governor package
+        :param help: help message. "<name> command" if None
+        :param parents: names of parent parsers. "common" or "invoke"
+        :param arguments:
+        :param query: GovernanceReader method name followed by the names of arguments to pass to it
+            Only a command with query can be run against several networks at once
+        """
+        self.name = name
+        self.handler = handler
+        self.help = help if help else f"{name} command"
+        self.parents = parents
+        self.arguments = arguments
+        self.query = query
+
+    def load_handler(self) -> Callable:
+        module_name, func_name = self.handler.split(":")
+        module = importlib.import_module(f".{module_name}", __package__)
+
+        return getattr(module, func_name)
+
+    def add_parser(self, sub_parser, parent_parsers: Dict[str, argparse.ArgumentParser]):
+        parents = [parent_parsers[name] for name in self.parents]
+        parser = sub_parser.add_parser(self.name, parents=parents, help=self.help)
+
+        for argument in self.arguments:
+            parser.add_argument(*argument.names, **argument.kwargs)
+
+        parser.set_defaults(func=self.load_handler(), command=self.name)
+        return parser
+
+    def add_stub_parser(self, sub_parser):
+        """Add a parser only to list the command in help
+        """
+        return sub_parser.add_parser(self.name, help=self.help)
+
+
+def _address() -> Argument:
+    return Argument("address", type=str, nargs="?", help="")
+
+
+def _import_stmt() -> Argument:
+    return Argument("import_stmt", type=str, nargs="?", help="")
+
+
+def _tx_hash() -> Argument:
+    return Argument(
+        "tx_hash",
+        type=str,
+        nargs="?",
+        help="txHash ex) 0xe2a8e2483736ba8793bebebc30673aa4fb7662763bcdc7b0d4d8a163a79c9e20"
+    )
+
+
+def _bulk() -> Tuple[Argument, ...]:
+    return (
+        Argument(
+            "--input", "-i",
+            type=str,
+            required=False,
+            help="file with an item per line to read in bulk. '-' for stdin"
+        ),
+        Argument("--format", choices=("ndjson", "csv"), default="ndjson", help="bulk output format"),
+        Argument(
+            "--batch-size",
+            type=int,
+            default=BULK_BATCH_SIZE,
+            help=f"the number of items in a batch request [default: {BULK_BATCH_SIZE}]"
+        ),
+        Argument(
+            "--workers",
+            type=int,
+            default=BULK_WORKERS,
+            help=f"the maximum number of batch requests in flight [default: {BULK_WORKERS}]"
+        ),
+    )
+
+
+INVOKE = ("common", "invoke")
+
+COMMANDS: Tuple[Command, ...] = (
+    # score_command
+    Command(
+        "update", "score_command:_update_governance_score",
+        help="Install or update governance SCORE",
+        parents=INVOKE,
+        arguments=(
+            Argument(
+                "score_path",
+                type=str,
+                nargs="?",
+                help="path where governance SCORE is located\nex) ./governance"
+            ),
+            Argument(
+                "--step-limit",
+                default=0x80000000,
+                type=int,
+                required=False,
+                help="Set stepLimit. [default: 2_147_483_648]"
+            ),
+        )
+    ),
+    Command("acceptScore", "score_command:_accept_score", parents=INVOKE, arguments=(_tx_hash(),)),
+    Command(
+        "rejectScore", "score_command:_reject_score",
+        parents=INVOKE,
+        arguments=(
+            _tx_hash(),
+            Argument("reason", type=str, nargs="?", help="reason ex) 'SCORE cannot use file API'"),
+        )
+    ),
+    Command("addAuditor", "score_command:_add_auditor", parents=INVOKE, arguments=(_address(),)),
+    Command("removeAuditor", "score_command:_remove_auditor", parents=INVOKE, arguments=(_address(),)),
+    Command("addDeployer", "score_command:_add_deployer", parents=INVOKE, arguments=(_address(),)),
+    Command("removeDeployer", "score_command:_remove_deployer", parents=INVOKE, arguments=(_address(),)),
+    Command(
+        "addToScoreBlackList", "score_command:_add_to_score_black_list",
+        parents=INVOKE,
+        arguments=(_address(),)
+    ),
+    Command(
+        "removeFromScoreBlackList", "score_command:_remove_from_score_black_list",
+        parents=INVOKE,
+        arguments=(_address(),)
+    ),
+    Command(
+        "addImportWhiteList", "score_command:_add_import_white_list",
+        parents=INVOKE,
+        arguments=(_import_stmt(),)
+    ),
+    Command(
+        "removeImportWhiteList", "score_command:_remove_import_white_list",
+        parents=INVOKE,
+        arguments=(_import_stmt(),)
+    ),
+    Command(
+        "getScoreStatus", "score_command:_get_score_status",
+        query=("get_score_status", "address"),
+        arguments=(
+            Argument(
+                "address",
+                type=str,
+                nargs="?",
+                help="SCORE address ex) cx8a96c0dcf0567635309809d391908c32fbca5317"
+            ),
+        )
+    ),
+    Command("getServiceConfig", "score_command:_get_service_config", query=("get_service_config",)),
+    Command(
+        "updateServiceConfig", "score_command:_update_service_config",
+        parents=INVOKE,
+        arguments=(Argument("service_flag", type=int, nargs="?", help=""),)
+    ),
+    Command(
+        "isDeployer", "score_command:_is_deployer",
+        query=("is_deployer", "address"),
+        arguments=(_address(),) + _bulk()
+    ),
+    Command(
+        "isInScoreBlackList", "score_command:_is_in_score_black_list",
+        query=("is_in_score_black_list", "address"),
+        arguments=(_address(),) + _bulk()
+    ),
+    Command(
+        "isInImportWhiteList", "score_command:_is_in_import_white_list",
+        query=("is_in_import_white_list", "import_stmt"),
+        arguments=(_import_stmt(),) + _bulk()
+    ),
+
+    # step_command
+    Command(
+        "setStepCost", "step_command:_set_step_cost",
+        parents=INVOKE,
+        arguments=(
+            Argument(
+                "step_type",
+                type=str,
+                nargs="?",
+                help="step_type ex) default, apiCall, contractSet, input, eventlog"
+            ),
+            Argument("cost", type=int, nargs="?", default=-1, help="cost ex) 1000"),
+        )
+    ),
+    Command(
+        "setStepPrice", "step_command:_set_step_price",
+        parents=INVOKE,
+        arguments=(Argument("step_price", type=int, nargs="?", help=""),)
+    ),
+    Command(
+        "setMaxStepLimit", "step_command:_set_max_step_limit",
+        parents=INVOKE,
+        arguments=(
+            Argument("context_type", type=str, nargs="?", help=""),
+            Argument("value", type=int, nargs="?", default=-1, help=""),
+        )
+    ),
+    Command("getStepCosts", "step_command:_get_step_costs", query=("get_step_costs",)),
+    Command("getStepPrice", "step_command:_get_step_price", query=("get_step_price",)),
+    Command(
+        "getMaxStepLimit", "step_command:_get_max_step_limit",
+        query=("get_max_step_limit", "context_type"),
+        arguments=(Argument("context_type", type=str, nargs="?", help=""),)
+    ),
+
+    # revision_command
+    Command(
+        "setRevision", "revision_command:_set_revision",
+        parents=INVOKE,
+        arguments=(
+            Argument("revision", type=int, nargs="?", default=-1, help="revision ex) 3"),
+            Argument("name", type=str, nargs="?", default="", help="iconservice version ex) 1.2.3"),
+        )
+    ),
+    Command("getRevision", "revision_command:_get_revision", query=("get_revision",)),
+    Command("getVersion", "revision_command:_get_version", query=("get_version",)),
+
+    # txresult_command
+    Command(
+        "txresult", "txresult_command:_get_tx_result",
+        help="getTransactionResult command",
+        query=("get_tx_result", "tx_hash"),
+        arguments=(_tx_hash(),) + _bulk() + (
+            Argument(
+                "--wait-timeout",
+                type=float,
+                default=WAIT_TIMEOUT,
+                help=f"seconds to retry pending transactions in bulk [default: {WAIT_TIMEOUT}]"
+            ),
+            Argument(
+                "--unordered",
+                action="store_true",
+                help="write bulk results as they arrive instead of in input order"
+            ),
+        )
+    ),
+
+    # snapshot_command
+    Command(
+        "snapshot", "snapshot_command:_take_snapshot",
+        help="Read the whole governance state at once and save it to a json file",
+        arguments=(
+            Argument("path", type=str, nargs="?", help="json file to save the snapshot ex) mainnet.json"),
+        )
+    ),
+    Command(
+        "diff", "snapshot_command:_diff_snapshots",
+        help="Compare the governance state of two snapshot files or nodes",
+        arguments=(
+            Argument("source_a", type=str, help="snapshot file or node url ex) mainnet.json, testnet"),
+            Argument("source_b", type=str, help="snapshot file or node url ex) mainnet"),
+        )
+    ),
+
+    # pipeline_command
+    Command(
+        "pipeline", "pipeline_command:_run_pipeline",
+        help="Sign and send multiple governance transactions in parallel",
+        parents=INVOKE,
+        arguments=(
+            Argument(
+                "path",
+                type=str,
+                help=(
+                    "json file containing operations\n"
+                    'ex) [{"command": "addDeployer", "params": {"address": "hx..."}}]'
+                )
+            ),
+            Argument(
+                "--workers",
+                type=int,
+                default=0,
+                required=False,
+                help="the number of threads to sign transactions default) the number of CPUs"
+            ),
+            Argument(
+                "--max-in-flight",
+                type=int,
+                default=MAX_IN_FLIGHT,
+                required=False,
+                help=f"the maximum number of transactions waiting for results default) {MAX_IN_FLIGHT}"
+            ),
+        )
+    ),
+
+    # agent_command
+    Command(
+        "agent", "agent_command:_run_agent",
+        help="Signing agent which keeps decrypted keys in memory for later commands",
+        parents=(),
+        arguments=(
+            Argument(
+                "action",
+                type=str,
+                choices=("start", "add", "status", "stop"),
+                help="start: start agent, add: add a key to agent, status: show keys, stop: stop agent"
+            ),
+            Argument("--keystore", "-k", type=str, required=False, help="keystore file path"),
+            Argument("--password", "-p", type=str, required=False, default=None, help="keystore password"),
+            Argument(
+                "--ttl",
+                type=int,
+                required=False,
+                default=AGENT_TTL,
+                help=f"seconds to keep a decrypted key default) {AGENT_TTL}"
+            ),
+            Argument("--foreground", action="store_true", required=False, help="Do not run agent in background"),
+        )
+    ),
+
+    # broadcast_command
+    Command(
+        "broadcast", "broadcast_command:_broadcast",
+        help="Send transactions signed with --sign-only and collect their results",
+        arguments=(
+            Argument("path", type=str, help="file written by --sign-only"),
+            Argument(
+                "--rate",
+                type=float,
+                default=0,
+                required=False,
+                help="the maximum number of transactions sent per second. 0 for no limit default) 0"
+            ),
+            Argument(
+                "--max-in-flight",
+                type=int,
+                default=MAX_IN_FLIGHT,
+                required=False,
+                help=f"the maximum number of transactions waiting for results default) {MAX_IN_FLIGHT}"
+            ),
+            Argument(
+                "--wait-timeout",
+                type=float,
+                default=WAIT_TIMEOUT,
+                required=False,
+                help=f"seconds to wait for each transaction result default) {WAIT_TIMEOUT}"
+            ),
+            Argument(
+                "--max-age",
+                type=float,
+                default=TX_TIMESTAMP_THRESHOLD,
+                required=False,
+                help=(
+                    "seconds since signing after which the node rejects a transaction for its timestamp "
+                    f"default) {TX_TIMESTAMP_THRESHOLD}"
+                )
+            ),
+            Argument(
+                "--no-result",
+                action="store_true",
+                required=False,
+                help="Don't wait for transaction results"
+            ),
+        )
+    ),
+
+    # apply_command
+    Command(
+        "apply", "apply_command:_apply",
+        help="Run the governance transactions in a plan, in parallel where their dependencies allow",
+        parents=INVOKE,
+        arguments=(
+            Argument(
+                "path",
+                type=str,
+                help=(
+                    "yaml or json file containing steps\n"
+                    'ex) {"steps": [{"id": "a", "command": "addDeployer", "params": {"address": "hx..."}, '
+                    '"depends_on": []}]}'
+                )
+            ),
+            Argument(
+                "--journal",
+                type=str,
+                required=False,
+                help="file keeping submitted transactions to resume from default) <path>.journal.json"
+            ),
+            Argument(
+                "--max-in-flight",
+                type=int,
+                default=MAX_IN_FLIGHT,
+                required=False,
+                help=f"the maximum number of transactions waiting for results default) {MAX_IN_FLIGHT}"
+            ),
+            Argument(
+                "--dry-run",
+                action="store_true",
+                required=False,
+                help="print the steps in order with their dependencies instead of running them"
+            ),
+        )
+    ),
+
+    # sync_command
+    Command(
+        "sync", "sync_command:_sync",
+        help="Send only the transactions which make the governance state the same as a desired one",
+        parents=INVOKE,
+        arguments=(
+            Argument(
+                "path",
+                type=str,
+                help=(
+                    "json file containing the desired state\n"
+                    'ex) {"deployers": ["hx..."], "stepPrice": 12500000000, "stepCosts": {"apiCall": 10000}}'
+                )
+            ),
+            Argument(
+                "--dry-run",
+                action="store_true",
+                required=False,
+                help="print the operations to send instead of sending them"
+            ),
+            Argument(
+                "--batch-size",
+                type=int,
+                default=BULK_BATCH_SIZE,
+                help=f"the number of queries in a batch request [default: {BULK_BATCH_SIZE}]"
+            ),
+            Argument(
+                "--workers",
+                type=int,
+                default=BULK_WORKERS,
+                help=f"the maximum number of batch requests in flight [default: {BULK_WORKERS}]"
+            ),
+            Argument(
+                "--max-in-flight",
+                type=int,
+                default=MAX_IN_FLIGHT,
+                required=False,
+                help=f"the maximum number of transactions waiting for results default) {MAX_IN_FLIGHT}"
+            ),
+        )
+    ),
+
+    # audit_command
+    Command(
+        "auditQueue", "audit_command:_audit_queue",
+        help="Scan new blocks for deploy transactions waiting for audit and show them",
+        arguments=(
+            Argument("--state", type=str, required=False, help="file keeping the queue and the last scanned block"),
+            Argument(
+                "--from-height",
+                type=int,
+                required=False,
+                help="block height to scan from instead of the checkpoint"
+            ),
+            Argument(
+                "--batch-size",
+                type=int,
+                default=AUDIT_BATCH_SIZE,
+                help=f"the number of blocks in a batch request [default: {AUDIT_BATCH_SIZE}]"
+            ),
+            Argument(
+                "--workers",
+                type=int,
+                default=BULK_WORKERS,
+                help=f"the maximum number of batch requests in flight [default: {BULK_WORKERS}]"
+            ),
+        )
+    ),
+    Command(
+        "auditBatch", "audit_command:_audit_batch",
+        help="Accept or reject deploy transactions in the audit queue at once",
+        parents=INVOKE,
+        arguments=(
+            Argument("action", choices=("accept", "reject")),
+            Argument("tx_hashes", type=str, nargs="*", help="txHashes of deploy transactions"),
+            Argument("--all", action="store_true", required=False, help="every entry in the audit queue"),
+            Argument("--reason", type=str, default="", required=False, help="reason for rejectScore"),
+            Argument("--state", type=str, required=False, help="file keeping the queue and the last scanned block"),
+            Argument(
+                "--workers",
+                type=int,
+                default=0,
+                required=False,
+                help="the number of threads to sign transactions default) the number of CPUs"
+            ),
+            Argument(
+                "--max-in-flight",
+                type=int,
+                default=MAX_IN_FLIGHT,
+                required=False,
+                help=f"the maximum number of transactions waiting for results default) {MAX_IN_FLIGHT}"
+            ),
+        )
+    ),
+
+    # watch_command
+    Command(
+        "watch", "watch_command:_watch",
+        help="Watch the governance state and write its changes as NDJSON",
+        arguments=(
+            Argument(
+                "--interval",
+                type=float,
+                default=WATCH_INTERVAL,
+                help=f"seconds between polls of the last block height [default: {WATCH_INTERVAL}]"
+            ),
+            Argument("--metrics-port", type=int, required=False, help="port to serve Prometheus metrics on"),
+            Argument("--metrics-host", type=str, default="127.0.0.1", help="address to serve metrics on"),
+        )
+    ),
+
+    # shell_command
+    Command(
+        "shell", "shell_command:_run_shell",
+        help="Interactive shell which keeps the node connection and the unlocked wallet",
+        arguments=(
+            Argument(
+                "--keystore", "-k",
+                type=str,
+                required=False,
+                default=None,
+                help="default keystore file path for invoke commands"
+            ),
+        )
+    ),
+)
+
+
+def find_command(name: str) -> Optional[Command]:
+    for command in COMMANDS:
+        if command.name == name:
+            return command
+
+    return None
@@ -24,9 +24,77 @@ DEFAULT_NID = 3
 
 COLUMN = 80
 
+# Seconds to wait for a connection to a node and for its response
+CONNECT_TIMEOUT = 3
+READ_TIMEOUT = 10
+
+# Default seconds to wait for a transaction result
+WAIT_TIMEOUT = 30
+
+# The maximum number of transactions sent but not finished yet
+MAX_IN_FLIGHT = 16
+
+# The maximum number of keep-alive connections per node.
+# Not less than MAX_IN_FLIGHT, or connections of requests in flight are discarded instead of being reused
+POOL_SIZE = MAX_IN_FLIGHT
+
 PREDEFINED_URLS = {
     "mainnet": "https://ctz.solidwallet.io/api/v3",
     "testnet": "https://test-ctz.solidwallet.io/api/v3",
     "bicon": "https://bicon.net.solidwallet.io/api/v3",
     "localhost": DEFAULT_URL
 }
+
+# Default seconds for the signing agent to keep a decrypted key
+AGENT_TTL = 3600
+
+# Environment variable to specify the directory where governor keeps its caches
+CACHE_DIR_ENV = "GOVERNOR_CACHE_DIR"
+
+# The maximum number of zipped SCORE packages kept in the deploy content cache
+DEPLOY_CACHE_SIZE = 8
+
+# The maximum bytes of a SCORE package kept in memory while zipping. The rest is spooled to disk
+PACKAGE_SPOOL_SIZE = 4 * 1024 * 1024
+
+# Ratio of an estimated step added to the step limit set automatically
+STEP_MARGIN = 0.1
+
+# The maximum number of step estimates kept in the cache
+STEP_ESTIMATE_CACHE_SIZE = 1024
+
+# The number of items checked in a single batch request by bulk membership commands
+BULK_BATCH_SIZE = 100
+
+# The maximum number of batch requests in flight for bulk membership commands
+BULK_WORKERS = 4
+
+# Backends of the read cache selected by --read-cache
+READ_CACHE_BACKENDS = ("memory", "disk")
+
+# The maximum number of query responses kept in the in-memory read cache
+READ_CACHE_SIZE = 1024
+
+# Seconds to reuse the last block height before asking the node again
+BLOCK_HEIGHT_INTERVAL = 1.0
+
+# Seconds between polls of the last block height in watch command
+WATCH_INTERVAL = 2.0
+
+# The number of latest blocks scanned by auditQueue when it has no checkpoint
+AUDIT_SCAN_BLOCKS = 1000
+
+# The number of blocks fetched in a single batch request by auditQueue
+AUDIT_BATCH_SIZE = 20
+
+# Output formats of command results. The first one is the default
+OUTPUT_FORMATS = ("table", "json", "ndjson", "quiet")
+
+# The number of consecutive failures of a node which makes requests skip it
+NODE_FAILURE_THRESHOLD = 2
+
+# Seconds for which a failing node is skipped before it is tried again
+NODE_COOLDOWN = 30.0
+
+# Seconds by which the timestamp of a transaction may differ from the clock of a node
+TX_TIMESTAMP_THRESHOLD = 300
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Content-addressed cache for zipped SCORE packages
+
+A package is keyed by the digest of its file tree: (path, size, mtime, content hash) of every file
+which is put into the zip.
+So estimating step and updating SCORE afterwards zip the package only once.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from .constants import DEPLOY_CACHE_SIZE
+from .package import build_package, walk_package_files
+from .timings import span
+from .utils import get_cache_dir, save_file
+
+
+class DeployContentCache(object):
+    def __init__(self, directory: Optional[str] = None, size: int = DEPLOY_CACHE_SIZE):
+        """
+        :param directory: where zipped packages are stored. Kept only in memory if None
+        :param size: the maximum number of packages to keep
+        """
+        self._directory = directory
+        self._size = size
+        self._lock = threading.Lock()
+
+        # tree digest -> zipped package
+        self._contents: OrderedDict = OrderedDict()
+        # file path -> (size, mtime_ns, content digest)
+        self._file_digests: Dict[str, Tuple[int, int, str]] = {}
+
+    @property
+    def directory(self) -> Optional[str]:
+        return self._directory
+
+    def load(self, score_path: str) -> bytes:
+        """Return the zipped package of score_path, zipping it only if it is not cached
+
+        :param score_path: SCORE directory
+        :return: zipped package which is the same as gen_deploy_data_content(score_path)
+        """
+        logging.debug(f"DeployContentCache.load() start: {score_path}")
+
+        with span("package.digest"):
+            digest: str = self.get_tree_digest(score_path)
+        content: Optional[bytes] = self._get(digest)
+
+        if content is None:
+            with span("package.zip"), build_package(score_path) as package:
+                logging.info(f"SCORE package built: path={score_path} size={package.size} digest={package.digest}")
+                content = package.read()
+
+            # Files changed during zipping are not cached
+            if digest == self.get_tree_digest(score_path):
+                self._put(digest, content)
+
+        logging.debug(f"DeployContentCache.load() end: {digest}")
+        return content
+
+    def get_tree_digest(self, score_path: str) -> str:
+        h = hashlib.sha256()
+        # Paths in the zip depend on score_path as it is given
+        h.update(score_path.encode())
+
+        for path in sorted(walk_package_files(score_path)):
+            size, mtime_ns, file_digest = self._get_file_digest(path)
+            h.update(f"\0{path}\0{size}\0{mtime_ns}\0{file_digest}".encode())
+
+        return h.hexdigest()
+
+    def _get_file_digest(self, path: str) -> Tuple[int, int, str]:
+        stat = os.stat(path)
+
+        with self._lock:
+            item = self._file_digests.get(path)
+        if item is not None and item[:2] == (stat.st_size, stat.st_mtime_ns):
+            return item
+
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(65536), b""):
+                h.update(chunk)
+
+        item = (stat.st_size, stat.st_mtime_ns, h.hexdigest())
+        with self._lock:
+            self._file_digests[path] = item
+
+        return item
+
+    def _get(self, digest: str) -> Optional[bytes]:
+        with self._lock:
+            content: Optional[bytes] = self._contents.get(digest)
+            if content is not None:
+                self._contents.move_to_end(digest)
+                return content
+
+        content = self._read_file(digest)
+        if content is not None:
+            self._put_in_memory(digest, content)
+
+        return content
+
+    def _put(self, digest: str, content: bytes):
+        self._put_in_memory(digest, content)
+        self._write_file(digest, content)
+
+    def _put_in_memory(self, digest: str, content: bytes):
+        with self._lock:
+            self._contents[digest] = content
+            self._contents.move_to_end(digest)
+
+            while len(self._contents) > self._size:
+                self._contents.popitem(last=False)
+
+    def _get_file_path(self, digest: str) -> str:
+        return os.path.join(self._directory, f"{digest}.zip")
+
+    def _read_file(self, digest: str) -> Optional[bytes]:
+        if self._directory is None:
+            return None
+
+        path: str = self._get_file_path(digest)
+        try:
+            with open(path, "rb") as f:
+                content: bytes = f.read()
+            # Mark as recently used so that it survives pruning
+            os.utime(path)
+        except OSError:
+            return None
+
+        return content
+
+    def _write_file(self, digest: str, content: bytes):
+        if self._directory is None:
+            return
+
+        try:
+            save_file(self._get_file_path(digest), content)
+            self._prune()
+        except OSError as e:
+            logging.warning(f"Failed to write deploy content cache: {e}")
+
+    def _prune(self):
+        paths: List[str] = [
+            os.path.join(self._directory, name)
+            for name in os.listdir(self._directory) if name.endswith(".zip")
+        ]
+        paths.sort(key=os.path.getmtime, reverse=True)
+
+        for path in paths[self._size:]:
+            os.unlink(path)
+
+
+_cache: Optional[DeployContentCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_deploy_content_cache() -> DeployContentCache:
+    """Return the process-wide cache stored under the governor cache directory
+    """
+    global _cache
+
+    with _cache_lock:
+        if _cache is None:
+            _cache = DeployContentCache(get_cache_dir("deploy"))
+
+        return _cache
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Several nodes of the same network behind a single provider
+
+Each request goes to the healthy node with the lowest recent latency and is retried on the next one
+when a node can't be reached or doesn't answer in time.
+A node which fails repeatedly is skipped for a cooldown (circuit breaker) and then tried again.
+The health of nodes is kept in the cache directory, so that the next command starts from it.
+
+A signed transaction is resent as it is, never signed again, so its hash is the same on every node.
+A node which has the transaction already rejects it as a duplicate, which is taken as success.
+
+ex) governor getRevision --url https://node1/api/v3,https://node2/api/v3
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from iconsdk.exception import HTTPError, JSONRPCException
+from requests.exceptions import ReadTimeout, RequestException
+
+from .constants import NODE_COOLDOWN, NODE_FAILURE_THRESHOLD
+from .provider import BatchHTTPProvider, RpcRequest
+from .utils import get_cache_dir, save_json
+
+# Weight of the latest latency in the moving average
+LATENCY_WEIGHT = 0.3
+
+# Errors meaning that a node is unavailable, not that a request is invalid
+NODE_ERRORS = (RequestException, HTTPError)
+
+
+class NodeHealth(object):
+    def __init__(self, url: str):
+        self.url = url
+        # Moving average of latency in seconds. None if it is not measured yet
+        self.latency: Optional[float] = None
+        self.failures = 0
+        # time.time() until which the node is skipped
+        self.open_until: float = 0
+
+    def is_open(self, now: float) -> bool:
+        return now < self.open_until
+
+    def on_success(self, latency: Optional[float]):
+        if latency is not None:
+            self.latency = latency if self.latency is None else self.latency + LATENCY_WEIGHT * (latency - self.latency)
+
+        self.failures = 0
+        self.open_until = 0
+
+    def on_failure(self, threshold: int, cooldown: float):
+        self.failures += 1
+        if self.failures >= threshold:
+            self.open_until = time.time() + cooldown
+
+    def to_dict(self) -> dict:
+        return {"latency": self.latency, "failures": self.failures, "openUntil": self.open_until}
+
+    def update(self, data: dict):
+        self.latency = data.get("latency")
+        self.failures = data.get("failures", 0)
+        self.open_until = data.get("openUntil", 0)
+
+
+def get_health_path(urls: List[str]) -> str:
+    name: str = hashlib.sha256(",".join(urls).encode()).hexdigest()[:16]
+    return os.path.join(get_cache_dir("nodes"), f"{name}.json")
+
+
+class FailoverProvider(object):
+    """Provider which routes requests among BatchHTTPProviders of the same network
+    """
+
+    def __init__(self,
+                 providers: List[BatchHTTPProvider],
+                 failure_threshold: int = NODE_FAILURE_THRESHOLD,
+                 cooldown: float = NODE_COOLDOWN,
+                 health_path: Optional[str] = None):
+        """
+        :param providers: providers of the nodes in the order of preference
+        :param failure_threshold: the number of consecutive failures which opens the circuit of a node
+        :param cooldown: seconds for which a node with an open circuit is skipped
+        :param health_path: file to keep the health of nodes in. Not kept if None
+        """
+        if len(providers) == 0:
+            raise ValueError("No nodes")
+
+        self._providers = providers
+        self._failure_threshold = failure_threshold
+        self._cooldown = cooldown
+        self._health_path = health_path
+
+        self._lock = threading.Lock()
+        self._health: List[NodeHealth] = [NodeHealth(provider.rpc_url) for provider in providers]
+        self._load_health()
+
+    @property
+    def rpc_url(self) -> str:
+        return ",".join(provider.rpc_url for provider in self._providers)
+
+    @property
+    def health(self) -> List[NodeHealth]:
+        return self._health
+
+    def make_request(self, method: str, params=None, full_response: bool = False) -> Any:
+        # Long polling takes as long as a block takes, which says nothing about the node
+        long_polling: bool = method == "icx_waitTransactionResult"
+
+        on_retry_error = None
+        if method == "icx_sendTransaction":
+            on_retry_error = functools.partial(self._on_resend_error, params)
+
+        return self._request("make_request", method, params, full_response,
+                             long_polling=long_polling, on_retry_error=on_retry_error)
+
+    def make_batch_request(self, requests_: List[RpcRequest]) -> List[Any]:
+        return self._request("make_batch_request", requests_)
+
+    @staticmethod
+    def _on_resend_error(params: dict, e: BaseException) -> str:
+        """A node which has rejected a resent transaction as a duplicate has it from the previous attempt
+        """
+        from .broadcast import get_tx_hash, is_duplicate
+
+        if is_duplicate(e):
+            return get_tx_hash(params)
+
+        raise e
+
+    def _get_order(self) -> List[int]:
+        """Healthy nodes by latency, unmeasured ones first, then nodes with open circuits by their cooldown
+        """
+        now: float = time.time()
+        with self._lock:
+            closed = [i for i, health in enumerate(self._health) if not health.is_open(now)]
+            opened = [i for i, health in enumerate(self._health) if health.is_open(now)]
+
+            closed.sort(key=lambda i: self._health[i].latency or 0)
+            opened.sort(key=lambda i: self._health[i].open_until)
+
+        return closed + opened
+
+    def _request(self,
+                 name: str,
+                 *args,
+                 long_polling: bool = False,
+                 on_retry_error: Optional[Callable[[BaseException], Any]] = None) -> Any:
+        """Call a method of the providers in order until a node answers
+
+        :param name: method name of BatchHTTPProvider
+        :param long_polling: whether the node holds the request until something happens.
+            Its latency is not measured and a read timeout is raised as it is instead of failing over
+        :param on_retry_error: called with the error which a node answers after another node has failed
+        """
+        error: Optional[BaseException] = None
+
+        for i in self._get_order():
+            start: float = time.perf_counter()
+            try:
+                ret = getattr(self._providers[i], name)(*args)
+            except NODE_ERRORS as e:
+                if long_polling and isinstance(e, ReadTimeout):
+                    # Nothing has happened until the read timeout, which is not a failure of the node
+                    raise e
+                logging.warning(f"FailoverProvider._request(): {self._health[i].url} {e}")
+                self._on_failure(i)
+                error = e
+                continue
+            except JSONRPCException as e:
+                # The node is alive. The request itself has failed
+                self._on_success(i, None if long_polling else time.perf_counter() - start)
+                if error is not None and on_retry_error is not None:
+                    return on_retry_error(e)
+                raise e
+
+            self._on_success(i, None if long_polling else time.perf_counter() - start)
+            return ret
+
+        raise error
+
+    def _on_success(self, i: int, latency: Optional[float]):
+        with self._lock:
+            health = self._health[i]
+            changed: bool = health.failures > 0 or (health.latency is None and latency is not None)
+            health.on_success(latency)
+
+        if changed:
+            self._save_health()
+
+    def _on_failure(self, i: int):
+        with self._lock:
+            self._health[i].on_failure(self._failure_threshold, self._cooldown)
+
+        self._save_health()
+
+    def _load_health(self):
+        if self._health_path is None or not os.path.isfile(self._health_path):
+            return
+
+        try:
+            with open(self._health_path, "r") as f:
+                data: Dict[str, dict] = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"FailoverProvider._load_health(): {e}")
+            return
+
+        for health in self._health:
+            if isinstance(data.get(health.url), dict):
+                health.update(data[health.url])
+
+    def _save_health(self):
+        if self._health_path is None:
+            return
+
+        with self._lock:
+            data = {health.url: health.to_dict() for health in self._health}
+            try:
+                save_json(self._health_path, data)
+            except OSError as e:
+                logging.warning(f"FailoverProvider._save_health(): {e}")
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Run a read command against several networks at once
+
+ex) governor getRevision --url all
+    governor getStepCosts --urls mainnet,testnet
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+from iconsdk.exception import IconServiceBaseException
+
+from .commands import find_command
+from .constants import PREDEFINED_URLS, COLUMN
+from .governance import create_reader
+from .utils import get_url, get_output, flatten_dict, print_title, print_table
+
+# --url value to target every predefined network
+ALL_URLS = "all"
+
+
+def is_fan_out(args) -> bool:
+    return bool(getattr(args, "urls", None)) or getattr(args, "url", None) == ALL_URLS
+
+
+def get_fan_out_urls(args) -> Dict[str, str]:
+    """
+    :return: label -> url in the given order
+    """
+    if getattr(args, "urls", None):
+        names = [name.strip() for name in args.urls.split(",") if name.strip()]
+    else:
+        names = list(PREDEFINED_URLS)
+
+    return {name: get_url(name) for name in names}
+
+
+def fan_out(urls: Dict[str, str], nid: int, method: str, params: List[Any]) -> Dict[str, Any]:
+    """Call a GovernanceReader method on every network at the same time
+
+    :param urls: label -> url
+    :param nid:
+    :param method: GovernanceReader method name
+    :param params: positional arguments of the method
+    :return: label -> result. An exception is placed instead of the result of a failed network
+    """
+    logging.debug(f"fan_out() start: {method} {list(urls)}")
+
+    def query(url: str):
+        return getattr(create_reader(url, nid), method)(*params)
+
+    with ThreadPoolExecutor(max_workers=max(1, len(urls))) as executor:
+        futures = {label: executor.submit(query, url) for label, url in urls.items()}
+
+    results = {}
+    for label, future in futures.items():
+        try:
+            results[label] = future.result()
+        except (Exception, IconServiceBaseException) as e:
+            logging.warning(f"fan_out(): {label} {e}")
+            results[label] = e
+
+    logging.debug("fan_out() end")
+    return results
+
+
+def _shorten(message: str, size: int = 60) -> str:
+    return message if len(message) <= size else f"{message[:size - 3]}..."
+
+
+def print_comparison(name: str, results: Dict[str, Any]):
+    """Print results side by side. Rows with different values are marked with '*'
+    """
+    columns: Dict[str, Dict[str, Any]] = {}
+    keys: List[str] = []
+
+    for label, result in results.items():
+        if isinstance(result, BaseException):
+            column = {"error": _shorten(str(result))}
+        else:
+            column = {key if key else name: value for key, value in flatten_dict(result).items()}
+
+        columns[label] = column
+        keys += [key for key in column if key not in keys]
+
+    # Failed networks are left out of comparison
+    succeeded = [label for label, result in results.items() if not isinstance(result, BaseException)]
+
+    rows = []
+    for key in keys:
+        compared = [columns[label].get(key) for label in succeeded]
+        mark = "*" if key == "error" or any(value != compared[0] for value in compared) else ""
+
+        values = [columns[label].get(key) for label in results]
+        rows.append([mark, key] + ["-" if value is None else value for value in values])
+
+    if get_output() != "table":
+        print_table(["changed", "key"] + list(results), [[row[0] == "*"] + row[1:] for row in rows])
+        return
+
+    print_title("Response", COLUMN)
+    print_table(["", "key"] + list(results), rows)
+    print("")
+
+
+def run_fan_out(args) -> int:
+    command = find_command(args.command)
+    if command.query is None:
+        raise ValueError(f"{command.name} can't run against several networks")
+
+    method, *arg_names = command.query
+    params = [getattr(args, arg_name) for arg_name in arg_names]
+
+    results: Dict[str, Any] = fan_out(get_fan_out_urls(args), args.nid, method, params)
+    print_comparison(command.name, results)
+
+    failed: bool = any(isinstance(result, BaseException) for result in results.values())
+    return 1 if failed else 0
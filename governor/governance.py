@@ -16,27 +16,30 @@ import functools
 import getpass
 import logging
 import os.path
+import sys
+import threading
+from typing import TYPE_CHECKING, List, Tuple, Optional, Callable, Any, Dict
 from urllib.parse import urlparse
 
-from iconsdk.builder.call_builder import CallBuilder
-from iconsdk.builder.transaction_builder import (
-    DeployTransactionBuilder,
-    CallTransactionBuilder,
-    Transaction,
-)
-from iconsdk.icon_service import IconService
-from iconsdk.libs.in_memory_zip import gen_deploy_data_content
-from iconsdk.providers.http_provider import HTTPProvider
-from iconsdk.signed_transaction import SignedTransaction
-from iconsdk.wallet.wallet import KeyWallet
-from .constants import EOA_ADDRESS, GOVERNANCE_ADDRESS, ZERO_ADDRESS, COLUMN
-from .utils import print_title, print_dict, get_url
+from iconsdk.utils.converter import convert
+from iconsdk.utils.templates import TRANSACTION_RESULT
+from .constants import EOA_ADDRESS, GOVERNANCE_ADDRESS, ZERO_ADDRESS, COLUMN, POOL_SIZE
+from .timings import span
+from .utils import print_title, print_dict, print_diagnostic, get_url
+
+# Modules which load the crypto stack of iconsdk are imported only when a transaction is made,
+# so that read commands start fast
+if TYPE_CHECKING:
+    from iconsdk.builder.transaction_builder import Transaction
+    from iconsdk.signed_transaction import SignedTransaction
+    from iconsdk.wallet.wallet import KeyWallet, Wallet
+    from .provider import BatchIconService
+    from .read_cache import ReadCache
+    from .step_estimator import StepEstimator
 
 
 def _print_request(title: str, content: dict):
-    print_title(title, COLUMN)
-    print_dict(content)
-    print("")
+    print_diagnostic(title, content)
 
 
 class TxBuildHelper:
@@ -44,7 +47,9 @@ class TxBuildHelper:
         self._icon_service = service
         self._nid = nid
 
-    def _deploy(self, owner, to, content, params, step_limit) -> Transaction:
+    def _deploy(self, owner, to, content, params, step_limit) -> 'Transaction':
+        from iconsdk.builder.transaction_builder import DeployTransactionBuilder
+
         logging.debug("TxBuildHelper._deploy() start")
 
         transaction = DeployTransactionBuilder() \
@@ -61,10 +66,10 @@ class TxBuildHelper:
         logging.debug("TxBuildHelper._deploy() end")
         return transaction
 
-    def install(self, owner, content, params=None, step_limit=0x50000000) -> Transaction:
+    def install(self, owner, content, params=None, step_limit=0x50000000) -> 'Transaction':
         return self._deploy(owner, ZERO_ADDRESS, content, params, step_limit)
 
-    def update(self, owner, to, content, params=None, step_limit=0x80000000) -> Transaction:
+    def update(self, owner, to, content, params=None, step_limit=0x80000000) -> 'Transaction':
         logging.debug("TxBuilderHelper.update() start")
         transaction = self._deploy(owner, to, content, params, step_limit)
         logging.debug("TxBuilderHelper.update() end")
@@ -72,6 +77,8 @@ class TxBuildHelper:
         return transaction
 
     def invoke(self, owner, to, method, params, step_limit=0x10000000):
+        from iconsdk.builder.transaction_builder import CallTransactionBuilder
+
         return CallTransactionBuilder() \
             .from_(owner.get_address()) \
             .to(to) \
@@ -83,10 +90,21 @@ class TxBuildHelper:
 
 
 class TxHandler:
-    def __init__(self, service, nid: int, on_send_request: callable(dict)):
+    def __init__(self,
+                 service,
+                 nid: int,
+                 on_send_request: callable(dict),
+                 sign_only: bool = False,
+                 step_estimator: Optional['StepEstimator'] = None):
+        """
+        :param step_estimator: if it is given, estimates are cached
+            and the step limit of a transaction is set to its estimate before signing
+        """
         self._icon_service = service
         self._nid = nid
         self._on_send_request = on_send_request
+        self._sign_only = sign_only
+        self._step_estimator = step_estimator
         self._tx_build_helper = TxBuildHelper(service, nid)
 
     def _call_on_send_request(self, content: dict) -> bool:
@@ -108,35 +126,101 @@ class TxHandler:
         transaction = self._tx_build_helper.invoke(owner, to, method, params, step_limit)
         return self._run(transaction, owner, estimate)
 
-    def _run(self, transaction: Transaction, owner: KeyWallet, estimate: bool):
+    def _run(self, transaction: 'Transaction', owner: 'KeyWallet', estimate: bool):
         logging.debug("TxHandler._run() start")
 
         if estimate:
             ret = self._estimate_step(transaction)
         else:
-            ret = self._send_transaction(owner, transaction)
+            if self._step_estimator is not None:
+                transaction.step_limit = self._step_estimator.get_step_limit(transaction)
+
+            if self._sign_only:
+                ret = self._sign_transaction(owner, transaction)
+            else:
+                ret = self._send_transaction(owner, transaction)
 
         logging.debug("TxHandler._run() end")
         return ret
 
-    def _send_transaction(self, owner: KeyWallet, transaction: Transaction):
+    @staticmethod
+    def _sign_transaction(owner: 'KeyWallet', transaction: 'Transaction') -> 'SignedTransaction':
+        from iconsdk.signed_transaction import SignedTransaction
+
+        logging.debug("TxHandler._sign_transaction() start")
+        with span("tx.sign"):
+            ret = SignedTransaction(transaction, owner)
+        logging.debug("TxHandler._sign_transaction() end")
+
+        return ret
+
+    def _send_transaction(self, owner: 'KeyWallet', transaction: 'Transaction'):
         logging.debug("TxHandler._send_transaction() start")
 
-        ret = self._call_on_send_request(transaction.to_dict())
+        with span("confirm"):
+            ret = self._call_on_send_request(self._to_request_content(transaction))
         if ret:
-            ret = self._icon_service.send_transaction(SignedTransaction(transaction, owner))
+            ret = self._icon_service.send_transaction(self._sign_transaction(owner, transaction))
 
         logging.debug("TxHandler._send_transaction() end")
         return ret
 
-    def _estimate_step(self, transaction: Transaction) -> int:
+    @staticmethod
+    def _to_request_content(transaction: 'Transaction') -> dict:
+        """Transaction dict to show, where deploy content is replaced with its size and digest
+        """
+        content: dict = transaction.to_dict()
+
+        if isinstance(content.get("content"), bytes):
+            from .package import get_content_preview
+            content["content"] = get_content_preview(content["content"])
+
+        return content
+
+    def _estimate_step(self, transaction: 'Transaction') -> int:
         logging.debug("TxHandler._estimate_step() start")
-        ret = self._icon_service.estimate_step(transaction)
+        if self._step_estimator is not None:
+            ret = self._step_estimator.estimate(transaction)
+        else:
+            ret = self._icon_service.estimate_step(transaction)
         logging.debug("TxHandler._estimate_step() end")
 
         return ret
 
 
+class Call(object):
+    """Read-only call to governance SCORE
+
+    It replaces iconsdk Call, which loads the crypto stack of iconsdk on import
+    """
+
+    def __init__(self, from_: str, to: str, method: str, params: Optional[dict] = None):
+        self.from_ = from_
+        self.to = to
+        self.method = method
+        self.params = params
+
+    def to_dict(self) -> dict:
+        return {"from_": self.from_, "to": self.to, "method": self.method, "params": self.params, "height": None}
+
+    def to_params(self) -> dict:
+        """Convert to icx_call params in the same way as IconService.call() does
+        """
+        params = {
+            "to": self.to,
+            "dataType": "call",
+            "data": {"method": self.method}
+        }
+
+        if self.from_ is not None:
+            params["from"] = self.from_
+
+        if isinstance(self.params, dict):
+            params["data"]["params"] = self.params
+
+        return params
+
+
 class GovernanceListener(object):
     def __init__(self):
         self._on_send_request = None
@@ -156,19 +240,43 @@ class GovernanceReader(GovernanceListener):
         self._icon_service = service
         self._nid = nid
         self._from = address
+        self._read_cache: Optional['ReadCache'] = None
+
+    def set_read_cache(self, cache: Optional['ReadCache']):
+        """Serve queries from a block-height-aware cache. Batch readers don't use it
+        """
+        self._read_cache = cache
 
     def _call(self, method, params=None):
-        call = CallBuilder() \
-            .from_(self._from) \
-            .to(GOVERNANCE_ADDRESS) \
-            .method(method) \
-            .params(params) \
-            .build()
+        call = self._build_call(method, params)
 
-        self.on_send_request(call.to_dict())
+        if self.on_send_request:
+            self.on_send_request(call.to_dict())
+
+        if self._read_cache is not None:
+            return self._read_cache.call(method, params, lambda: self._icon_service.call(call))
 
         return self._icon_service.call(call)
 
+    def _build_call(self, method, params=None) -> 'Call':
+        return Call(self._from, GOVERNANCE_ADDRESS, method, params)
+
+    def batch(self) -> 'GovernanceBatchReader':
+        """Create a reader which queues calls and sends them as a single JSON-RPC batch request
+
+        ex)
+            batch = reader.batch()
+            batch.get_version()
+            batch.get_revision()
+            version, revision = batch.execute()
+
+        :return: GovernanceBatchReader sharing the icon service of this reader
+        """
+        reader = GovernanceBatchReader(self._icon_service, self._nid, self._from)
+        reader.set_on_send_request(self.on_send_request)
+
+        return reader
+
     def get_version(self):
         return self._call("getVersion")
 
@@ -184,10 +292,7 @@ class GovernanceReader(GovernanceListener):
 
     def check_if_audit_enabled(self):
         service_config = self.get_service_config()
-        if service_config['AUDIT'] == '0x1':
-            return True
-        else:
-            return False
+        return _is_audit_enabled(service_config)
 
     def get_step_costs(self):
         return self._call(method="getStepCosts")
@@ -199,6 +304,13 @@ class GovernanceReader(GovernanceListener):
         tx_result = self._icon_service.get_transaction_result(tx_hash)
         return tx_result
 
+    def get_block_height(self) -> int:
+        block: dict = self._icon_service.get_last_block()
+        return _to_block_height(block)
+
+    def get_block(self, height: int) -> dict:
+        return self._icon_service.get_block_by_height(height)
+
     def get_max_step_limit(self, context_type: str) -> int:
         params = {"contextType": context_type}
         return self._call("getMaxStepLimit", params)
@@ -216,6 +328,87 @@ class GovernanceReader(GovernanceListener):
         return self._call("isInImportWhiteList", params)
 
 
+class GovernanceBatchReader(GovernanceReader):
+    """GovernanceReader which queues read requests instead of sending them one by one
+
+    Every read method returns None and its result is returned by execute() in queued order
+    """
+
+    def __init__(self, service: 'BatchIconService', nid: int, address: str = EOA_ADDRESS):
+        super().__init__(service, nid, address)
+
+        # (method, params, converter)
+        self._requests: List[Tuple[str, dict, Optional[Callable[[Any], Any]]]] = []
+
+    def __len__(self) -> int:
+        return len(self._requests)
+
+    def _call(self, method, params=None, converter=None):
+        call = self._build_call(method, params)
+
+        if self.on_send_request:
+            self.on_send_request(call.to_dict())
+
+        self._requests.append(("icx_call", call.to_params(), converter))
+
+    def check_if_audit_enabled(self) -> None:
+        self._call("getServiceConfig", converter=_is_audit_enabled)
+
+    def get_tx_result(self, tx_hash: str) -> None:
+        params = {"txHash": tx_hash}
+        self._requests.append(("icx_getTransactionResult", params, _to_tx_result))
+
+    def get_block_height(self) -> None:
+        self._requests.append(("icx_getLastBlock", None, _to_block_height))
+
+    def get_block(self, height: int) -> None:
+        self._requests.append(("icx_getBlockByHeight", {"height": hex(height)}, None))
+
+    def execute(self, return_exceptions: bool = False) -> list:
+        """Send all queued requests as a single batch request and clear the queue
+
+        :param return_exceptions: if True, an exception is placed in the result list
+            instead of being raised for a failed request
+        :return: results in queued order
+        """
+        logging.debug(f"GovernanceBatchReader.execute() start: {len(self._requests)}")
+
+        requests_ = self._requests
+        self._requests = []
+
+        results = self._icon_service.batch_request(
+            [(method, params) for method, params, _ in requests_]
+        )
+        results = self._convert_results(requests_, results, return_exceptions)
+
+        logging.debug("GovernanceBatchReader.execute() end")
+        return results
+
+    @staticmethod
+    def _convert_results(requests_: list, results: list, return_exceptions: bool) -> list:
+        for i, (_, _, converter) in enumerate(requests_):
+            result = results[i]
+            if isinstance(result, BaseException):
+                if not return_exceptions:
+                    raise result
+            elif converter:
+                results[i] = converter(result)
+
+        return results
+
+
+def _to_tx_result(result: dict) -> dict:
+    return convert(result, TRANSACTION_RESULT)
+
+
+def _to_block_height(block: dict) -> int:
+    return block["height"]
+
+
+def _is_audit_enabled(service_config: dict) -> bool:
+    return service_config["AUDIT"] == "0x1"
+
+
 class GovernanceWriter(GovernanceListener):
     def __init__(self, service, nid: int, owner):
         super().__init__()
@@ -223,6 +416,45 @@ class GovernanceWriter(GovernanceListener):
         self._icon_service = service
         self._owner = owner
         self._nid = nid
+        self._sign_only = False
+        self._estimate = False
+        self._step_estimator: Optional['StepEstimator'] = None
+
+    @property
+    def icon_service(self):
+        return self._icon_service
+
+    @property
+    def sign_only(self) -> bool:
+        return self._sign_only
+
+    def set_sign_only(self, sign_only: bool):
+        """In sign-only mode, every write method returns a SignedTransaction instead of sending it
+
+        :param sign_only:
+        :return:
+        """
+        self._sign_only = sign_only
+
+    @property
+    def estimate(self) -> bool:
+        return self._estimate
+
+    def set_estimate(self, estimate: bool):
+        """In estimate mode, every write method returns the estimated step instead of sending a transaction
+
+        :param estimate:
+        :return:
+        """
+        self._estimate = estimate
+
+    def set_step_estimator(self, step_estimator: Optional['StepEstimator']):
+        """Size the step limit of every transaction by the estimate from step_estimator
+
+        :param step_estimator: None to use the default step limit
+        :return:
+        """
+        self._step_estimator = step_estimator
 
     def _call(self, method: str, params: dict, step_limit: int = 0x10000000) -> str:
         tx_handler = self._create_tx_handler()
@@ -231,23 +463,23 @@ class GovernanceWriter(GovernanceListener):
             to=GOVERNANCE_ADDRESS,
             step_limit=step_limit,
             method=method,
-            params=params
+            params=params,
+            estimate=self._estimate
         )
 
     def _create_tx_handler(self) -> TxHandler:
-        return TxHandler(self._icon_service, self._nid, self.on_send_request)
+        return TxHandler(
+            self._icon_service, self._nid, self.on_send_request, self._sign_only, self._step_estimator
+        )
 
-    def update(self, score_path: str, step_limit: int, estimate: bool) -> str:
+    def update(self, score_path: str, step_limit: int = 0x80000000, estimate: bool = False) -> str:
         """Update governance SCORE
 
         :return: tx_hash
         """
-        path: str = os.path.join(score_path, "package.json")
-        if not os.path.isfile(path):
-            raise Exception(f"Invalid score path: {score_path}")
-
-        content: bytes = gen_deploy_data_content(score_path)
+        content: bytes = self._load_content(score_path)
 
+        estimate = estimate or self._estimate
         tx_handler = self._create_tx_handler()
         ret = tx_handler.update(
             self._owner, GOVERNANCE_ADDRESS, content, step_limit=step_limit, estimate=estimate
@@ -255,6 +487,16 @@ class GovernanceWriter(GovernanceListener):
 
         return ret
 
+    @staticmethod
+    def _load_content(score_path: str) -> bytes:
+        path: str = os.path.join(score_path, "package.json")
+        if not os.path.isfile(path):
+            raise Exception(f"Invalid score path: {score_path}")
+
+        from .deploy_cache import get_deploy_content_cache
+
+        return get_deploy_content_cache().load(score_path)
+
     def accept_score(self, tx_hash: str) -> str:
         method = "acceptScore"
         params = {"txHash": tx_hash}
@@ -388,15 +630,56 @@ class GovernanceWriter(GovernanceListener):
         return tx_result
 
 
+_icon_services: Dict[str, 'BatchIconService'] = {}
+_icon_services_lock = threading.Lock()
+
+
+class _Session(object):
+    """Readers with read caches and unlocked wallets reused by every command in a session such as 'governor shell'
+    """
+
+    def __init__(self):
+        # (url, nid, read cache backend) -> reader
+        self.readers: Dict[Tuple[str, int, str], GovernanceReader] = {}
+        # keystore path -> wallet
+        self.wallets: Dict[str, 'Wallet'] = {}
+
+
+_session: Optional[_Session] = None
+
+
+def start_session():
+    global _session
+    _session = _Session()
+
+
+def end_session():
+    global _session
+    _session = None
+
+
 def create_reader_by_args(args) -> GovernanceReader:
     url: str = get_url(args.url)
     nid: int = args.nid
+    read_cache: Optional[str] = getattr(args, "read_cache", None)
+
+    # Only a reader with a read cache is reused, so that the cache lasts across commands
+    key = (url, nid, read_cache)
+    if _session is not None and key in _session.readers:
+        return _session.readers[key]
 
     reader = create_reader(url, nid)
 
     callback = functools.partial(_print_request, "Request")
     reader.set_on_send_request(callback)
 
+    if read_cache:
+        from .read_cache import create_read_cache
+        reader.set_read_cache(create_read_cache(url, read_cache, reader.get_block_height))
+
+        if _session is not None:
+            _session.readers[key] = reader
+
     return reader
 
 
@@ -412,37 +695,99 @@ def create_writer_by_args(args) -> GovernanceWriter:
     password: str = args.password
     yes: bool = args.yes
 
-    if password is None:
-        password = getpass.getpass("> Password: ")
+    owner_wallet = None
+    if _session is not None:
+        owner_wallet = _session.wallets.get(os.path.realpath(keystore_path))
 
-    writer = create_writer(url, nid, keystore_path, password)
+    if owner_wallet is None and args.agent:
+        from .agent import load_agent_wallet
+        with span("agent.load"):
+            owner_wallet = load_agent_wallet(keystore_path)
+
+    if owner_wallet is None:
+        if password is None:
+            password = getpass.getpass("> Password: ")
+        owner_wallet = _load_wallet(keystore_path, password)
+
+    if _session is not None:
+        _session.wallets[os.path.realpath(keystore_path)] = owner_wallet
+
+    # Every transaction in flight keeps a connection
+    icon_service = create_icon_service(url, max(POOL_SIZE, getattr(args, "max_in_flight", 0)))
+    writer = GovernanceWriter(icon_service, nid, owner_wallet)
 
     callback = functools.partial(_confirm_callback, yes=yes)
     writer.set_on_send_request(callback)
 
+    # Transactions are signed and written to a file instead of being sent
+    writer.set_sign_only(bool(getattr(args, "sign_only", None)))
+
+    writer.set_estimate(args.estimate)
+    if args.estimate or args.auto_step_limit:
+        from .step_estimator import StepEstimator, get_step_estimate_cache
+        writer.set_step_estimator(StepEstimator(icon_service, nid, get_step_estimate_cache()))
+
     return writer
 
 
 def create_writer(url: str, nid: int, keystore_path: str, password: str) -> GovernanceWriter:
     icon_service = create_icon_service(url)
 
-    owner_wallet = KeyWallet.load(keystore_path, password)
+    owner_wallet = _load_wallet(keystore_path, password)
     return GovernanceWriter(icon_service, nid, owner_wallet)
 
 
-def create_icon_service(url: str) -> IconService:
+def _load_wallet(keystore_path: str, password: str) -> 'KeyWallet':
+    with span("import.iconsdk"):
+        from iconsdk.wallet.wallet import KeyWallet
+
+    with span("keystore.load"):
+        return KeyWallet.load(keystore_path, password)
+
+
+def create_icon_service(url: str, pool_size: int = POOL_SIZE) -> 'BatchIconService':
+    """Return the icon service for a given url
+
+    The same icon service is shared by readers, writers and the result poller in a process
+
+    :param url: comma-separated urls of the same network make requests fail over among the nodes
+    :param pool_size: the maximum number of concurrent requests to a node which keep their connections alive
+    """
     url: str = get_url(url)
-    o = urlparse(url)
+    base_domain_urls = [f"{o.scheme}://{o.netloc}" for o in map(urlparse, url.split(","))]
+    key: str = ",".join(base_domain_urls)
+
+    from .provider import BatchHTTPProvider, BatchIconService, get_session
+
+    with _icon_services_lock:
+        icon_service = _icon_services.get(key)
+        if icon_service is None:
+            providers = [BatchHTTPProvider(base_domain_url, 3, pool_size) for base_domain_url in base_domain_urls]
+            if len(providers) == 1:
+                provider = providers[0]
+            else:
+                from .failover import FailoverProvider, get_health_path
+                provider = FailoverProvider(providers, health_path=get_health_path(base_domain_urls))
+
+            icon_service = BatchIconService(provider)
+            _icon_services[key] = icon_service
+        else:
+            # The shared sessions grow for a caller which needs more connections
+            for base_domain_url in base_domain_urls:
+                get_session(base_domain_url, pool_size)
 
-    return IconService(HTTPProvider(f"{o.scheme}://{o.netloc}", 3))
+    return icon_service
 
 
 def _confirm_callback(content: dict, yes: bool) -> bool:
-    _print_request("Request", content)
+    if yes:
+        _print_request("Request", content)
+        return True
 
-    if not yes:
-        ret: str = input("> Continue? [Y/n]")
-        if ret == "n":
-            return False
+    # The request to confirm is shown even with --output quiet
+    print_title("Request", COLUMN, file=sys.stderr)
+    print_dict(content, file=sys.stderr)
+    sys.stderr.write("\n> Continue? [Y/n]")
+    sys.stderr.flush()
 
-    return True
+    return input() != "n"
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Minimal Prometheus metrics: gauges, counters, histograms and the text exposition endpoint
+"""
+
+import bisect
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Sequence, Tuple
+
+# Latency buckets in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _format_labels(labels: Labels) -> str:
+    if len(labels) == 0:
+        return ""
+
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in labels)
+    return f"{{{pairs}}}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value))
+
+
+def _to_labels(labels: Dict[str, str]) -> Labels:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+class Gauge(object):
+    def __init__(self, name: str, help_: str):
+        self.name = name
+        self.help = help_
+        self._lock = threading.Lock()
+        self._values: Dict[Labels, float] = {}
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[_to_labels(labels)] = value
+
+    def get(self, **labels) -> float:
+        with self._lock:
+            return self._values[_to_labels(labels)]
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} gauge"]
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(labels)} {_format_value(value)}")
+
+        return lines
+
+
+class Counter(Gauge):
+    def inc(self, amount: float = 1, **labels):
+        key: Labels = _to_labels(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> List[str]:
+        lines: List[str] = super().render()
+        lines[1] = f"# TYPE {self.name} counter"
+        return lines
+
+
+class Histogram(object):
+    def __init__(self, name: str, help_: str, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help_
+        self._buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # labels -> [counts per bucket..., sum, count]
+        self._values: Dict[Labels, list] = {}
+
+    def observe(self, value: float, **labels):
+        key: Labels = _to_labels(labels)
+        with self._lock:
+            data = self._values.get(key)
+            if data is None:
+                data = self._values[key] = [0] * len(self._buckets) + [0.0, 0]
+
+            # Counts are kept per bucket and accumulated on rendering
+            i: int = bisect.bisect_left(self._buckets, value)
+            if i < len(self._buckets):
+                data[i] += 1
+            data[-2] += value
+            data[-1] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+
+        with self._lock:
+            for labels, data in sorted(self._values.items()):
+                cumulative = 0
+                for le, count in zip(self._buckets, data):
+                    cumulative += count
+                    lines.append(self._render_bucket(labels, _format_value(le), cumulative))
+                lines.append(self._render_bucket(labels, "+Inf", data[-1]))
+
+                lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(data[-2])}")
+                lines.append(f"{self.name}_count{_format_labels(labels)} {data[-1]}")
+
+        return lines
+
+    def _render_bucket(self, labels: Labels, le: str, count: int) -> str:
+        return f"{self.name}_bucket{_format_labels(labels + (('le', le),))} {count}"
+
+
+class Registry(object):
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines += metric.render()
+
+        return "\n".join(lines) + "\n"
+
+
+def start_metrics_server(registry: Registry, host: str, port: int) -> ThreadingHTTPServer:
+    """Serve metrics at http://<host>:<port>/metrics in a daemon thread
+
+    :return: server to shut down
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+
+            data: bytes = registry.render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, fmt, *args):
+            logging.debug(f"metrics: {fmt % args}")
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server
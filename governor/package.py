@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Memory-bounded builder for SCORE deploy packages
+
+The zip is written in chunks to a spooled temporary file which moves to disk when it grows large,
+instead of a BytesIO buffer which is copied once more on read.
+The result is the same as gen_deploy_data_content() of iconsdk.
+"""
+
+import hashlib
+import os
+import tempfile
+from typing import BinaryIO, Iterator
+from zipfile import ZipFile, ZIP_DEFLATED
+
+from .constants import PACKAGE_SPOOL_SIZE
+
+CHUNK_SIZE = 65536
+
+
+def walk_package_files(score_path: str) -> Iterator[str]:
+    """Yield files to deploy in the same way as InMemoryZip.zip_in_memory() of iconsdk
+    """
+    tmp_root = None
+
+    for root, folders, files in os.walk(score_path):
+        if "package.json" in files:
+            tmp_root = root
+        if tmp_root and root.replace(tmp_root, "") == "/tests":
+            continue
+        if root.find("__pycache__") != -1:
+            continue
+        if root.find("/.") != -1:
+            continue
+
+        for file in files:
+            if not file.startswith("."):
+                yield os.path.join(root, file)
+
+
+class DeployPackage(object):
+    """Zipped SCORE package held in a spooled temporary file
+    """
+
+    def __init__(self, file: BinaryIO, size: int, digest: str, spilled: bool = False):
+        self._file = file
+        self.size = size
+        self.digest = digest
+        # Whether the package is too large to be kept in memory and has been written to disk
+        self.spilled = spilled
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def read(self) -> bytes:
+        self._file.seek(0)
+        return self._file.read()
+
+    def close(self):
+        self._file.close()
+
+
+def build_package(score_path: str, spool_size: int = PACKAGE_SPOOL_SIZE) -> DeployPackage:
+    """Zip a SCORE directory
+
+    :param score_path: SCORE directory
+    :param spool_size: the maximum bytes kept in memory while zipping
+    :return:
+    """
+    if not os.path.isdir(score_path):
+        raise ValueError(f"Invalid path {score_path}")
+
+    file = tempfile.SpooledTemporaryFile(max_size=spool_size)
+
+    try:
+        # ZipFile.write() reads and compresses each file in chunks
+        with ZipFile(file, "w", ZIP_DEFLATED, False, compresslevel=9) as zf:
+            for path in walk_package_files(score_path):
+                zf.write(path)
+
+        h = hashlib.sha3_256()
+        size = 0
+        file.seek(0)
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+            h.update(chunk)
+            size += len(chunk)
+    except Exception:
+        file.close()
+        raise
+
+    # A spooled file is written to disk once its size exceeds max_size
+    return DeployPackage(file, size, f"0x{h.hexdigest()}", spilled=size > spool_size)
+
+
+def get_content_preview(content: bytes) -> dict:
+    """Summary of deploy content to print instead of its hex encoding
+    """
+    return {"size": len(content), "digest": f"0x{hashlib.sha3_256(content).hexdigest()}"}
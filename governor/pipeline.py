@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Optional
+
+from iconsdk.exception import IconServiceBaseException
+
+from .constants import WAIT_TIMEOUT, MAX_IN_FLIGHT
+from .governance import GovernanceWriter
+from .waiter import TxResultWaiter
+
+if TYPE_CHECKING:
+    from iconsdk.signed_transaction import SignedTransaction
+
+# command name -> GovernanceWriter method name
+WRITER_COMMANDS = {
+    "update": "update",
+    "acceptScore": "accept_score",
+    "rejectScore": "reject_score",
+    "addAuditor": "add_auditor",
+    "removeAuditor": "remove_auditor",
+    "addDeployer": "add_deployer",
+    "removeDeployer": "remove_deployer",
+    "addToScoreBlackList": "add_to_score_black_list",
+    "removeFromScoreBlackList": "remove_from_score_black_list",
+    "addImportWhiteList": "add_import_white_list",
+    "removeImportWhiteList": "remove_import_white_list",
+    "updateServiceConfig": "update_service_config",
+    "setRevision": "set_revision",
+    "setStepPrice": "set_step_price",
+    "setStepCost": "set_step_cost",
+    "setMaxStepLimit": "set_max_step_limit",
+}
+
+
+class Operation(object):
+    """A governance write request
+
+    ex) Operation("addDeployer", {"address": "hx..."})
+    """
+
+    def __init__(self, command: str, params: Optional[dict] = None):
+        if command not in WRITER_COMMANDS:
+            raise ValueError(f"Invalid command: {command}")
+
+        self.command = command
+        self.params = params if params else {}
+
+    def __repr__(self):
+        return f"Operation({self.command}, {self.params})"
+
+    def apply(self, writer: GovernanceWriter):
+        method = getattr(writer, WRITER_COMMANDS[self.command])
+        return method(**self.params)
+
+    def to_dict(self) -> dict:
+        return {"command": self.command, "params": self.params}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Operation':
+        return cls(data["command"], data.get("params"))
+
+
+def load_operations(path: str) -> List[Operation]:
+    """Load operations from a json file
+
+    ex) [{"command": "addDeployer", "params": {"address": "hx..."}}, ...]
+    """
+    with open(path, "r") as f:
+        data: list = json.load(f)
+
+    return [Operation.from_dict(item) for item in data]
+
+
+class PipelineResult(object):
+    def __init__(self, operation: Operation):
+        self.operation = operation
+        self.tx_hash: Optional[str] = None
+        self.tx_result: Optional[dict] = None
+        self.error: Optional[BaseException] = None
+
+    @property
+    def success(self) -> bool:
+        return self.tx_result is not None and self.tx_result.get("status") == 1
+
+    def to_dict(self) -> dict:
+        ret = self.operation.to_dict()
+        ret["txHash"] = self.tx_hash
+
+        if self.tx_result is not None:
+            ret["status"] = self.tx_result.get("status")
+            ret["blockHeight"] = self.tx_result.get("blockHeight")
+            if "failure" in self.tx_result:
+                ret["failure"] = self.tx_result["failure"]
+        if self.error is not None:
+            ret["error"] = str(self.error)
+
+        return ret
+
+
+class TxPipeline(object):
+    """Build and sign transactions in a worker pool, then send them at once
+
+    The number of transactions waiting for their results is limited by max_in_flight
+    """
+
+    def __init__(self,
+                 writer: GovernanceWriter,
+                 workers: int = 0,
+                 max_in_flight: int = MAX_IN_FLIGHT,
+                 timeout: float = WAIT_TIMEOUT,
+                 wait_result: bool = True):
+        self._writer = writer
+        self._workers = workers if workers > 0 else os.cpu_count()
+        self._max_in_flight = max_in_flight
+        self._waiter = TxResultWaiter(writer.icon_service, timeout=timeout)
+        self._wait_result = wait_result
+
+    def run(self, operations: List[Operation]) -> List[PipelineResult]:
+        """
+        :param operations:
+        :return: results in the same order as operations. Empty list if it is canceled
+        """
+        signed_transactions = self.sign(operations)
+        if not self._confirm(operations):
+            return []
+
+        return self.submit(operations, signed_transactions)
+
+    def sign(self, operations: List[Operation]) -> List['SignedTransaction']:
+        logging.debug(f"TxPipeline.sign() start: {len(operations)}")
+
+        sign_only = self._writer.sign_only
+        self._writer.set_sign_only(True)
+        try:
+            with ThreadPoolExecutor(max_workers=self._workers) as executor:
+                ret = list(executor.map(lambda op: op.apply(self._writer), operations))
+        finally:
+            self._writer.set_sign_only(sign_only)
+
+        logging.debug("TxPipeline.sign() end")
+        return ret
+
+    def submit(self,
+               operations: List[Operation],
+               signed_transactions: List['SignedTransaction']) -> List[PipelineResult]:
+        logging.debug(f"TxPipeline.submit() start: {len(signed_transactions)}")
+
+        with ThreadPoolExecutor(max_workers=self._max_in_flight) as executor:
+            ret = list(executor.map(self._submit, operations, signed_transactions))
+
+        logging.debug("TxPipeline.submit() end")
+        return ret
+
+    def _confirm(self, operations: List[Operation]) -> bool:
+        on_send_request = self._writer.on_send_request
+        if on_send_request is None:
+            return False
+
+        return on_send_request({"transactions": [op.to_dict() for op in operations]})
+
+    def _submit(self, operation: Operation, signed_transaction: 'SignedTransaction') -> PipelineResult:
+        result = PipelineResult(operation)
+
+        try:
+            result.tx_hash = self._writer.icon_service.send_transaction(signed_transaction)
+            if self._wait_result:
+                result.tx_result = self._waiter.wait(result.tx_hash)
+        except (Exception, IconServiceBaseException) as e:
+            logging.warning(f"TxPipeline._submit(): {operation} {e}")
+            result.error = e
+
+        return result
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import List
+
+from .governance import create_writer_by_args
+from .pipeline import Operation, TxPipeline, PipelineResult, load_operations
+from .utils import print_response
+
+
+def sign_to_file(pipeline: TxPipeline, operations: List[Operation], path: str) -> int:
+    """Handle --sign-only of the commands which run operations in TxPipeline
+    """
+    from .broadcast import save_signed_transactions
+
+    records = save_signed_transactions(path, pipeline.sign(operations))
+    print_response({
+        "path": path,
+        "transactions": [
+            dict(operation.to_dict(), txHash=record["txHash"]) for operation, record in zip(operations, records)
+        ],
+    })
+
+    return 0
+
+
+def _run_pipeline(args) -> int:
+    path: str = args.path
+    wait_result: bool = not args.no_result
+
+    if args.estimate:
+        raise ValueError("pipeline doesn't support --estimate")
+
+    operations = load_operations(path)
+
+    writer = create_writer_by_args(args)
+    pipeline = TxPipeline(
+        writer,
+        workers=args.workers,
+        max_in_flight=args.max_in_flight,
+        timeout=args.wait_timeout,
+        wait_result=wait_result,
+    )
+    if args.sign_only:
+        return sign_to_file(pipeline, operations, args.sign_only)
+
+    results: List[PipelineResult] = pipeline.run(operations)
+
+    print_response({"results": [result.to_dict() for result in results]})
+
+    if wait_result:
+        ok = all(result.success for result in results)
+    else:
+        ok = all(result.error is None for result in results)
+
+    return 0 if len(results) > 0 and ok else 1
@@ -0,0 +1,427 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Declarative governance plan run with as many transactions in flight as its dependencies allow
+
+ex) plan.yaml
+    steps:
+      - id: governance
+        command: update
+        params: {score_path: ./governance}
+      - command: setRevision
+        params: {revision: 9, name: "1.7.0"}
+      - id: deployers
+        command: addDeployer
+        params: {address: hx...}
+        depends_on: [governance]
+
+A step runs after
+    - the steps in its depends_on
+    - the previous steps which change the same thing ex) setStepCost of the same step type
+    - the previous update and, for update, every previous step: SCORE update is a barrier
+    - every update in the plan, for setRevision
+
+Transactions are kept in a journal before being sent, so that a re-run skips finished steps
+and sends the ones submitted but not finished again as they are: a node which has one already
+rejects it as a duplicate, so it is never applied twice. A step whose transaction the node has
+rejected for another reason and does not know is signed again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
+
+from iconsdk.exception import IconServiceBaseException, JSONRPCException
+
+from .broadcast import get_tx_hash, is_duplicate
+from .constants import MAX_IN_FLIGHT, WAIT_TIMEOUT
+from .governance import GovernanceWriter
+from .pipeline import Operation, PipelineResult
+from .utils import save_json
+from .waiter import TxResultWaiter
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+if TYPE_CHECKING:
+    from iconsdk.signed_transaction import SignedTransaction
+
+# Error codes of icx_getTransactionResult for a transaction which the node has but has not finalized
+PENDING_TRANSACTION = -31002
+EXECUTING_TRANSACTION = -31003
+
+# command -> (kind of the thing which it changes, name of the param identifying it)
+RESOURCES = {
+    "acceptScore": ("audit", "tx_hash"),
+    "rejectScore": ("audit", "tx_hash"),
+    "addAuditor": ("auditor", "address"),
+    "removeAuditor": ("auditor", "address"),
+    "addDeployer": ("deployer", "address"),
+    "removeDeployer": ("deployer", "address"),
+    "addToScoreBlackList": ("scoreBlackList", "address"),
+    "removeFromScoreBlackList": ("scoreBlackList", "address"),
+    "addImportWhiteList": ("importWhiteList", "import_stmt"),
+    "removeImportWhiteList": ("importWhiteList", "import_stmt"),
+    "updateServiceConfig": ("serviceConfig", None),
+    "setRevision": ("revision", None),
+    "setStepPrice": ("stepPrice", None),
+    "setStepCost": ("stepCost", "step_type"),
+    "setMaxStepLimit": ("maxStepLimit", "context_type"),
+}
+
+
+class PlanStep(object):
+    def __init__(self, step_id: str, operation: Operation, depends_on: Optional[List[str]] = None):
+        self.id = step_id
+        self.operation = operation
+        self.depends_on: List[str] = depends_on if depends_on else []
+
+    def __repr__(self):
+        return f"PlanStep({self.id}, {self.operation})"
+
+    @property
+    def command(self) -> str:
+        return self.operation.command
+
+    @property
+    def resource(self) -> Optional[tuple]:
+        kind, name = RESOURCES.get(self.command, (None, None))
+        if kind is None:
+            return None
+
+        return kind, self.operation.params.get(name) if name else None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'PlanStep':
+        operation = Operation.from_dict(data)
+        step_id: str = str(data.get("id") or _default_step_id(operation))
+
+        depends_on = data.get("depends_on") or []
+        if isinstance(depends_on, str):
+            depends_on = [depends_on]
+
+        return cls(step_id, operation, [str(item) for item in depends_on])
+
+
+def _default_step_id(operation: Operation) -> str:
+    """An id derived from the operation, so that it stays the same when steps are reordered
+    """
+    data: str = json.dumps(operation.params, sort_keys=True)
+    return f"{operation.command}-{hashlib.sha256(data.encode()).hexdigest()[:8]}"
+
+
+class Plan(object):
+    def __init__(self, steps: List[PlanStep]):
+        ids: Set[str] = set()
+        for step in steps:
+            if step.id in ids:
+                raise ValueError(f"Duplicate step id: {step.id}")
+            ids.add(step.id)
+
+        for step in steps:
+            for step_id in step.depends_on:
+                if step_id not in ids:
+                    raise ValueError(f"Unknown step in depends_on of {step.id}: {step_id}")
+
+        self.steps = steps
+        self.dependencies: Dict[str, Set[str]] = _find_dependencies(steps)
+        self.order: List[str] = _sort(steps, self.dependencies)
+
+    def get_step(self, step_id: str) -> PlanStep:
+        return next(step for step in self.steps if step.id == step_id)
+
+
+def _find_dependencies(steps: List[PlanStep]) -> Dict[str, Set[str]]:
+    updates: List[str] = [step.id for step in steps if step.command == "update"]
+    ret: Dict[str, Set[str]] = {}
+
+    last_update: Optional[str] = None
+    last_changes: Dict[tuple, str] = {}
+
+    for i, step in enumerate(steps):
+        deps: Set[str] = set(step.depends_on)
+
+        if step.command == "update":
+            deps.update(prev.id for prev in steps[:i] if prev.command != "setRevision")
+            last_update = step.id
+        elif step.command == "setRevision":
+            deps.update(updates)
+        elif last_update is not None:
+            deps.add(last_update)
+
+        resource = step.resource
+        if resource is not None:
+            if resource in last_changes:
+                deps.add(last_changes[resource])
+            last_changes[resource] = step.id
+
+        ret[step.id] = deps
+
+    return ret
+
+
+def _sort(steps: List[PlanStep], dependencies: Dict[str, Set[str]]) -> List[str]:
+    """Topological order which is the closest to the order in the plan
+
+    :exception ValueError: dependencies have a cycle
+    """
+    ret: List[str] = []
+    done: Set[str] = set()
+
+    while len(ret) < len(steps):
+        ready = [step.id for step in steps if step.id not in done and dependencies[step.id] <= done]
+        if len(ready) == 0:
+            cycle = sorted(step.id for step in steps if step.id not in done)
+            raise ValueError(f"Circular dependencies among steps: {', '.join(cycle)}")
+
+        ret += ready
+        done.update(ready)
+
+    return ret
+
+
+def load_plan(path: str) -> Plan:
+    """Load a plan from a yaml or json file
+
+    Relative score_path of update is relative to the directory of the plan
+    """
+    with open(path, "r") as f:
+        if path.endswith((".yaml", ".yml")):
+            if yaml is None:
+                raise ImportError("PyYAML is required for yaml plans: pip install pyyaml")
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+
+    if isinstance(data, dict):
+        data = data.get("steps")
+    if not isinstance(data, list):
+        raise ValueError(f"Invalid plan: {path}")
+
+    steps = [PlanStep.from_dict(item) for item in data]
+
+    directory: str = os.path.dirname(os.path.abspath(path))
+    for step in steps:
+        score_path: Optional[str] = step.operation.params.get("score_path")
+        if step.command == "update" and score_path and not os.path.isabs(score_path):
+            step.operation.params["score_path"] = os.path.join(directory, score_path)
+
+    return Plan(steps)
+
+
+class Journal(object):
+    """Transactions submitted for the steps of a plan
+
+    ex) {"steps": {"governance": {"command": "update", "params": {...}, "txHash": "0x...", "status": "submitted",
+                                  "transaction": {...}}}}
+    """
+
+    SUBMITTED = "submitted"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = threading.Lock()
+        self._steps: Dict[str, dict] = {}
+
+        if os.path.isfile(path):
+            with open(path, "r") as f:
+                self._steps = json.load(f).get("steps", {})
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def get(self, step: PlanStep) -> Optional[dict]:
+        """
+        :return: the entry of the step. None if the step is not submitted or has been changed since
+        """
+        entry: Optional[dict] = self._steps.get(step.id)
+        if entry is None or Operation.from_dict(entry).to_dict() != step.operation.to_dict():
+            return None
+
+        return entry
+
+    def record(self,
+               step: PlanStep,
+               tx_hash: str,
+               status: str,
+               tx_result: Optional[dict] = None,
+               transaction: Optional[dict] = None):
+        """
+        :param transaction: params of the signed transaction, which a re-run sends again
+        """
+        entry = step.operation.to_dict()
+        entry.update({"txHash": tx_hash, "status": status})
+        if transaction is not None:
+            entry["transaction"] = transaction
+        if tx_result is not None:
+            entry["blockHeight"] = tx_result.get("blockHeight")
+
+        with self._lock:
+            self._steps[step.id] = entry
+            save_json(self._path, {"steps": self._steps})
+
+
+class StepResult(PipelineResult):
+    def __init__(self, step: PlanStep):
+        super().__init__(step.operation)
+        self.step = step
+        # Finished in a previous run
+        self.resumed = False
+        # Not run because a step which it depends on has failed
+        self.skipped = False
+
+    def to_dict(self) -> dict:
+        ret = {"id": self.step.id}
+        ret.update(super().to_dict())
+        if self.resumed:
+            ret["resumed"] = True
+        if self.skipped:
+            ret["skipped"] = True
+
+        return ret
+
+
+class PlanExecutor(object):
+    """Run each step as soon as the steps which it depends on have succeeded
+    """
+
+    def __init__(self,
+                 writer: GovernanceWriter,
+                 journal: Journal,
+                 max_in_flight: int = MAX_IN_FLIGHT,
+                 timeout: float = WAIT_TIMEOUT):
+        self._writer = writer
+        self._journal = journal
+        self._max_in_flight = max_in_flight
+        self._waiter = TxResultWaiter(writer.icon_service, timeout=timeout)
+
+    def run(self, plan: Plan) -> List[StepResult]:
+        """
+        :param plan:
+        :return: results in the order of plan.steps. Empty list if it is canceled
+        """
+        logging.debug(f"PlanExecutor.run() start: {len(plan.steps)}")
+
+        results: Dict[str, StepResult] = {step.id: StepResult(step) for step in plan.steps}
+        for step in plan.steps:
+            entry: Optional[dict] = self._journal.get(step)
+            if entry is not None and entry["status"] == Journal.SUCCEEDED:
+                result = results[step.id]
+                result.resumed = True
+                result.tx_hash = entry["txHash"]
+                result.tx_result = {"status": 1, "txHash": entry["txHash"], "blockHeight": entry.get("blockHeight")}
+
+        if not self._confirm([result.step for result in results.values() if not result.resumed]):
+            return []
+
+        sign_only = self._writer.sign_only
+        self._writer.set_sign_only(True)
+        try:
+            self._execute(plan, results)
+        finally:
+            self._writer.set_sign_only(sign_only)
+
+        logging.debug("PlanExecutor.run() end")
+        return [results[step.id] for step in plan.steps]
+
+    def _confirm(self, steps: List[PlanStep]) -> bool:
+        if len(steps) == 0:
+            return True
+
+        on_send_request = self._writer.on_send_request
+        if on_send_request is None:
+            return False
+
+        return on_send_request({"transactions": [dict(step.operation.to_dict(), id=step.id) for step in steps]})
+
+    def _execute(self, plan: Plan, results: Dict[str, StepResult]):
+        pending: List[str] = [step_id for step_id in plan.order if not results[step_id].resumed]
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=self._max_in_flight) as executor:
+            while len(pending) > 0 or len(running) > 0:
+                for step_id in list(pending):
+                    deps: List[StepResult] = [results[dep] for dep in plan.dependencies[step_id]]
+
+                    if any(dep.skipped or dep.error is not None or (dep.tx_result and not dep.success)
+                           for dep in deps):
+                        results[step_id].skipped = True
+                        pending.remove(step_id)
+                    elif all(dep.success for dep in deps) and len(running) < self._max_in_flight:
+                        running[executor.submit(self._run_step, results[step_id])] = step_id
+                        pending.remove(step_id)
+
+                if len(running) > 0:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        del running[future]
+
+    def _run_step(self, result: StepResult):
+        step: PlanStep = result.step
+
+        try:
+            entry: Optional[dict] = self._journal.get(step)
+            if entry is not None and entry["status"] == Journal.SUBMITTED:
+                # Recorded by a previous run which may have been interrupted before or after sending it
+                result.tx_hash = entry["txHash"]
+                transaction: Optional[dict] = entry.get("transaction")
+                if transaction is not None and not self._resend(result.tx_hash, transaction):
+                    result.tx_hash = None
+
+            if result.tx_hash is None:
+                signed_transaction: 'SignedTransaction' = step.operation.apply(self._writer)
+                transaction = signed_transaction.signed_transaction_dict
+                result.tx_hash = get_tx_hash(transaction)
+                # Recorded before sending: the entry is kept even if sending fails after the node has accepted it
+                self._journal.record(step, result.tx_hash, Journal.SUBMITTED, transaction=transaction)
+                self._writer.icon_service.send_raw_transaction(transaction)
+
+            result.tx_result = self._waiter.wait(result.tx_hash)
+            status: str = Journal.SUCCEEDED if result.success else Journal.FAILED
+            self._journal.record(step, result.tx_hash, status, result.tx_result)
+        except (Exception, IconServiceBaseException) as e:
+            logging.warning(f"PlanExecutor._run_step(): {step} {e}")
+            result.error = e
+
+    def _resend(self, tx_hash: str, transaction: dict) -> bool:
+        """Send the transaction of a previous run again
+
+        :return: whether the node has the transaction.
+            False if the node has rejected it and does not know it. ex) expired timestamp
+        """
+        icon_service = self._writer.icon_service
+        try:
+            icon_service.send_raw_transaction(transaction)
+            return True
+        except JSONRPCException as e:
+            if is_duplicate(e):
+                return True
+            logging.info(f"PlanExecutor._resend(): {tx_hash} {e}")
+
+        try:
+            icon_service.get_transaction_result(tx_hash)
+            return True
+        except JSONRPCException as e:
+            return e.rpc_code in (PENDING_TRANSACTION, EXECUTING_TRANSACTION)
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import logging
+import threading
+from json.decoder import JSONDecodeError
+from typing import TYPE_CHECKING, List, Tuple, Optional, Any, Dict, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from iconsdk.exception import JSONRPCException, HTTPError
+from iconsdk.providers.http_provider import HTTPProvider
+from iconsdk.utils.converter import convert
+from iconsdk.utils.templates import TRANSACTION_RESULT
+
+if TYPE_CHECKING:
+    from iconsdk.icon_service import IconService
+    from .failover import FailoverProvider
+    from .governance import Call
+
+from .constants import CONNECT_TIMEOUT, POOL_SIZE, READ_TIMEOUT
+from .timings import span
+
+# (method, params) pair which makes up an entry of JSON-RPC batch request
+RpcRequest = Tuple[str, Optional[dict]]
+
+
+# Keep-alive sessions shared by every provider in this process, one per node
+_sessions: Dict[str, requests.Session] = {}
+_pool_sizes: Dict[str, int] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(base_domain_url: str, pool_size: int = POOL_SIZE) -> requests.Session:
+    """Return the process-wide session for a given node
+
+    Connections in the session pool are kept alive and reused across requests,
+    so TLS handshake happens only once per connection
+
+    :param base_domain_url: <scheme>://<host>:<port>
+    :param pool_size: the maximum number of connections kept alive for the node.
+        The pool of the session grows if it is smaller
+    :return:
+    """
+    with _sessions_lock:
+        session = _sessions.get(base_domain_url)
+        if session is None:
+            session = requests.Session()
+            session.headers.update({"Connection": "keep-alive"})
+            _sessions[base_domain_url] = session
+
+        if _pool_sizes.get(base_domain_url, 0) < pool_size:
+            session.mount(base_domain_url, HTTPAdapter(pool_connections=1, pool_maxsize=pool_size))
+            _pool_sizes[base_domain_url] = pool_size
+
+        return session
+
+
+def close_sessions():
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+        _pool_sizes.clear()
+
+
+class BatchHTTPProvider(HTTPProvider):
+    """HTTPProvider which is able to send several JSON-RPC requests in one HTTP round trip
+
+    All requests to the same node go through a shared keep-alive session
+    """
+
+    def __init__(self, base_domain_url: str, version: int, pool_size: int = POOL_SIZE):
+        super().__init__(base_domain_url, version)
+
+        self._rpc_url = f"{base_domain_url}/api/v{version}"
+        self._session: requests.Session = get_session(base_domain_url, pool_size)
+
+    @property
+    def rpc_url(self) -> str:
+        return self._rpc_url
+
+    def make_batch_request(self, requests_: List[RpcRequest]) -> List[Any]:
+        """Send JSON-RPC requests as a single batch request
+
+        :param requests_: list of (method, params)
+        :return: results in the same order as requests_
+            JSONRPCException is placed instead of a result for a failed request
+        """
+        logging.debug(f"BatchHTTPProvider.make_batch_request() start: {len(requests_)}")
+
+        if len(requests_) == 0:
+            return []
+
+        rpc_list = []
+        for i, (method, params) in enumerate(requests_):
+            rpc_dict = {"jsonrpc": "2.0", "method": method, "id": i}
+            if params:
+                rpc_dict["params"] = params
+            rpc_list.append(rpc_dict)
+
+        response = self._post(rpc_list)
+        try:
+            contents = json.loads(response.content)
+        except JSONDecodeError:
+            raise HTTPError(response.content.decode(), response.status_code)
+
+        if not isinstance(contents, list):
+            # The whole batch is rejected. ex) Parse error, Invalid request
+            raise _to_exception(contents)
+
+        results: List[Any] = _to_batch_results(contents, len(requests_))
+
+        logging.debug("BatchHTTPProvider.make_batch_request() end")
+        return results
+
+    def _post(self, data) -> requests.Response:
+        return self._make_post_request(self._rpc_url, data, **self._get_request_kwargs())
+
+    def _make_post_request(self, request_url: str, data, **kwargs) -> requests.Response:
+        """Override HTTPProvider._make_post_request() which opens a new session for each request
+        """
+        # A dead node fails fast on connecting while a slow response is still waited for
+        kwargs.setdefault("timeout", (CONNECT_TIMEOUT, READ_TIMEOUT))
+
+        if isinstance(data, list):
+            name, attrs = "rpc batch", {"size": len(data)}
+        else:
+            name, attrs = f"rpc {data.get('method')}", {}
+
+        with span(name, **attrs):
+            return self._session.post(url=request_url, data=json.dumps(data), **kwargs)
+
+
+class BatchIconService(object):
+    """IconService which exposes the batch request of BatchHTTPProvider
+
+    Read APIs are implemented here without IconService,
+    which loads the crypto stack of iconsdk on import.
+    The other APIs are delegated to an IconService created on first use.
+    """
+
+    def __init__(self, provider: Union[BatchHTTPProvider, 'FailoverProvider']):
+        self._provider = provider
+        self._icon_service: Optional['IconService'] = None
+
+    @property
+    def provider(self) -> Union[BatchHTTPProvider, 'FailoverProvider']:
+        return self._provider
+
+    def call(self, call: 'Call') -> Any:
+        return self._provider.make_request("icx_call", call.to_params())
+
+    def get_transaction_result(self, tx_hash: str) -> dict:
+        result = self._provider.make_request("icx_getTransactionResult", {"txHash": tx_hash})
+        return convert(result, TRANSACTION_RESULT)
+
+    def wait_transaction_result(self, tx_hash: str) -> dict:
+        result = self._provider.make_request("icx_waitTransactionResult", {"txHash": tx_hash})
+        return convert(result, TRANSACTION_RESULT)
+
+    def get_last_block(self) -> dict:
+        return self._provider.make_request("icx_getLastBlock")
+
+    def get_block_by_height(self, height: int) -> dict:
+        return self._provider.make_request("icx_getBlockByHeight", {"height": hex(height)})
+
+    def send_raw_transaction(self, params: dict) -> str:
+        """Send a transaction which has been signed already, without loading the crypto stack of iconsdk
+        """
+        return self._provider.make_request("icx_sendTransaction", params)
+
+    def batch_request(self, requests_: List[RpcRequest]) -> List[Any]:
+        return self._provider.make_batch_request(requests_)
+
+    def __getattr__(self, name: str):
+        # send_transaction(), estimate_step() and so on
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        if self._icon_service is None:
+            from iconsdk.icon_service import IconService
+            self._icon_service = IconService(self._provider)
+
+        return getattr(self._icon_service, name)
+
+
+def _to_exception(content: dict) -> JSONRPCException:
+    error: dict = content.get("error") or {}
+    return JSONRPCException(error.get("message"), error.get("code"), error.get("data"))
+
+
+def _to_batch_results(contents: list, size: int) -> List[Any]:
+    """Arrange the responses of a batch request in request order
+
+    A request whose response is missing gets an exception as well as a failed one
+    """
+    results: List[Any] = [None] * size
+    responded: List[bool] = [False] * size
+
+    for content in contents:
+        i = content.get("id") if isinstance(content, dict) else None
+        if not isinstance(i, int) or not (0 <= i < size):
+            continue
+
+        if "error" in content:
+            results[i] = _to_exception(content)
+        else:
+            results[i] = content.get("result")
+        responded[i] = True
+
+    for i in range(size):
+        if not responded[i]:
+            results[i] = JSONRPCException(f"No response to the request in the batch: id={i}", -32603, None)
+
+    return results
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Read-through cache for governance queries
+
+Governance state changes only when a block is committed.
+A cached response is valid while the last block height stays the same as the one it was read at.
+The last block height itself is checked at most once per interval.
+
+ex)
+    reader = create_reader(url, nid)
+    reader.set_read_cache(ReadCache(url, MemoryBackend(), reader.get_block_height))
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .constants import READ_CACHE_SIZE, BLOCK_HEIGHT_INTERVAL
+from .utils import get_cache_dir, save_json
+
+# (block height, response)
+Entry = Tuple[int, Any]
+
+
+class MemoryBackend(object):
+    def __init__(self, size: int = READ_CACHE_SIZE):
+        """
+        :param size: the maximum number of responses to keep
+        """
+        self._size = size
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, key: str) -> Optional[Entry]:
+        with self._lock:
+            entry: Optional[Entry] = self._entries.get(key)
+            if entry is None:
+                return None
+
+            self._entries.move_to_end(key)
+
+        # Callers may modify the response
+        return entry[0], copy.deepcopy(entry[1])
+
+    def put(self, key: str, height: int, value: Any):
+        with self._lock:
+            self._entries[key] = (height, copy.deepcopy(value))
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._size:
+                self._entries.popitem(last=False)
+
+
+class DiskBackend(object):
+    """Keep a response per file so that several processes share them
+
+    The least recently used files beyond the size are removed
+    """
+
+    def __init__(self, directory: str, size: int = READ_CACHE_SIZE):
+        """
+        :param directory:
+        :param size: the maximum number of responses to keep
+        """
+        self._directory = directory
+        self._size = size
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self._directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Entry]:
+        path: str = self._get_path(key)
+        try:
+            with open(path, "r") as f:
+                entry: dict = json.load(f)
+            # Mark as recently used so that it survives pruning
+            os.utime(path)
+            return entry["height"], entry["value"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, key: str, height: int, value: Any):
+        try:
+            save_json(self._get_path(key), {"height": height, "value": value}, indent=None)
+            self._prune()
+        except OSError as e:
+            logging.warning(f"Failed to write read cache: {e}")
+
+    def _prune(self):
+        names: List[str] = [name for name in os.listdir(self._directory) if name.endswith(".json")]
+        if len(names) <= self._size:
+            return
+
+        paths: List[str] = [os.path.join(self._directory, name) for name in names]
+        mtimes: Dict[str, float] = {}
+        for path in paths:
+            try:
+                mtimes[path] = os.path.getmtime(path)
+            except OSError:
+                # Removed by another process
+                mtimes[path] = 0.0
+        paths.sort(key=mtimes.get, reverse=True)
+
+        for path in paths[self._size:]:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+
+class ReadCache(object):
+    def __init__(self,
+                 url: str,
+                 backend,
+                 get_block_height: Callable[[], int],
+                 interval: float = BLOCK_HEIGHT_INTERVAL):
+        """
+        :param url: node url which is a part of cache keys
+        :param backend: MemoryBackend or DiskBackend
+        :param get_block_height: return the last block height of the node
+        :param interval: seconds to reuse the last block height without asking the node
+        """
+        self._url = url
+        self._backend = backend
+        self._get_block_height = get_block_height
+        self._interval = interval
+
+        self._height: Optional[int] = None
+        self._checked_at: float = 0.0
+        self._height_lock = threading.Lock()
+
+        self._lock = threading.Lock()
+        # key -> Future of the call in flight
+        self._in_flight: Dict[str, Future] = {}
+
+    @property
+    def backend(self):
+        return self._backend
+
+    def _get_key(self, method: str, params: Optional[dict]) -> str:
+        data: str = json.dumps([self._url, method, params], sort_keys=True)
+        return hashlib.sha256(data.encode()).hexdigest()
+
+    def get_block_height(self) -> int:
+        # Only one thread asks the node and the others wait for its answer
+        with self._height_lock:
+            now: float = time.monotonic()
+            if self._height is None or now - self._checked_at >= self._interval:
+                self._height = self._get_block_height()
+                self._checked_at = now
+
+            return self._height
+
+    def call(self, method: str, params: Optional[dict], func: Callable[[], Any]) -> Any:
+        """Return the cached response for the current block height or call func
+
+        Concurrent calls with the same key wait for a single call of func
+        """
+        height: int = self.get_block_height()
+        key: str = self._get_key(method, params)
+
+        entry: Optional[Entry] = self._backend.get(key)
+        if entry is not None and entry[0] == height:
+            logging.debug(f"ReadCache.call(): hit {method}")
+            return entry[1]
+
+        with self._lock:
+            future: Optional[Future] = self._in_flight.get(key)
+            owner: bool = future is None
+            if owner:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not owner:
+            logging.debug(f"ReadCache.call(): wait for {method} in flight")
+            return copy.deepcopy(future.result())
+
+        try:
+            value = func()
+            self._backend.put(key, height, value)
+            future.set_result(copy.deepcopy(value))
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            raise e
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+
+def create_read_cache(url: str, kind: str, get_block_height: Callable[[], int]) -> ReadCache:
+    """
+    :param url:
+    :param kind: 'memory' or 'disk'
+    :param get_block_height:
+    :return:
+    """
+    if kind == "disk":
+        backend = DiskBackend(get_cache_dir("reads"))
+    else:
+        backend = MemoryBackend()
+
+    return ReadCache(url, backend, get_block_height)
@@ -18,39 +18,6 @@ from .governance import create_writer_by_args, create_reader_by_args
 from .utils import print_response
 
 
-def init(sub_parser, common_parent_parser, invoke_parent_parser):
-    _init_for_set_revision(sub_parser, common_parent_parser, invoke_parent_parser)
-    _init_for_get_revision(sub_parser, common_parent_parser)
-    _init_for_get_version(sub_parser, common_parent_parser)
-
-
-def _init_for_set_revision(sub_parser, common_parent_parser, invoke_parent_parser):
-    name = "setRevision"
-    desc = f"{name} command"
-
-    score_parser = sub_parser.add_parser(
-        name,
-        parents=[common_parent_parser, invoke_parent_parser],
-        help=desc)
-
-    score_parser.add_argument(
-        "revision",
-        type=int,
-        nargs="?",
-        default=-1,
-        help="revision ex) 3"
-    )
-    score_parser.add_argument(
-        "name",
-        type=str,
-        nargs="?",
-        default="",
-        help="iconservice version ex) 1.2.3"
-    )
-
-    score_parser.set_defaults(func=_set_revision)
-
-
 def _set_revision(args) -> str:
     revision: int = args.revision
     name: str = args.name
@@ -59,18 +26,6 @@ def _set_revision(args) -> str:
     return writer.set_revision(revision, name)
 
 
-def _init_for_get_revision(sub_parser, common_parent_parser):
-    name = "getRevision"
-    desc = f"{name} command"
-
-    score_parser = sub_parser.add_parser(
-        name,
-        parents=[common_parent_parser],
-        help=desc)
-
-    score_parser.set_defaults(func=_get_revision)
-
-
 def _get_revision(args) -> int:
     reader = create_reader_by_args(args)
     revision: dict = reader.get_revision()
@@ -80,18 +35,6 @@ def _get_revision(args) -> int:
     return 0
 
 
-def _init_for_get_version(sub_parser, common_parent_parser):
-    name = "getVersion"
-    desc = f"{name} command"
-
-    score_parser = sub_parser.add_parser(
-        name,
-        parents=[common_parent_parser],
-        help=desc)
-
-    score_parser.set_defaults(func=_get_version)
-
-
 def _get_version(args) -> int:
     reader = create_reader_by_args(args)
     version: int = reader.get_version()
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import cmd
+import functools
+import shlex
+
+from iconsdk.exception import IconServiceBaseException
+
+from .governance import start_session, end_session
+from .utils import get_url
+
+
+def _run_shell(args) -> int:
+    # Imported here to avoid circular import
+    from .__main__ import create_parser, run
+
+    url: str = get_url(args.url)
+    parser_factory = functools.partial(create_parser, url=url, nid=args.nid, keystore=args.keystore)
+
+    start_session()
+    try:
+        GovernorShell(parser_factory, run).cmdloop()
+    finally:
+        end_session()
+
+    return 0
+
+
+class GovernorShell(cmd.Cmd):
+    intro = "Type a subcommand with its arguments. 'help' for subcommands, 'exit' to quit."
+    prompt = "governor> "
+
+    def __init__(self, parser_factory, run):
+        """
+        :param parser_factory: create_parser() which takes argv
+        :param run:
+        """
+        super().__init__()
+        self._parser_factory = parser_factory
+        self._run = run
+
+    def default(self, line: str):
+        try:
+            argv = shlex.split(line)
+            args = self._parser_factory(argv=argv).parse_args(argv)
+        except (SystemExit, ValueError) as e:
+            # argparse exits on --help or an invalid argument
+            if isinstance(e, ValueError):
+                print(f"Error: {e}")
+            return False
+
+        if args.func is _run_shell:
+            print("Error: already in shell")
+            return False
+
+        try:
+            self._run(args)
+        except KeyboardInterrupt:
+            print("")
+        except (Exception, IconServiceBaseException) as e:
+            print(f"Error: {e}")
+
+        return False
+
+    def do_help(self, arg: str):
+        if arg:
+            self.default(f"{arg} --help")
+        else:
+            self._parser_factory(argv=[]).print_help()
+
+    def do_exit(self, arg: str):
+        return True
+
+    do_quit = do_exit
+
+    def do_EOF(self, arg: str):
+        print("")
+        return True
+
+    def emptyline(self):
+        return False
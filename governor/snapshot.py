@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Snapshot of the whole governance state read in a single batch request
+
+ex)
+    {
+        "url": "https://ctz.solidwallet.io/api/v3",
+        "nid": 1,
+        "blockHeight": 12345,
+        "state": {"version": ..., "revision": ..., "serviceConfig": ..., ...}
+    }
+"""
+
+import json
+import logging
+from typing import Any, Dict, Tuple
+
+from .governance import GovernanceReader
+from .utils import flatten_dict
+
+# context types of getMaxStepLimit
+CONTEXT_TYPES = ("invoke", "query")
+
+
+def take_snapshot(reader: GovernanceReader, url: str, nid: int) -> dict:
+    logging.debug(f"take_snapshot() start: {url}")
+
+    batch = reader.batch()
+    batch.get_block_height()
+    batch.get_version()
+    batch.get_revision()
+    batch.get_service_config()
+    batch.get_step_costs()
+    batch.get_step_price()
+    for context_type in CONTEXT_TYPES:
+        batch.get_max_step_limit(context_type)
+
+    block_height, version, revision, service_config, step_costs, step_price, *max_step_limits = batch.execute()
+
+    snapshot = {
+        "url": url,
+        "nid": nid,
+        "blockHeight": block_height,
+        "state": {
+            "version": version,
+            "revision": revision,
+            "serviceConfig": service_config,
+            "stepCosts": step_costs,
+            "stepPrice": step_price,
+            "maxStepLimits": dict(zip(CONTEXT_TYPES, max_step_limits)),
+        },
+    }
+
+    logging.debug("take_snapshot() end")
+    return snapshot
+
+
+def save_snapshot(snapshot: dict, path: str):
+    with open(path, "w") as f:
+        json.dump(snapshot, f, indent=4)
+
+
+def load_snapshot(path: str) -> dict:
+    with open(path, "r") as f:
+        snapshot: dict = json.load(f)
+
+    if not isinstance(snapshot.get("state"), dict):
+        raise ValueError(f"Invalid snapshot: {path}")
+
+    return snapshot
+
+
+def diff_snapshots(a: dict, b: dict) -> Dict[str, Tuple[Any, Any]]:
+    """Compare the governance state of two snapshots
+
+    :return: {"stepCosts.apiCall": ("0x2710", "0x3a98"), ...} only for different values
+        None stands for a missing value
+    """
+    flat_a = flatten_dict(a["state"])
+    flat_b = flatten_dict(b["state"])
+
+    ret = {}
+    for key in sorted(flat_a.keys() | flat_b.keys()):
+        value_a = flat_a.get(key)
+        value_b = flat_b.get(key)
+        if value_a != value_b:
+            ret[key] = (value_a, value_b)
+
+    return ret
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from .governance import create_reader
+from .snapshot import take_snapshot, save_snapshot, load_snapshot, diff_snapshots
+from .utils import print_response, get_url
+
+
+def _take_snapshot(args) -> int:
+    url: str = get_url(args.url)
+
+    snapshot: dict = take_snapshot(create_reader(url, args.nid), url, args.nid)
+    if args.path:
+        save_snapshot(snapshot, args.path)
+
+    print_response(snapshot)
+    return 0
+
+
+def _diff_snapshots(args) -> int:
+    a, b = _load_snapshots([args.source_a, args.source_b], args.nid)
+    diff = diff_snapshots(a, b)
+
+    print_response({
+        "a": {"url": a["url"], "blockHeight": a["blockHeight"]},
+        "b": {"url": b["url"], "blockHeight": b["blockHeight"]},
+        "diff": {key: {"a": value_a, "b": value_b} for key, (value_a, value_b) in diff.items()},
+    })
+
+    # The same as diff(1): 0 if no differences, 1 otherwise
+    return 0 if len(diff) == 0 else 1
+
+
+def _load_snapshots(sources: List[str], nid: int) -> List[dict]:
+    """Load snapshots from files and take the others from nodes at the same time
+
+    :param sources: snapshot files or node urls
+    :param nid:
+    :return: snapshots in the same order as sources
+    """
+    # Each node is read only once even if it is given twice
+    urls = set(get_url(source) for source in sources if not os.path.isfile(source))
+
+    with ThreadPoolExecutor(max_workers=max(1, len(urls))) as executor:
+        futures = {url: executor.submit(take_snapshot, create_reader(url, nid), url, nid) for url in urls}
+        snapshots: Dict[str, dict] = {url: future.result() for url, future in futures.items()}
+
+    return [
+        load_snapshot(source) if os.path.isfile(source) else snapshots[get_url(source)]
+        for source in sources
+    ]
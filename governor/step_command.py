@@ -16,42 +16,7 @@
 from typing import Optional
 
 from .governance import create_reader_by_args, create_writer_by_args
-from .utils import print_response
-
-
-def init(sub_parser, common_parent_parser, invoke_parent_parser):
-    _init_for_set_step_cost(sub_parser, common_parent_parser, invoke_parent_parser)
-    _init_for_set_step_price(sub_parser, common_parent_parser, invoke_parent_parser)
-    _init_for_set_max_step_limit(sub_parser, common_parent_parser, invoke_parent_parser)
-    _init_for_get_step_costs(sub_parser, common_parent_parser)
-    _init_for_get_step_price(sub_parser, common_parent_parser)
-    _init_for_get_max_step_limit(sub_parser, common_parent_parser)
-
-
-def _init_for_set_step_cost(sub_parser, common_parent_parser, invoke_parent_parser):
-    name = "setStepCost"
-    desc = f"{name} command"
-
-    score_parser = sub_parser.add_parser(
-        name,
-        parents=[common_parent_parser, invoke_parent_parser],
-        help=desc)
-
-    score_parser.add_argument(
-        "step_type",
-        type=str,
-        nargs="?",
-        help="step_type ex) default, apiCall, contractSet, input, eventlog"
-    )
-    score_parser.add_argument(
-        "cost",
-        type=int,
-        nargs="?",
-        default=-1,
-        help="cost ex) 1000"
-    )
-
-    score_parser.set_defaults(func=_set_step_cost)
+from .utils import get_output, print_response
 
 
 def _set_step_cost(args) -> str:
@@ -64,25 +29,6 @@ def _set_step_cost(args) -> str:
     return tx_result
 
 
-def _init_for_set_step_price(sub_parser, common_parent_parser, invoke_parent_parser):
-    name = "setStepPrice"
-    desc = f"{name} command"
-
-    score_parser = sub_parser.add_parser(
-        name,
-        parents=[common_parent_parser, invoke_parent_parser],
-        help=desc)
-
-    score_parser.add_argument(
-        "step_price",
-        type=int,
-        nargs="?",
-        help=""
-    )
-
-    score_parser.set_defaults(func=_set_step_price)
-
-
 def _set_step_price(args) -> str:
     step_price: int = args.step_price
 
@@ -92,32 +38,6 @@ def _set_step_price(args) -> str:
     return tx_result
 
 
-def _init_for_set_max_step_limit(sub_parser, common_parent_parser, invoke_parent_parser):
-    name = "setMaxStepLimit"
-    desc = f"{name} command"
-
-    score_parser = sub_parser.add_parser(
-        name,
-        parents=[common_parent_parser, invoke_parent_parser],
-        help=desc)
-
-    score_parser.add_argument(
-        "context_type",
-        type=str,
-        nargs="?",
-        help=""
-    )
-    score_parser.add_argument(
-        "value",
-        type=int,
-        nargs="?",
-        default=-1,
-        help=""
-    )
-
-    score_parser.set_defaults(func=_set_max_step_limit)
-
-
 def _set_max_step_limit(args) -> str:
     context_type: str = args.context_type
     value: int = args.value
@@ -128,18 +48,6 @@ def _set_max_step_limit(args) -> str:
     return tx_result
 
 
-def _init_for_get_step_costs(sub_parser, common_parent_parser):
-    name = "getStepCosts"
-    desc = f"{name} command"
-
-    score_parser = sub_parser.add_parser(
-        name,
-        parents=[common_parent_parser],
-        help=desc)
-
-    score_parser.set_defaults(func=_get_step_costs)
-
-
 def _get_step_costs(args) -> int:
     reader = create_reader_by_args(args)
     step_costs: dict = reader.get_step_costs()
@@ -160,46 +68,16 @@ def _convert_hex_to_int(step_costs: dict) -> dict:
     return step_costs
 
 
-def _init_for_get_step_price(sub_parser, common_parent_parser):
-    name = "getStepPrice"
-    desc = f"{name} command"
-
-    score_parser = sub_parser.add_parser(
-        name,
-        parents=[common_parent_parser],
-        help=desc)
-
-    score_parser.set_defaults(func=_get_step_price)
-
-
 def _get_step_price(args) -> int:
     reader = create_reader_by_args(args)
     step_price: str = reader.get_step_price()
 
-    print_response(f"stepPrice: {int(step_price, 16)}")
+    price: int = int(step_price, 16)
+    print_response(f"stepPrice: {price}" if get_output() == "table" else {"stepPrice": price})
 
     return 0
 
 
-def _init_for_get_max_step_limit(sub_parser, common_parent_parser):
-    name = "getMaxStepLimit"
-    desc = f"{name} command"
-
-    score_parser = sub_parser.add_parser(
-        name,
-        parents=[common_parent_parser],
-        help=desc)
-
-    score_parser.add_argument(
-        "context_type",
-        type=str,
-        nargs="?",
-        help=""
-    )
-
-    score_parser.set_defaults(func=_get_max_step_limit)
-
-
 def _get_max_step_limit(args) -> int:
     context_type: str = args.context_type
 
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Step estimation with a persistent cache and automatic step limit sizing
+
+An estimate is cached by (network, method, params hash, content hash, revision),
+so a routine change which was estimated before doesn't cost another debug_estimateStep.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING, Dict, Optional
+
+from .constants import STEP_ESTIMATE_CACHE_SIZE, STEP_MARGIN
+from .governance import GovernanceReader
+from .utils import get_cache_dir, save_json
+
+if TYPE_CHECKING:
+    from iconsdk.builder.transaction_builder import Transaction
+
+
+def _hash(data) -> str:
+    if isinstance(data, bytes):
+        return hashlib.sha3_256(data).hexdigest()
+
+    return hashlib.sha3_256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+class StepEstimateCache(object):
+    def __init__(self, path: Optional[str] = None, size: int = STEP_ESTIMATE_CACHE_SIZE):
+        """
+        :param path: json file where estimates are stored. Kept only in memory if None
+        :param size: the maximum number of estimates to keep
+        """
+        self._path = path
+        self._size = size
+        self._lock = threading.Lock()
+        # key -> step. None: not loaded yet
+        self._steps: Optional[Dict[str, int]] = None
+
+    def get(self, key: str) -> Optional[int]:
+        with self._lock:
+            return self._load().get(key)
+
+    def put(self, key: str, step: int):
+        with self._lock:
+            steps = self._load()
+            steps.pop(key, None)
+            steps[key] = step
+
+            # The oldest estimates are dropped first
+            for old_key in list(steps)[:max(0, len(steps) - self._size)]:
+                del steps[old_key]
+
+            self._save(steps)
+
+    def _load(self) -> Dict[str, int]:
+        if self._steps is not None:
+            return self._steps
+
+        self._steps = {}
+        if self._path is not None:
+            try:
+                with open(self._path, "r") as f:
+                    self._steps = json.load(f)
+            except (OSError, ValueError) as e:
+                logging.info(f"StepEstimateCache._load(): {e}")
+
+        return self._steps
+
+    def _save(self, steps: Dict[str, int]):
+        if self._path is None:
+            return
+
+        try:
+            save_json(self._path, steps, indent=None)
+        except OSError as e:
+            logging.warning(f"Failed to write step estimate cache: {e}")
+
+
+class StepEstimator(object):
+    """Estimate step of a transaction through the cache and size its step limit
+    """
+
+    def __init__(self, service, nid: int, cache: StepEstimateCache, margin: float = STEP_MARGIN):
+        """
+        :param service: icon service
+        :param nid:
+        :param cache:
+        :param margin: ratio of an estimated step to add to the step limit
+        """
+        self._icon_service = service
+        self._nid = nid
+        self._cache = cache
+        self._margin = margin
+
+        self._lock = threading.Lock()
+        self._revision: Optional[str] = None
+
+    def estimate(self, transaction: 'Transaction') -> int:
+        key: str = self._get_key(transaction, self._get_revision())
+
+        step: Optional[int] = self._cache.get(key)
+        if step is None:
+            step = self._icon_service.estimate_step(transaction)
+            self._cache.put(key, step)
+        else:
+            logging.debug(f"StepEstimator.estimate(): cache hit: {key}")
+
+        return step
+
+    def get_step_limit(self, transaction: 'Transaction') -> int:
+        return self._to_step_limit(self.estimate(transaction))
+
+    def _to_step_limit(self, step: int) -> int:
+        return int(step * (1 + self._margin))
+
+    def _get_revision(self) -> str:
+        """Estimates are invalidated when governance changes the revision
+        """
+        with self._lock:
+            if self._revision is None:
+                reader = GovernanceReader(self._icon_service, self._nid)
+                self._revision = reader.get_revision()["code"]
+
+            return self._revision
+
+    def _get_key(self, transaction: 'Transaction', revision: str) -> str:
+        content: Optional[bytes] = getattr(transaction, "content", None)
+
+        key = {
+            "url": getattr(self._icon_service.provider, "rpc_url", None),
+            "nid": self._nid,
+            "to": transaction.to,
+            "method": getattr(transaction, "method", transaction.data_type),
+            "params": _hash(transaction.params),
+            "content": None if content is None else _hash(content),
+            "revision": revision,
+        }
+        return _hash(key)
+
+
+_cache: Optional[StepEstimateCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_step_estimate_cache() -> StepEstimateCache:
+    """Return the process-wide cache stored under the governor cache directory
+    """
+    global _cache
+
+    with _cache_lock:
+        if _cache is None:
+            _cache = StepEstimateCache(os.path.join(get_cache_dir("step"), "estimates.json"))
+
+        return _cache
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Reconcile the governance state with a desired state
+
+Only the transactions which change something are sent.
+
+ex) state.json
+    {
+        "deployers": ["hx...", ...],
+        "scoreBlackList": {"present": ["cx..."], "absent": ["cx..."]},
+        "importWhiteList": ["{'json': []}"],
+        "stepCosts": {"apiCall": 10000, ...},
+        "stepPrice": 12500000000,
+        "maxStepLimits": {"invoke": 2500000000, "query": 50000000}
+    }
+
+Lists can't be enumerated on chain, so a list is the items which have to be in it,
+and the items to remove from it are given in "absent". Omitted keys are left as they are.
+"""
+
+import json
+import logging
+from typing import Any, List, Optional, Tuple
+
+from .bulk import BulkReader
+from .constants import BULK_BATCH_SIZE, BULK_WORKERS
+from .governance import GovernanceReader
+from .pipeline import Operation
+
+# key in a desired state -> (membership query, add command, remove command, name of the param)
+LISTS = {
+    "deployers": ("is_deployer", "addDeployer", "removeDeployer", "address"),
+    "scoreBlackList": ("is_in_score_black_list", "addToScoreBlackList", "removeFromScoreBlackList", "address"),
+    "importWhiteList": ("is_in_import_white_list", "addImportWhiteList", "removeImportWhiteList", "import_stmt"),
+}
+
+KEYS = tuple(LISTS) + ("stepCosts", "stepPrice", "maxStepLimits")
+
+
+def _to_int(value: Any) -> int:
+    return int(value, 0) if isinstance(value, str) else int(value)
+
+
+def _get_members(value: Any, key: str) -> Tuple[List[str], List[str]]:
+    """
+    :return: items to be in the list, items not to be in the list
+    """
+    if isinstance(value, list):
+        present, absent = value, []
+    elif isinstance(value, dict):
+        present, absent = value.get("present", []), value.get("absent", [])
+    else:
+        raise ValueError(f"Invalid {key}: {value}")
+
+    for item in present + absent:
+        if not isinstance(item, str):
+            raise ValueError(f"Invalid item of {key}: {item}")
+
+    both = set(present) & set(absent)
+    if len(both) > 0:
+        raise ValueError(f"Both present and absent in {key}: {', '.join(sorted(both))}")
+
+    return list(dict.fromkeys(present)), list(dict.fromkeys(absent))
+
+
+def load_desired_state(path: str) -> dict:
+    with open(path, "r") as f:
+        state = json.load(f)
+
+    if not isinstance(state, dict):
+        raise ValueError(f"Invalid state: {path}")
+
+    unknown = [key for key in state if key not in KEYS]
+    if len(unknown) > 0:
+        raise ValueError(f"Unknown keys in {path}: {', '.join(unknown)}")
+
+    return state
+
+
+class StateSynchronizer(object):
+    def __init__(self, reader: GovernanceReader, batch_size: int = BULK_BATCH_SIZE, workers: int = BULK_WORKERS):
+        self._reader = reader
+        self._batch_size = batch_size
+        self._workers = workers
+
+    def read(self, desired: dict) -> dict:
+        """Read the current values of what the desired state has
+
+        Memberships are read in concurrent batch requests and the others in a single one
+
+        :return: current state in the same form as desired. Lists are {item: bool}
+        :exception: the first read which has failed
+        """
+        logging.debug("StateSynchronizer.read() start")
+
+        current = {}
+
+        for key, (method, _, _, _) in LISTS.items():
+            if key not in desired:
+                continue
+
+            present, absent = _get_members(desired[key], key)
+            bulk_reader = BulkReader(self._reader, method, self._batch_size, self._workers)
+
+            current[key] = {}
+            for item, result in bulk_reader.run(present + absent):
+                if isinstance(result, BaseException):
+                    raise result
+                current[key][item] = _to_int(result) == 1
+
+        batch = self._reader.batch()
+        keys: List[Tuple[str, Optional[str]]] = []
+        if "stepCosts" in desired:
+            batch.get_step_costs()
+            keys.append(("stepCosts", None))
+        if "stepPrice" in desired:
+            batch.get_step_price()
+            keys.append(("stepPrice", None))
+        for context_type in desired.get("maxStepLimits", {}):
+            batch.get_max_step_limit(context_type)
+            keys.append(("maxStepLimits", context_type))
+
+        if len(batch) > 0:
+            for (key, sub_key), result in zip(keys, batch.execute()):
+                if sub_key is None:
+                    current[key] = result
+                else:
+                    current.setdefault(key, {})[sub_key] = result
+
+        logging.debug("StateSynchronizer.read() end")
+        return current
+
+    @staticmethod
+    def get_operations(desired: dict, current: dict) -> List[Operation]:
+        """
+        :return: the operations which make current the same as desired
+        """
+        ret: List[Operation] = []
+
+        for key, (_, add, remove, name) in LISTS.items():
+            if key not in desired:
+                continue
+
+            present, absent = _get_members(desired[key], key)
+            ret += [Operation(add, {name: item}) for item in present if not current[key][item]]
+            ret += [Operation(remove, {name: item}) for item in absent if current[key][item]]
+
+        for step_type, cost in desired.get("stepCosts", {}).items():
+            value: Optional[Any] = current["stepCosts"].get(step_type)
+            if value is None or _to_int(value) != _to_int(cost):
+                ret.append(Operation("setStepCost", {"step_type": step_type, "cost": _to_int(cost)}))
+
+        if "stepPrice" in desired and _to_int(current["stepPrice"]) != _to_int(desired["stepPrice"]):
+            ret.append(Operation("setStepPrice", {"step_price": _to_int(desired["stepPrice"])}))
+
+        for context_type, value in desired.get("maxStepLimits", {}).items():
+            if _to_int(current["maxStepLimits"][context_type]) != _to_int(value):
+                ret.append(Operation("setMaxStepLimit", {"context_type": context_type, "value": _to_int(value)}))
+
+        return ret
+
+    def diff(self, desired: dict) -> List[Operation]:
+        return self.get_operations(desired, self.read(desired))
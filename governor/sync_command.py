@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import List
+
+from .governance import create_reader, create_writer_by_args
+from .pipeline import Operation, PipelineResult, TxPipeline
+from .pipeline_command import sign_to_file
+from .sync import StateSynchronizer, load_desired_state
+from .utils import get_url, print_response
+
+
+def _sync(args) -> int:
+    if args.estimate:
+        raise ValueError("sync doesn't support --estimate")
+
+    desired: dict = load_desired_state(args.path)
+
+    synchronizer = StateSynchronizer(create_reader(get_url(args.url), args.nid), args.batch_size, args.workers)
+    operations: List[Operation] = synchronizer.diff(desired)
+
+    if args.dry_run or len(operations) == 0:
+        print_response({"operations": [operation.to_dict() for operation in operations]})
+        return 0
+
+    wait_result: bool = not args.no_result
+    pipeline = TxPipeline(
+        create_writer_by_args(args),
+        max_in_flight=args.max_in_flight,
+        timeout=args.wait_timeout,
+        wait_result=wait_result,
+    )
+    if args.sign_only:
+        return sign_to_file(pipeline, operations, args.sign_only)
+
+    results: List[PipelineResult] = pipeline.run(operations)
+
+    print_response({"results": [result.to_dict() for result in results]})
+
+    if wait_result:
+        ok = all(result.success for result in results)
+    else:
+        ok = all(result.error is None for result in results)
+
+    return 0 if len(results) > 0 and ok else 1
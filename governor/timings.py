@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Wall and CPU time of each phase of a command
+
+Phases are recorded only after enable_timings() is called, so span() costs nothing otherwise.
+
+ex)
+    with span("keystore.load"):
+        wallet = KeyWallet.load(path, password)
+
+The trace file is written in Chrome trace event format, which chrome://tracing and Perfetto open.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict, List, Optional
+
+from .constants import COLUMN
+from .utils import print_title, print_table
+
+
+class Span(object):
+    def __init__(self, name: str, start: float, wall: float, cpu: float, thread_id: int, attrs: dict):
+        """
+        :param name: phase name ex) tx.sign, rpc icx_call
+        :param start: seconds since the tracer is created
+        :param wall: elapsed seconds
+        :param cpu: CPU seconds of the thread which runs the phase
+        :param thread_id:
+        :param attrs: additional information ex) {"size": 3}
+        """
+        self.name = name
+        self.start = start
+        self.wall = wall
+        self.cpu = cpu
+        self.thread_id = thread_id
+        self.attrs = attrs
+
+    def to_trace_event(self) -> dict:
+        return {
+            "name": self.name,
+            "ph": "X",
+            "ts": round(self.start * 1_000_000),
+            "dur": round(self.wall * 1_000_000),
+            "pid": os.getpid(),
+            "tid": self.thread_id,
+            "args": dict(self.attrs, cpu_us=round(self.cpu * 1_000_000)),
+        }
+
+
+class Tracer(object):
+    def __init__(self):
+        self._origin: float = time.perf_counter()
+        self._lock = threading.Lock()
+        self._spans: List[Span] = []
+
+    @property
+    def spans(self) -> List[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    @contextmanager
+    def span(self, name: str, **attrs):
+        start: float = time.perf_counter()
+        start_cpu: float = time.thread_time()
+        try:
+            yield
+        finally:
+            item = Span(
+                name,
+                start - self._origin,
+                time.perf_counter() - start,
+                time.thread_time() - start_cpu,
+                threading.get_ident(),
+                attrs,
+            )
+            with self._lock:
+                self._spans.append(item)
+
+    def summarize(self) -> List[list]:
+        """
+        :return: [[name, count, total wall ms, max wall ms, total cpu ms]] in the order of first appearance
+        """
+        rows: Dict[str, list] = {}
+
+        for item in self.spans:
+            row = rows.setdefault(item.name, [item.name, 0, 0.0, 0.0, 0.0])
+            row[1] += 1
+            row[2] += item.wall * 1000
+            row[3] = max(row[3], item.wall * 1000)
+            row[4] += item.cpu * 1000
+
+        return [[name, count, f"{wall:.1f}", f"{max_wall:.1f}", f"{cpu:.1f}"]
+                for name, count, wall, max_wall, cpu in rows.values()]
+
+    def print_summary(self):
+        print_title("Timings", COLUMN, file=sys.stderr)
+        print_table(["phase", "count", "wall(ms)", "max(ms)", "cpu(ms)"], self.summarize(), file=sys.stderr)
+        print("", file=sys.stderr)
+
+    def save(self, path: str):
+        with open(path, "w") as f:
+            json.dump({"traceEvents": [item.to_trace_event() for item in self.spans]}, f)
+
+
+_tracer: Optional[Tracer] = None
+
+
+def enable_timings() -> Tracer:
+    global _tracer
+
+    if _tracer is None:
+        _tracer = Tracer()
+
+    return _tracer
+
+
+def disable_timings():
+    global _tracer
+    _tracer = None
+
+
+def get_tracer() -> Optional[Tracer]:
+    return _tracer
+
+
+def span(name: str, **attrs):
+    """Record a phase if timings are enabled
+    """
+    if _tracer is None:
+        return nullcontext()
+
+    return _tracer.span(name, **attrs)
@@ -14,30 +14,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .bulk import run_bulk_tx_result
 from .governance import create_reader_by_args
 from .utils import print_tx_result
 
 
-def init(sub_parser, common_parent_parser, invoke_parent_parser):
-    name = "txresult"
-    desc = "getTransactionResult command"
-
-    score_parser = sub_parser.add_parser(
-        name,
-        parents=[common_parent_parser],
-        help=desc)
-
-    score_parser.add_argument(
-        "tx_hash",
-        type=str,
-        nargs="?",
-        help="txHash ex) 0xe2a8e2483736ba8793bebebc30673aa4fb7662763bcdc7b0d4d8a163a79c9e20"
-    )
-
-    score_parser.set_defaults(func=_get_tx_result)
-
-
 def _get_tx_result(args) -> int:
+    if args.input:
+        return run_bulk_tx_result(args)
+
     tx_hash: str = args.tx_hash
 
     reader = create_reader_by_args(args)
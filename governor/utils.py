@@ -15,41 +15,105 @@
 # limitations under the License.
 
 import json
-from typing import TYPE_CHECKING, Union, Optional
+import os
+import sys
+import tempfile
+from typing import TYPE_CHECKING, Any, Dict, List, TextIO, Union, Optional
 from urllib.parse import urlparse
 
-from .constants import COLUMN, PREDEFINED_URLS
+from .constants import COLUMN, PREDEFINED_URLS, CACHE_DIR_ENV, OUTPUT_FORMATS
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 if TYPE_CHECKING:
     from urllib.parse import ParseResult
 
+# table: human readable sections
+# json: a compact json document per output
+# ndjson: a compact json document per line. Lists and tables are written an item per line
+# quiet: nothing but the exit code
+_output: str = OUTPUT_FORMATS[0]
+
+
+def set_output(output: str):
+    global _output
+
+    if output not in OUTPUT_FORMATS:
+        raise ValueError(f"Invalid output: {output}")
+
+    _output = output
+
+
+def get_output() -> str:
+    return _output
+
+
+def _to_json_value(value: Any) -> Any:
+    if isinstance(value, bytes):
+        return f"0x{value.hex()}"
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(data: Any) -> str:
+    """Serialize data to compact json with orjson if it is installed
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=_to_json_value).decode()
+        except TypeError:
+            # orjson accepts only str keys and 64-bit integers
+            pass
+
+    return json.dumps(data, separators=(",", ":"), default=_to_json_value)
+
 
 def hex_to_bytes(tx_hash: str) -> bytes:
     return bytes.fromhex(tx_hash[2:])
 
 
-def print_title(title: str, column: int = COLUMN, sep: str = "="):
+def print_title(title: str, column: int = COLUMN, sep: str = "=", file: Optional[TextIO] = None):
     sep_count: int = max(0, column - len(title) - 3)
-    print(f"[{title}] {sep * sep_count}")
+    print(f"[{title}] {sep * sep_count}", file=file)
+
 
+def print_dict(data: dict, file: Optional[TextIO] = None):
+    print(json.dumps(data, indent=4, default=_to_json_value), file=file)
 
-def print_dict(data: dict):
-    converted = {}
 
-    for key in data:
-        value = data[key]
-        if isinstance(value, bytes):
-            value = f"0x{value.hex()}"
+def print_diagnostic(title: str, content: dict):
+    """Print arguments or a request to stderr, so that stdout has only responses
+    """
+    if _output == "quiet":
+        return
 
-        converted[key] = value
+    print_title(title, COLUMN, file=sys.stderr)
+    print_dict(content, file=sys.stderr)
+    print("", file=sys.stderr)
 
-    print(json.dumps(converted, indent=4))
 
+def _print_json(content: Any):
+    if _output == "ndjson" and isinstance(content, list):
+        sys.stdout.write("".join(f"{dumps(item)}\n" for item in content))
+    else:
+        sys.stdout.write(f"{dumps(content)}\n")
+
+
+def print_response(content: Union[str, dict, list]):
+    if _output == "quiet":
+        return
+    if _output != "table":
+        _print_json(content)
+        return
 
-def print_response(content: Union[str, dict]):
     print_title("Response", COLUMN)
 
-    if isinstance(content, dict):
+    if isinstance(content, (dict, list)):
         print_dict(content)
     else:
         print(content)
@@ -58,10 +122,51 @@ def print_response(content: Union[str, dict]):
 
 
 def print_tx_result(tx_result: dict):
+    if _output == "quiet":
+        return
+    if _output != "table":
+        _print_json(tx_result)
+        return
+
     print_title("Transaction Result")
     print_dict(tx_result)
 
 
+def print_table(header: List[str], rows: List[List[Any]], file: Optional[TextIO] = None):
+    """Print rows in columns aligned to the widest cell
+
+    Rows are printed as json objects keyed by header unless the output is table
+    """
+    if _output == "quiet":
+        return
+    if _output != "table" and file is None:
+        _print_json([dict(zip(header, row)) for row in rows])
+        return
+
+    rows = [[str(cell) for cell in row] for row in [header] + rows]
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+
+    for i, row in enumerate(rows):
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip(), file=file)
+        if i == 0:
+            print("  ".join("-" * width for width in widths), file=file)
+
+
+def flatten_dict(data: Any, prefix: str = "") -> Dict[str, Any]:
+    """Flatten nested dicts into a dict with dotted keys
+
+    ex) {"revision": {"code": "0x5"}} -> {"revision.code": "0x5"}
+    """
+    if not isinstance(data, dict):
+        return {prefix: data}
+
+    ret = {}
+    for key, value in data.items():
+        ret.update(flatten_dict(value, f"{prefix}.{key}" if prefix else key))
+
+    return ret
+
+
 def is_url_valid(url: str) -> bool:
     ps: 'ParseResult' = urlparse(url)
 
@@ -75,6 +180,13 @@ def get_predefined_url(name: str) -> Optional[str]:
 
 
 def get_url(url: str) -> str:
+    """
+    :param url: url or predefined name. Comma-separated ones for several nodes of the same network
+    :return:
+    """
+    if "," in url:
+        return ",".join(get_url(item.strip()) for item in url.split(",") if item.strip())
+
     predefined_url: str = get_predefined_url(url)
 
     if isinstance(predefined_url, str):
@@ -84,3 +196,41 @@ def get_url(url: str) -> str:
         raise ValueError(f"Invalid url: {url}")
 
     return url
+
+
+def save_file(path: str, content: bytes):
+    """Write a file atomically, so that an interrupted write doesn't leave a broken file
+    """
+    directory: str = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def save_json(path: str, data: Any, indent: Optional[int] = 4):
+    """Write data to a json file atomically
+    """
+    save_file(path, json.dumps(data, indent=indent).encode())
+
+
+def get_cache_dir(name: str) -> str:
+    """Return the directory for a given kind of cache
+
+    $GOVERNOR_CACHE_DIR, $XDG_CACHE_HOME/governor or ~/.cache/governor is used as a root in order
+
+    :param name: kind of cache ex) deploy
+    :return:
+    """
+    root: Optional[str] = os.environ.get(CACHE_DIR_ENV)
+    if not root:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        root = os.path.join(cache_home, "governor")
+
+    return os.path.join(root, name)
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import time
+from typing import TYPE_CHECKING, Optional
+
+from iconsdk.exception import JSONRPCException, HTTPError
+from requests.exceptions import RequestException
+
+from .constants import WAIT_TIMEOUT
+
+if TYPE_CHECKING:
+    from .provider import BatchIconService
+
+# JSON-RPC error code returned by a node which doesn't support a given method
+METHOD_NOT_FOUND = -32601
+
+
+class TxResultTimeoutError(Exception):
+    def __init__(self, tx_hash: str, timeout: float):
+        super().__init__(f"Failed to get the transaction result in {timeout} seconds: {tx_hash}")
+        self.tx_hash = tx_hash
+
+
+class TxResultWaiter(object):
+    """Wait for a transaction result until a given deadline
+
+    icx_waitTransactionResult is used first so that the result is returned as soon as
+    the block is committed. If the node doesn't support it,
+    icx_getTransactionResult is polled with exponential backoff instead.
+    """
+
+    def __init__(self,
+                 service: 'BatchIconService',
+                 timeout: float = WAIT_TIMEOUT,
+                 interval: float = 0.2,
+                 max_interval: float = 2.0):
+        self._icon_service = service
+        self._timeout = timeout
+        self._interval = interval
+        self._max_interval = max_interval
+
+        # None: not checked yet
+        self._long_poll: Optional[bool] = None
+
+    def wait(self, tx_hash: str) -> dict:
+        """
+        :param tx_hash:
+        :return: transaction result
+        :exception TxResultTimeoutError: no result until deadline
+        """
+        logging.debug(f"TxResultWaiter.wait() start: {tx_hash}")
+
+        deadline: float = time.monotonic() + self._timeout
+        interval: float = self._interval
+
+        while True:
+            tx_result: Optional[dict] = self._get_tx_result(tx_hash)
+            if tx_result is not None:
+                logging.debug("TxResultWaiter.wait() end")
+                return tx_result
+
+            remaining: float = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TxResultTimeoutError(tx_hash, self._timeout)
+
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, self._max_interval)
+
+    def _get_tx_result(self, tx_hash: str) -> Optional[dict]:
+        try:
+            if self._long_poll is not False:
+                return self._wait_tx_result(tx_hash)
+
+            return self._icon_service.get_transaction_result(tx_hash)
+        except JSONRPCException as e:
+            # The transaction is pending or not propagated to the node yet
+            logging.debug(f"TxResultWaiter._get_tx_result(): {e}")
+        except (HTTPError, RequestException) as e:
+            logging.debug(f"TxResultWaiter._get_tx_result(): {e}")
+
+        return None
+
+    def _wait_tx_result(self, tx_hash: str) -> dict:
+        try:
+            tx_result: dict = self._icon_service.wait_transaction_result(tx_hash)
+        except JSONRPCException as e:
+            if self._long_poll is None and e.rpc_code == METHOD_NOT_FOUND:
+                return self._fallback_to_polling(tx_hash)
+            raise e
+        except HTTPError as e:
+            # Some nodes reply to an unknown method with a non JSON-RPC response
+            if self._long_poll is None:
+                return self._fallback_to_polling(tx_hash)
+            raise e
+
+        self._long_poll = True
+        return tx_result
+
+    def _fallback_to_polling(self, tx_hash: str) -> dict:
+        logging.info("icx_waitTransactionResult is not supported: fallback to polling")
+
+        self._long_poll = False
+        return self._icon_service.get_transaction_result(tx_hash)
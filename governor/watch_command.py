@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import threading
+
+from .governance import create_reader
+from .utils import dumps, get_url
+from .watcher import GovernanceWatcher, WatcherMetrics
+
+
+def _write_event(event: dict):
+    sys.stdout.write(dumps(event) + "\n")
+    sys.stdout.flush()
+
+
+def _watch(args) -> int:
+    url: str = get_url(args.url)
+
+    metrics = WatcherMetrics()
+    watcher = GovernanceWatcher(create_reader(url, args.nid), url, args.nid, _write_event, metrics, args.interval)
+
+    server = None
+    if args.metrics_port is not None:
+        from .metrics import start_metrics_server
+        server = start_metrics_server(metrics.registry, args.metrics_host, args.metrics_port)
+        print(f"Metrics: http://{args.metrics_host}:{server.server_address[1]}/metrics", file=sys.stderr)
+
+    try:
+        watcher.run(threading.Event())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if server is not None:
+            server.shutdown()
+
+    return 0
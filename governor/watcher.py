@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Watch the governance state and report its changes
+
+The last block height is polled every interval and the state is read in a single batch request
+only when the height changes.
+
+Events)
+    {"event": "state", "blockHeight": 100, "time": 1600000000.0, "state": {...}}
+    {"event": "change", "blockHeight": 101, "time": 1600000002.0, "key": "stepCosts",
+     "old": {...}, "new": {...}, "changes": {"stepCosts.apiCall": ["0x2710", "0x3a98"]}}
+    {"event": "error", "time": 1600000004.0, "error": "..."}
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+from iconsdk.exception import IconServiceBaseException
+
+from .constants import WATCH_INTERVAL
+from .governance import GovernanceReader
+from .metrics import Registry, Counter, Gauge, Histogram
+from .snapshot import take_snapshot, diff_snapshots
+
+
+def _to_int(value) -> Optional[int]:
+    try:
+        return int(value, 16) if isinstance(value, str) else int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class WatcherMetrics(object):
+    def __init__(self):
+        self.registry = Registry()
+        register = self.registry.register
+
+        self.block_height = register(Gauge("governor_block_height", "Last block height seen"))
+        self.revision = register(Gauge("governor_revision", "Revision code"))
+        self.step_price = register(Gauge("governor_step_price", "Step price in loop"))
+        self.step_cost = register(Gauge("governor_step_cost", "Step cost per step type"))
+        self.max_step_limit = register(Gauge("governor_max_step_limit", "Max step limit per context type"))
+        self.service_config = register(Gauge("governor_service_config", "Service config flags"))
+        self.changes = register(Counter("governor_changes_total", "Change events emitted"))
+        self.errors = register(Counter("governor_errors_total", "Failed polls"))
+        self.rpc_latency = register(Histogram("governor_rpc_latency_seconds", "RPC latency in seconds"))
+
+        self.changes.inc(0)
+        self.errors.inc(0)
+
+    def update(self, snapshot: dict):
+        state: dict = snapshot["state"]
+
+        self.block_height.set(snapshot["blockHeight"])
+        self._set(self.revision, state["revision"].get("code"))
+        self._set(self.step_price, state["stepPrice"])
+        for step_type, value in state["stepCosts"].items():
+            self._set(self.step_cost, value, type=step_type)
+        for context_type, value in state["maxStepLimits"].items():
+            self._set(self.max_step_limit, value, context_type=context_type)
+        for flag, value in state["serviceConfig"].items():
+            self._set(self.service_config, value, flag=flag)
+
+    @staticmethod
+    def _set(gauge: Gauge, value, **labels):
+        value = _to_int(value)
+        if value is not None:
+            gauge.set(value, **labels)
+
+
+class GovernanceWatcher(object):
+    def __init__(self,
+                 reader: GovernanceReader,
+                 url: str,
+                 nid: int,
+                 on_event: Callable[[dict], None],
+                 metrics: Optional[WatcherMetrics] = None,
+                 interval: float = WATCH_INTERVAL):
+        """
+        :param reader:
+        :param url:
+        :param nid:
+        :param on_event: called with every event
+        :param metrics:
+        :param interval: seconds between polls of the last block height
+        """
+        self._reader = reader
+        self._url = url
+        self._nid = nid
+        self._on_event = on_event
+        self._metrics = metrics or WatcherMetrics()
+        self._interval = interval
+
+        self._height: Optional[int] = None
+        self._snapshot: Optional[dict] = None
+
+    @property
+    def metrics(self) -> WatcherMetrics:
+        return self._metrics
+
+    def _observe(self, method: str, func: Callable):
+        start: float = time.perf_counter()
+        try:
+            return func()
+        finally:
+            self._metrics.rpc_latency.observe(time.perf_counter() - start, method=method)
+
+    def poll(self) -> bool:
+        """Read the state if a new block has been committed since the last poll
+
+        :return: True if the state is read
+        """
+        height: int = self._observe("icx_getLastBlock", self._reader.get_block_height)
+        self._metrics.block_height.set(height)
+        if height == self._height:
+            return False
+
+        snapshot: dict = self._observe("batch", lambda: take_snapshot(self._reader, self._url, self._nid))
+        self._height = height
+        self._metrics.update(snapshot)
+
+        if self._snapshot is None:
+            self._emit("state", snapshot["blockHeight"], state=snapshot["state"])
+        else:
+            self._emit_changes(self._snapshot, snapshot)
+
+        self._snapshot = snapshot
+        return True
+
+    def _emit_changes(self, old: dict, new: dict):
+        changes = diff_snapshots(old, new)
+
+        for key in new["state"]:
+            key_changes = {
+                dotted: list(values) for dotted, values in changes.items()
+                if dotted == key or dotted.startswith(f"{key}.")
+            }
+            if len(key_changes) == 0:
+                continue
+
+            self._metrics.changes.inc()
+            self._emit(
+                "change", new["blockHeight"],
+                key=key, old=old["state"].get(key), new=new["state"][key], changes=key_changes
+            )
+
+    def _emit(self, event: str, block_height: Optional[int], **kwargs):
+        content = {"event": event, "blockHeight": block_height, "time": time.time()}
+        content.update(kwargs)
+        self._on_event(content)
+
+    def run(self, stop_event: threading.Event):
+        """Poll until stop_event is set. A failed poll is reported and retried on the next interval
+        """
+        logging.debug("GovernanceWatcher.run() start")
+
+        while not stop_event.is_set():
+            try:
+                self.poll()
+            except (Exception, IconServiceBaseException) as e:
+                logging.warning(f"GovernanceWatcher.run(): {e}")
+                self._metrics.errors.inc()
+                self._emit("error", self._height, error=str(e))
+
+            stop_event.wait(self._interval)
+
+        logging.debug("GovernanceWatcher.run() end")
@@ -24,7 +24,12 @@ setuptools.setup(
     url=about["url"],
     long_description=long_description,
     long_description_content_type="text/markdown",
-    packages=setuptools.find_packages(),
+    packages=setuptools.find_packages(exclude=("tests", "tests.*", "benchmarks", "benchmarks.*")),
+    extras_require={
+        "async": ["aiohttp"],
+        "json": ["orjson"],
+        "yaml": ["pyyaml"],
+    },
     classifiers=[
         "License :: OSI Approved :: Apache License",
         "Operating System :: OS Independent",
@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""In-process JSON-RPC stand-in for an ICON node running governance SCORE
+"""
+
+import json
+import threading
+from hashlib import sha3_256
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from iconsdk.libs.serializer import serialize
+
+
+class MockNode(object):
+    def __init__(self):
+        self.state = {
+            "version": "1.0.0",
+            "revision": {"code": "0x5", "name": "1.5.0"},
+            "serviceConfig": {"AUDIT": "0x0", "DEPLOYER_WHITE_LIST": "0x0"},
+            "stepCosts": {"default": "0x186a0", "contractCall": "0x61a8", "apiCall": "0x2710"},
+            "stepPrice": "0x2540be400",
+            "maxStepLimits": {"invoke": "0x9502f900", "query": "0x2faf080"},
+            "deployers": set(),
+            "scoreBlackList": set(),
+            "importWhiteList": {"os"},
+            # SCORE address -> getScoreStatus response
+            "scoreStatus": {},
+        }
+        self.support_wait = True
+        self.block_height = 100
+        self.tx_results = {}
+        # height -> block which has transactions
+        self.blocks = {}
+        # call methods whose transactions fail
+        self.failing_methods = set()
+        # txHash -> the number of polls answered with "Pending transaction"
+        self.pending_polls = {}
+        self.requests = []
+        self.http_requests = 0
+        self.connections = 0
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(self))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/api/v3"
+
+    def start(self) -> 'MockNode':
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def handle(self, request: dict) -> dict:
+        self.requests.append(request)
+
+        method: str = request.get("method")
+        params: dict = request.get("params") or {}
+        try:
+            handler = getattr(self, f"_on_{method}")
+            return {"jsonrpc": "2.0", "id": request.get("id"), "result": handler(params)}
+        except _RpcError as e:
+            return _error(request, e.code, e.message)
+        except AttributeError:
+            return _error(request, -32601, f"Method not found: {method}")
+        except KeyError as e:
+            return _error(request, -32602, f"Invalid params: {e}")
+
+    def _on_icx_call(self, params: dict):
+        data: dict = params["data"]
+        method: str = data["method"]
+        call_params: dict = data.get("params") or {}
+        state = self.state
+
+        if method == "getVersion":
+            return state["version"]
+        if method == "getRevision":
+            return state["revision"]
+        if method == "getServiceConfig":
+            return state["serviceConfig"]
+        if method == "getStepCosts":
+            return state["stepCosts"]
+        if method == "getStepPrice":
+            return state["stepPrice"]
+        if method == "getMaxStepLimit":
+            return state["maxStepLimits"][call_params["contextType"]]
+        if method == "getScoreStatus":
+            return state["scoreStatus"].get(call_params["address"], {"current": {"status": "active"}})
+        if method == "isDeployer":
+            return _to_hex_bool(call_params["address"] in state["deployers"])
+        if method == "isInScoreBlackList":
+            return _to_hex_bool(call_params["address"] in state["scoreBlackList"])
+        if method == "isInImportWhiteList":
+            return _to_hex_bool(call_params["importStmt"] in state["importWhiteList"])
+
+        raise KeyError(method)
+
+    def _on_icx_sendTransaction(self, params: dict) -> str:
+        # The same hash as a node calculates. Resending a signed transaction gives the same one
+        data = {key: value for key, value in params.items() if key != "signature"}
+        tx_hash = "0x" + sha3_256(serialize(data)).hexdigest()
+        if tx_hash in self.tx_results:
+            raise KeyError(f"Duplicate transaction: {tx_hash}")
+
+        data: dict = params.get("data") or {}
+        failed: bool = params.get("dataType") == "call" and data["method"] in self.failing_methods
+        if params.get("dataType") == "call" and not failed:
+            self._invoke(data["method"], data.get("params") or {})
+
+        self.block_height += 1
+        self.blocks[self.block_height] = {
+            "height": self.block_height,
+            "block_hash": f"{self.block_height:064x}",
+            "confirmed_transaction_list": [dict(params, txHash=tx_hash)],
+        }
+        self.tx_results[tx_hash] = {
+            "txHash": tx_hash,
+            "status": "0x1",
+            "to": params["to"],
+            "blockHeight": hex(self.block_height),
+            "blockHash": "0x" + "0" * 64,
+            "txIndex": "0x0",
+            "stepUsed": "0x1000",
+            "stepPrice": self.state["stepPrice"],
+            "cumulativeStepUsed": "0x1000",
+            "eventLogs": [],
+            "logsBloom": "0x" + "0" * 512,
+        }
+        if failed:
+            self.tx_results[tx_hash]["status"] = "0x0"
+            self.tx_results[tx_hash]["failure"] = {"code": "0x7d64", "message": f"{data['method']} failed"}
+
+        if params.get("dataType") == "deploy":
+            self._deploy(tx_hash, params["to"])
+
+        return tx_hash
+
+    def _deploy(self, tx_hash: str, to: str):
+        score_address = to if to != "cx" + "0" * 40 else "cx" + tx_hash[2:42]
+        self.tx_results[tx_hash]["scoreAddress"] = score_address
+
+        if self.state["serviceConfig"]["AUDIT"] == "0x1":
+            status = {"next": {"status": "pending", "deployTxHash": tx_hash}}
+        else:
+            status = {"current": {"status": "active", "deployTxHash": tx_hash}}
+        self.state["scoreStatus"][score_address] = status
+
+    def _audit(self, tx_hash: str, accept: bool):
+        for address, status in self.state["scoreStatus"].items():
+            if status.get("next", {}).get("deployTxHash") == tx_hash:
+                if accept:
+                    self.state["scoreStatus"][address] = {"current": {"status": "active", "deployTxHash": tx_hash}}
+                else:
+                    status["next"]["status"] = "rejected"
+
+    def _invoke(self, method: str, params: dict):
+        state = self.state
+
+        if method == "setRevision":
+            state["revision"] = {"code": params["code"], "name": params["name"]}
+        elif method == "setStepPrice":
+            state["stepPrice"] = params["stepPrice"]
+        elif method == "setStepCost":
+            state["stepCosts"][params["stepType"]] = params["cost"]
+        elif method == "setMaxStepLimit":
+            state["maxStepLimits"][params["contextType"]] = params["value"]
+        elif method == "addDeployer":
+            state["deployers"].add(params["address"])
+        elif method == "removeDeployer":
+            state["deployers"].discard(params["address"])
+        elif method == "addToScoreBlackList":
+            state["scoreBlackList"].add(params["address"])
+        elif method == "removeFromScoreBlackList":
+            state["scoreBlackList"].discard(params["address"])
+        elif method == "addImportWhiteList":
+            state["importWhiteList"].add(params["importStmt"])
+        elif method == "removeImportWhiteList":
+            state["importWhiteList"].discard(params["importStmt"])
+        elif method == "acceptScore":
+            self._audit(params["txHash"], accept=True)
+        elif method == "rejectScore":
+            self._audit(params["txHash"], accept=False)
+
+    def _on_icx_getTransactionResult(self, params: dict):
+        tx_hash: str = params["txHash"]
+        if self.pending_polls.get(tx_hash, 0) > 0:
+            self.pending_polls[tx_hash] -= 1
+            raise _RpcError(-31002, "Pending transaction")
+
+        return self.tx_results[tx_hash]
+
+    def _on_icx_waitTransactionResult(self, params: dict):
+        if not self.support_wait:
+            raise AttributeError("icx_waitTransactionResult")
+
+        return self.tx_results[params["txHash"]]
+
+    def _on_icx_getBlockByHeight(self, params: dict) -> dict:
+        height = int(params["height"], 16)
+        if height > self.block_height:
+            raise KeyError(f"No block: {height}")
+
+        empty = {"height": height, "block_hash": f"{height:064x}", "confirmed_transaction_list": []}
+        return self.blocks.get(height, empty)
+
+    def _on_icx_getLastBlock(self, params: dict) -> dict:
+        return {"height": self.block_height, "block_hash": f"{self.block_height:064x}"}
+
+    def _on_debug_estimateStep(self, params: dict) -> str:
+        return "0x1000"
+
+
+class _RpcError(Exception):
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def _to_hex_bool(value: bool) -> str:
+    return "0x1" if value else "0x0"
+
+
+def _error(request: dict, code: int, message: str) -> dict:
+    return {"jsonrpc": "2.0", "id": request.get("id"), "error": {"code": code, "message": message}}
+
+
+def _make_handler(node: MockNode):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body are written separately. Without this, Nagle's algorithm holds the body
+        # until the client's delayed ACK, which adds about 40ms to every request
+        disable_nagle_algorithm = True
+
+        def setup(self):
+            super().setup()
+            node.connections += 1
+
+        def do_POST(self):
+            size = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(size))
+            node.http_requests += 1
+
+            if isinstance(body, list):
+                response = [node.handle(request) for request in body]
+            else:
+                response = node.handle(body)
+
+            status = 200 if isinstance(response, list) or "result" in response else 400
+            data = json.dumps(response).encode()
+
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, fmt, *args):
+            pass
+
+    return Handler
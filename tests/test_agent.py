@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from iconsdk.wallet.wallet import KeyWallet
+
+from governor.agent import AGENT_SOCK_ENV, KeyAgent, AgentClient, AgentWallet, AgentError
+from governor.agent_command import _run_agent
+from governor.utils import set_output
+
+
+class TestKeyAgent(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.keystore_path = os.path.join(self.root, "keystore.json")
+        self.wallet = KeyWallet.create()
+
+        self.agent = KeyAgent(os.path.join(self.root, "agent", "agent.sock"))
+        self.thread = threading.Thread(target=self.agent.serve_forever, args=(0.05,), daemon=True)
+        self.thread.start()
+        self.client = AgentClient(self.agent.path)
+
+    def tearDown(self):
+        self.agent.shutdown()
+        self.agent.server_close()
+        shutil.rmtree(self.root)
+
+    def test_sign(self):
+        self.agent.add_wallet(self.keystore_path, self.wallet, ttl=60)
+        wallet = AgentWallet(self.client, self.keystore_path)
+
+        data = bytes(range(32))
+        assert wallet.get_address() == self.wallet.get_address()
+        assert wallet.sign(data) == self.wallet.sign(data)
+        assert oct(os.stat(self.agent.path).st_mode & 0o777) == oct(0o600)
+
+    def test_socket_directory(self):
+        assert oct(os.stat(os.path.dirname(self.agent.path)).st_mode & 0o777) == oct(0o700)
+
+        shared = os.path.join(self.root, "shared")
+        os.mkdir(shared)
+        os.chmod(shared, 0o777)
+        with self.assertRaises(AgentError):
+            KeyAgent(os.path.join(shared, "agent.sock"))
+
+        # An existing directory is left as it is
+        assert oct(os.stat(shared).st_mode & 0o777) == oct(0o777)
+
+    def test_expired(self):
+        self.agent.add_wallet(self.keystore_path, self.wallet, ttl=-1)
+
+        with self.assertRaises(AgentError):
+            AgentWallet(self.client, self.keystore_path)
+
+    def test_stop(self):
+        assert self.client.is_running()
+        self.client.stop()
+        self.thread.join(5)
+
+        assert not self.thread.is_alive()
+
+    def test_command_json(self):
+        self.wallet.store(self.keystore_path, "password1!")
+
+        def _run(action: str) -> dict:
+            args = argparse.Namespace(action=action, keystore=self.keystore_path, password="password1!", ttl=60)
+            out = io.StringIO()
+            with mock.patch.dict(os.environ, {AGENT_SOCK_ENV: self.agent.path}), redirect_stdout(out):
+                assert _run_agent(args) == 0
+            return json.loads(out.getvalue())
+
+        set_output("json")
+        try:
+            assert _run("add") == {"address": self.wallet.get_address()}
+            assert _run("stop") == {"status": "stopped"}
+        finally:
+            set_output("table")
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import unittest
+
+from iconsdk.wallet.wallet import KeyWallet
+
+from governor.async_governance import (
+    AsyncGovernanceReader,
+    AsyncGovernanceWriter,
+    AsyncStepEstimator,
+    create_async_icon_service,
+    create_async_reader,
+)
+from governor.step_estimator import StepEstimateCache
+from tests.node import MockNode
+
+
+class TestAsyncGovernance(unittest.TestCase):
+    def setUp(self):
+        self.node = MockNode().start()
+
+    def tearDown(self):
+        self.node.stop()
+
+    def test_reader(self):
+        async def run():
+            reader: AsyncGovernanceReader = create_async_reader(self.node.url, 3)
+            try:
+                results = await asyncio.gather(
+                    reader.get_version(),
+                    reader.get_step_price(),
+                    reader.is_deployer("hx" + "1" * 40),
+                    reader.check_if_audit_enabled(),
+                )
+
+                batch = reader.batch()
+                batch.get_revision()
+                batch.get_max_step_limit("query")
+                results.append(await batch.execute())
+            finally:
+                await reader.close()
+
+            return results
+
+        state = self.node.state
+        assert asyncio.run(run()) == [
+            state["version"],
+            state["stepPrice"],
+            "0x0",
+            False,
+            [state["revision"], state["maxStepLimits"]["query"]],
+        ]
+
+    def test_writer(self):
+        address = "hx" + "2" * 40
+
+        async def run():
+            writer = AsyncGovernanceWriter(create_async_icon_service(self.node.url), 3, KeyWallet.create())
+            writer.set_on_send_request(lambda content: True)
+            try:
+                tx_hash = await writer.add_deployer(address)
+                tx_result = await writer.get_tx_result(tx_hash)
+            finally:
+                await writer.close()
+
+            return tx_result
+
+        tx_result = asyncio.run(run())
+        assert tx_result["status"] == 1
+        assert address in self.node.state["deployers"]
+
+    def test_get_block(self):
+        async def run():
+            reader: AsyncGovernanceReader = create_async_reader(self.node.url, 3)
+            try:
+                return await reader.get_block(self.node.block_height)
+            finally:
+                await reader.close()
+
+        assert asyncio.run(run())["height"] == self.node.block_height
+
+    def test_auto_step_limit(self):
+        async def run():
+            icon_service = create_async_icon_service(self.node.url)
+            writer = AsyncGovernanceWriter(icon_service, 3, KeyWallet.create())
+            writer.set_step_estimator(AsyncStepEstimator(icon_service, 3, StepEstimateCache(), margin=0.5))
+            writer.set_sign_only(True)
+            try:
+                return await writer.add_deployer("hx" + "1" * 40)
+            finally:
+                await writer.close()
+
+        signed = asyncio.run(run())
+        assert signed.signed_transaction_dict["stepLimit"] == hex(int(0x1000 * 1.5))
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from iconsdk.builder.transaction_builder import DeployTransactionBuilder
+from iconsdk.signed_transaction import SignedTransaction
+from iconsdk.wallet.wallet import KeyWallet
+
+from governor.__main__ import create_parser
+from governor.audit import AuditQueue, AuditScanner, find_deploy_transactions
+from governor.governance import GovernanceWriter, create_icon_service, create_reader
+from governor.pipeline import Operation, TxPipeline
+from tests.node import MockNode
+
+
+class TestAudit(unittest.TestCase):
+    def setUp(self):
+        self.node = MockNode().start()
+        self.node.state["serviceConfig"]["AUDIT"] = "0x1"
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "queue.json")
+
+        self.wallet = KeyWallet.create()
+        self.icon_service = create_icon_service(self.node.url)
+        self.reader = create_reader(self.node.url, 3)
+
+    def tearDown(self):
+        self.node.stop()
+        shutil.rmtree(self.directory)
+
+    def _deploy(self) -> str:
+        tx = DeployTransactionBuilder() \
+            .from_(self.wallet.get_address()) \
+            .to("cx" + "0" * 40) \
+            .step_limit(10 ** 9) \
+            .nid(3) \
+            .content_type("application/zip") \
+            .content(b"score") \
+            .build()
+
+        return self.icon_service.send_transaction(SignedTransaction(tx, self.wallet))
+
+    def _load_queue(self) -> AuditQueue:
+        return AuditQueue.load(self.path, self.node.url, 3)
+
+    def test_find_deploy_transactions(self):
+        block = {
+            "height": 10,
+            "confirmed_transaction_list": [
+                {"txHash": "0x01", "from": "hx01", "to": "cx01", "dataType": "call"},
+                {"txHash": "0x02", "from": "hx02", "to": "cx02", "dataType": "deploy",
+                 "data": {"contentType": "application/zip"}},
+            ]
+        }
+
+        entries = find_deploy_transactions(block)
+
+        assert entries == [{
+            "txHash": "0x02", "blockHeight": 10, "from": "hx02", "to": "cx02", "contentType": "application/zip"
+        }]
+
+    def test_scan(self):
+        start = self.node.block_height + 1
+        tx_hashes = [self._deploy() for _ in range(3)]
+        scanner = AuditScanner(self.reader, batch_size=2, workers=2)
+
+        queue = self._load_queue()
+        scanner.scan(queue, start, self.node.block_height)
+        queue.entries = scanner.refresh(queue.entries)
+        queue.save()
+
+        queue = self._load_queue()
+        assert queue.height == self.node.block_height
+        assert [entry["txHash"] for entry in queue.entries] == tx_hashes
+        assert all(entry["scoreAddress"].startswith("cx") for entry in queue.entries)
+
+        # Blocks after the checkpoint only are requested
+        self.node.requests.clear()
+        scanner.scan(queue, queue.height + 1, self.node.block_height)
+        assert not any(request["method"] == "icx_getBlockByHeight" for request in self.node.requests)
+
+    def test_scan_failure(self):
+        queue = self._load_queue()
+        end = self.node.block_height
+
+        self.assertRaises(BaseException, AuditScanner(self.reader, batch_size=1).scan, queue, end - 1, end + 5)
+        assert queue.height == end
+
+    def test_batch_accept(self):
+        start = self.node.block_height + 1
+        tx_hashes = [self._deploy() for _ in range(4)]
+        scanner = AuditScanner(self.reader)
+        queue = self._load_queue()
+        scanner.scan(queue, start, self.node.block_height)
+
+        writer = GovernanceWriter(self.icon_service, 3, self.wallet)
+        writer.set_on_send_request(lambda content: True)
+        operations = [Operation("acceptScore", {"tx_hash": tx_hash}) for tx_hash in tx_hashes[:3]]
+        results = TxPipeline(writer, timeout=5).run(operations)
+        assert all(result.success for result in results)
+
+        entries = scanner.refresh(queue.entries)
+        assert [entry["txHash"] for entry in entries] == tx_hashes[3:]
+
+    def test_refresh_failed_deploy(self):
+        start = self.node.block_height + 1
+        tx_hashes = [self._deploy() for _ in range(2)]
+        # A failed deploy has no SCORE address
+        tx_result: dict = self.node.tx_results[tx_hashes[0]]
+        tx_result["status"] = "0x0"
+        del tx_result["scoreAddress"]
+
+        scanner = AuditScanner(self.reader)
+        queue = self._load_queue()
+        scanner.scan(queue, start, self.node.block_height)
+
+        entries = scanner.refresh(queue.entries)
+        assert [entry["txHash"] for entry in entries] == tx_hashes[1:]
+
+    def test_batch_canceled(self):
+        start = self.node.block_height + 1
+        self._deploy()
+        queue = self._load_queue()
+        AuditScanner(self.reader).scan(queue, start, self.node.block_height)
+        queue.save()
+
+        keystore_path = os.path.join(self.directory, "keystore.json")
+        self.wallet.store(keystore_path, "password1!")
+        argv = [
+            "auditBatch", "accept", "--all", "--state", self.path, "--url", self.node.url,
+            "-k", keystore_path, "-p", "password1!",
+        ]
+        args = create_parser(argv=argv).parse_args(argv)
+
+        with mock.patch("builtins.input", return_value="n"):
+            assert args.func(args) == 1
+        assert len(self._load_queue().entries) == 1
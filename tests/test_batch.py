@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from iconsdk.exception import JSONRPCException
+
+from governor.governance import create_reader
+from governor.provider import _to_batch_results
+from tests.node import MockNode
+
+
+class TestGovernanceBatchReader(unittest.TestCase):
+    def setUp(self):
+        self.node = MockNode().start()
+        self.reader = create_reader(self.node.url, 3)
+
+    def tearDown(self):
+        self.node.stop()
+
+    def test_execute(self):
+        batch = self.reader.batch()
+        batch.get_version()
+        batch.get_revision()
+        batch.get_step_price()
+        batch.get_max_step_limit("invoke")
+        batch.is_in_import_white_list("os")
+        assert len(batch) == 5
+
+        results = batch.execute()
+        assert self.node.http_requests == 1
+        assert len(batch) == 0
+
+        state = self.node.state
+        assert results == [
+            state["version"],
+            state["revision"],
+            state["stepPrice"],
+            state["maxStepLimits"]["invoke"],
+            "0x1",
+        ]
+
+    def test_execute_with_error(self):
+        batch = self.reader.batch()
+        batch.get_version()
+        batch.get_max_step_limit("unknown")
+
+        with self.assertRaises(JSONRPCException):
+            batch.execute()
+
+        batch.get_version()
+        batch.get_max_step_limit("unknown")
+        results = batch.execute(return_exceptions=True)
+        assert results[0] == self.node.state["version"]
+        assert isinstance(results[1], JSONRPCException)
+
+    def test_check_if_audit_enabled(self):
+        batch = self.reader.batch()
+        batch.check_if_audit_enabled()
+        self.node.state["serviceConfig"]["AUDIT"] = "0x1"
+        assert batch.execute() == [True]
+        assert self.reader.check_if_audit_enabled()
+
+    def test_missing_response(self):
+        contents = [
+            {"jsonrpc": "2.0", "id": 2, "result": "0x2"},
+            {"jsonrpc": "2.0", "id": 5, "result": "0x5"},
+            {"jsonrpc": "2.0", "id": 0, "error": {"code": -32602, "message": "Invalid params"}},
+        ]
+        results = _to_batch_results(contents, 3)
+
+        assert isinstance(results[0], JSONRPCException)
+        assert isinstance(results[1], JSONRPCException)
+        assert results[2] == "0x2"
+
+    def test_execute_empty(self):
+        assert self.reader.batch().execute() == []
+        assert self.node.http_requests == 0
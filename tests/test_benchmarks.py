@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from benchmarks.runner import summarize, compare_reports, create_report
+from benchmarks.suites import CLI_ARGUMENTS, INTERACTIVE_COMMANDS, run_suites
+from governor.commands import COMMANDS
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_summarize(self):
+        result = summarize([i / 1000 for i in range(100, 0, -1)])
+
+        assert result["n"] == 100
+        assert result["min"] == 1.0
+        assert result["p50"] == 50.0
+        assert result["p90"] == 90.0
+        assert result["p99"] == 99.0
+        assert result["max"] == 100.0
+
+    def test_compare_reports(self):
+        baseline = create_report({"a": {"p50": 10.0}, "b": {"perSecond": 100.0}, "c": {"p50": 1.0}})
+        report = create_report({"a": {"p50": 13.0}, "b": {"perSecond": 90.0}, "d": {"p50": 1.0}})
+
+        assert compare_reports(baseline, report, 0.2) == [
+            ("a", "p50 ms", 10.0, 13.0, True),
+            ("b", "items/s", 100.0, 90.0, False),
+        ]
+
+    def test_cli_arguments(self):
+        names = {command.name for command in COMMANDS} - set(INTERACTIVE_COMMANDS)
+        assert set(CLI_ARGUMENTS) == names
+
+    def test_run_suites(self):
+        results = run_suites(["api", "bulk"], 1, "is_deployer")
+
+        assert list(results) == ["api.reader.is_deployer", "bulk.is_deployer"]
+        assert results["api.reader.is_deployer"]["n"] == 20
+        assert results["bulk.is_deployer"]["items"] == 1000
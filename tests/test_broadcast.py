@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+from iconsdk.exception import JSONRPCException
+from iconsdk.wallet.wallet import KeyWallet
+
+from governor.__main__ import create_parser, run
+from governor.broadcast import (
+    Broadcaster, RateLimiter, find_stale_transactions, is_duplicate, load_signed_transactions
+)
+from governor.governance import create_icon_service
+from tests.node import MockNode
+
+PASSWORD = "password1!"
+
+# Nothing listens on it, so signing has to be done offline
+DOWN_URL = "http://127.0.0.1:1/api/v3"
+
+
+def _address(i: int) -> str:
+    return f"hx{i:040x}"
+
+
+class TestBroadcast(unittest.TestCase):
+    def setUp(self):
+        self.node = MockNode().start()
+        self.directory = tempfile.mkdtemp()
+        self.keystore_path = os.path.join(self.directory, "keystore.json")
+        self.signed_path = os.path.join(self.directory, "signed.ndjson")
+        KeyWallet.create().store(self.keystore_path, PASSWORD)
+        # run() writes governor.log in the current directory
+        self.cwd = os.getcwd()
+        os.chdir(self.directory)
+
+    def tearDown(self):
+        self.node.stop()
+        os.chdir(self.cwd)
+        shutil.rmtree(self.directory)
+
+    def _run(self, *argv) -> int:
+        argv = list(argv)
+        args = create_parser(argv=argv).parse_args(argv)
+
+        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+            return run(args)
+
+    def _sign(self, *argv) -> int:
+        return self._run(
+            *argv, "--url", DOWN_URL, "--nid", "3", "-k", self.keystore_path, "-p", PASSWORD,
+            "--sign-only", self.signed_path
+        )
+
+    def test_sign_only(self):
+        operations_path = os.path.join(self.directory, "operations.json")
+        with open(operations_path, "w") as f:
+            json.dump([{"command": "addDeployer", "params": {"address": _address(i)}} for i in range(2, 5)], f)
+
+        assert self._sign("addDeployer", _address(1)) == 0
+        assert self._sign("pipeline", operations_path) == 0
+
+        records = load_signed_transactions(self.signed_path)
+        assert len(records) == 4
+        assert [record["params"]["data"]["params"]["address"] for record in records] == [
+            _address(i) for i in range(1, 5)
+        ]
+        assert self.node.http_requests == 0
+
+    def test_broadcast(self):
+        for i in range(5):
+            assert self._sign("addDeployer", _address(i)) == 0
+        records = load_signed_transactions(self.signed_path)
+
+        broadcaster = Broadcaster(create_icon_service(self.node.url), max_in_flight=4, timeout=5)
+        results = broadcaster.run(records)
+
+        assert all(result.success for result in results)
+        assert [result.tx_hash for result in results] == [record["txHash"] for record in records]
+        assert self.node.state["deployers"] == {_address(i) for i in range(5)}
+
+        # Broadcasting again sends no new transactions
+        assert self._run("broadcast", self.signed_path, "--url", self.node.url, "--nid", "3") == 0
+        assert len(self.node.tx_results) == 5
+
+        with self.assertRaises(ValueError):
+            self._run("broadcast", self.signed_path, "--url", self.node.url, "--nid", "1")
+
+    def test_stale(self):
+        assert self._sign("addDeployer", _address(1)) == 0
+        records = load_signed_transactions(self.signed_path)
+
+        assert find_stale_transactions(records, 300) == []
+        with mock.patch("time.time", return_value=time.time() + 301):
+            assert find_stale_transactions(records, 300) == [records[0]["txHash"]]
+
+            # Nothing is sent
+            with self.assertRaises(ValueError):
+                self._run("broadcast", self.signed_path, "--url", self.node.url, "--nid", "3")
+            assert self.node.http_requests == 0
+
+    def test_is_duplicate(self):
+        assert is_duplicate(JSONRPCException("Invalid params: 'Duplicate transaction: 0x12'", -32602, None))
+        assert not is_duplicate(JSONRPCException("Already in the score black list", -32602, None))
+        assert not is_duplicate(ValueError("Duplicate transaction"))
+
+    def test_rate_limiter(self):
+        limiter = RateLimiter(50)
+
+        start = time.monotonic()
+        for _ in range(6):
+            limiter.acquire()
+
+        assert time.monotonic() - start >= 0.1
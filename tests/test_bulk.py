@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from governor.__main__ import create_parser
+from governor.bulk import BulkReader, BulkTxResultReader, dedupe, in_order, read_items
+from governor.governance import create_reader
+from tests.node import MockNode
+
+
+def _address(i: int) -> str:
+    return f"hx{i:040x}"
+
+
+class TestBulk(unittest.TestCase):
+    def setUp(self):
+        self.node = MockNode().start()
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.node.stop()
+        shutil.rmtree(self.directory)
+
+    def test_read_items(self):
+        lines = io.StringIO(f"# deployers\n{_address(1)}\n\n{_address(2)}\n {_address(1)} \nhx1234\n")
+        assert dedupe(read_items(lines)) == [_address(1), _address(2), "hx1234"]
+
+    def test_in_order(self):
+        results = [("c", 3), ("a", 1), ("d", 4), ("b", 2)]
+        assert list(in_order(results, ["a", "b", "c", "d"])) == [("a", 1), ("b", 2), ("c", 3), ("d", 4)]
+
+    def test_bulk_checker(self):
+        addresses = [_address(i) for i in range(25)]
+        self.node.state["deployers"] = set(addresses[::2])
+
+        checker = BulkReader(create_reader(self.node.url, 3), "is_deployer", batch_size=10, workers=2)
+        results = dict(checker.run(addresses))
+
+        assert self.node.http_requests == 3
+        assert list(sorted(results)) == addresses
+        for i, address in enumerate(addresses):
+            assert int(results[address], 16) == (i % 2 == 0)
+
+    def test_command(self):
+        self.node.state["deployers"] = {_address(1)}
+        path = os.path.join(self.directory, "addresses.txt")
+        with open(path, "w") as f:
+            f.write(f"{_address(1)}\n{_address(2)}\n{_address(1)}\ninvalid\n")
+
+        argv = ["isDeployer", "--url", self.node.url, "--input", path, "--batch-size", "1"]
+        args = create_parser(argv=argv).parse_args(argv)
+
+        out = io.StringIO()
+        with redirect_stdout(out):
+            assert args.func(args) == 1
+
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert records[0] == {"input": "invalid", "error": "Invalid input"}
+        assert sorted(records[1:], key=lambda record: record["input"]) == [
+            {"input": _address(1), "result": True},
+            {"input": _address(2), "result": False},
+        ]
+        assert self.node.http_requests == 2
+
+        argv = ["isInImportWhiteList", "--url", self.node.url, "--input", path, "--format", "csv"]
+        with open(path, "w") as f:
+            f.write("os\nstruct\n")
+        args = create_parser(argv=argv).parse_args(argv)
+
+        out = io.StringIO()
+        with redirect_stdout(out):
+            assert args.func(args) == 0
+
+        assert out.getvalue().splitlines() == ["input,result,error", "os,True,", "struct,False,"]
+
+    def test_command_stdout(self):
+        self.node.state["deployers"] = {_address(1)}
+        path = os.path.join(self.directory, "addresses.txt")
+        with open(path, "w") as f:
+            f.write(f"{_address(1)}\n{_address(2)}\n")
+
+        # Only the records go to stdout, so that it is able to be piped to another command
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        process = subprocess.run(
+            [sys.executable, "-m", "governor", "isDeployer", "--url", self.node.url, "--input", path],
+            capture_output=True, text=True, cwd=self.directory, env=dict(os.environ, PYTHONPATH=root)
+        )
+
+        assert process.returncode == 0
+        records = [json.loads(line) for line in process.stdout.splitlines()]
+        assert sorted(records, key=lambda record: record["input"]) == [
+            {"input": _address(1), "result": True},
+            {"input": _address(2), "result": False},
+        ]
+        assert "Arguments" in process.stderr
+
+    def _add_tx_result(self, i: int) -> str:
+        tx_hash = f"0x{i:064x}"
+        self.node.tx_results[tx_hash] = {"txHash": tx_hash, "status": "0x1", "blockHeight": hex(i)}
+        return tx_hash
+
+    def test_bulk_tx_result_reader(self):
+        tx_hashes = [self._add_tx_result(i) for i in range(1, 6)]
+        self.node.pending_polls[tx_hashes[1]] = 2
+        unknown = f"0x{0:064x}"
+
+        reader = BulkTxResultReader(create_reader(self.node.url, 3), batch_size=10, interval=0.01)
+        results = dict(reader.run(tx_hashes + [unknown]))
+
+        for tx_hash in tx_hashes:
+            assert results[tx_hash]["txHash"] == tx_hash
+            assert results[tx_hash]["status"] == 1
+        assert isinstance(results[unknown], BaseException)
+        # Only the pending transaction is retried
+        assert self.node.http_requests == 3
+        assert len(self.node.requests) == 8
+
+    def test_tx_result_command(self):
+        tx_hashes = [self._add_tx_result(i) for i in range(1, 6)]
+        self.node.pending_polls[tx_hashes[0]] = 1
+        path = os.path.join(self.directory, "tx_hashes.txt")
+        with open(path, "w") as f:
+            f.write("\n".join(tx_hashes + ["0x1234"]))
+
+        argv = ["txresult", "--url", self.node.url, "-i", path, "--batch-size", "2", "--workers", "3"]
+        args = create_parser(argv=argv).parse_args(argv)
+
+        out = io.StringIO()
+        with redirect_stdout(out):
+            assert args.func(args) == 1
+
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert [record["input"] for record in records] == tx_hashes + ["0x1234"]
+        assert all(record["result"]["status"] == 1 for record in records[:-1])
+        assert records[-1]["error"] == "Invalid input"
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import subprocess
+import sys
+import unittest
+
+from governor.__main__ import create_parser
+from governor.commands import COMMANDS, find_command
+
+HEAVY_MODULES = ("iconsdk.icon_service", "iconsdk.wallet.wallet", "iconsdk.signed_transaction")
+
+
+class TestCommands(unittest.TestCase):
+    def test_table(self):
+        names = [command.name for command in COMMANDS]
+        assert len(names) == len(set(names))
+
+        for command in COMMANDS:
+            assert callable(command.load_handler())
+
+    def test_create_parser_for_argv(self):
+        argv = ["setRevision", "7", "1.7.0", "--keystore", "ks.json"]
+        args = create_parser(argv=argv).parse_args(argv)
+
+        assert args.func is find_command("setRevision").load_handler()
+        assert args.revision == 7
+        assert args.name == "1.7.0"
+        assert args.keystore == "ks.json"
+
+    def test_create_parser_for_all(self):
+        parser = create_parser()
+        choices: dict = parser._subparsers._group_actions[0].choices
+
+        for command in COMMANDS:
+            assert choices[command.name].get_default("func") is command.load_handler()
+
+    def test_format_help(self):
+        choices: dict = create_parser()._subparsers._group_actions[0].choices
+
+        for command in COMMANDS:
+            assert command.name in choices[command.name].format_help()
+
+    def test_create_stub_parser(self):
+        parser = create_parser(argv=[])
+        choices: dict = parser._subparsers._group_actions[0].choices
+
+        assert list(choices) == [command.name for command in COMMANDS]
+        assert all(choice.get_default("func") is None for choice in choices.values())
+
+    def test_lazy_import(self):
+        code = (
+            "import sys\n"
+            "from governor.__main__ import create_parser\n"
+            "argv = ['getVersion', '--url', 'testnet']\n"
+            "create_parser(argv=argv).parse_args(argv)\n"
+            f"print([name for name in {HEAVY_MODULES} if name in sys.modules])\n"
+        )
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+        assert output.strip() == "[]"
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from iconsdk.libs import in_memory_zip
+
+from governor import deploy_cache
+from governor.deploy_cache import DeployContentCache
+
+
+class TestDeployContentCache(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.score_path = os.path.join(self.root, "governance")
+        self.cache_dir = os.path.join(self.root, "cache")
+
+        self._write("package.json", '{"version": "1.0.0", "main_score": "Governance"}')
+        self._write("governance.py", "class Governance: pass\n")
+        self._write("tests/test_governance.py", "# test\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _write(self, name: str, data: str):
+        path = os.path.join(self.score_path, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(data)
+
+    def _load(self, cache: DeployContentCache) -> tuple:
+        with mock.patch.object(deploy_cache, "build_package", wraps=deploy_cache.build_package) as build:
+            content = cache.load(self.score_path)
+
+        return content, build.call_count
+
+    def test_load(self):
+        cache = DeployContentCache()
+
+        content, count = self._load(cache)
+        assert content == in_memory_zip.gen_deploy_data_content(self.score_path)
+        assert count == 1
+
+        assert self._load(cache) == (content, 0)
+
+    def test_rebuild_on_change(self):
+        cache = DeployContentCache()
+        content, _ = self._load(cache)
+
+        # Files excluded from the zip don't invalidate the cache
+        self._write("tests/test_governance.py", "# changed\n")
+        self._write(".hidden", "hidden")
+        assert self._load(cache) == (content, 0)
+
+        self._write("governance.py", "class Governance: pass  # changed\n")
+        new_content, count = self._load(cache)
+        assert count == 1
+        assert new_content != content
+
+    def test_directory(self):
+        content, count = self._load(DeployContentCache(self.cache_dir, size=1))
+        assert count == 1
+
+        # Another process reuses the zipped package on disk
+        assert self._load(DeployContentCache(self.cache_dir, size=1)) == (content, 0)
+
+        self._write("governance.py", "class Governance: pass  # changed\n")
+        self._load(DeployContentCache(self.cache_dir, size=1))
+        assert len(os.listdir(self.cache_dir)) == 1
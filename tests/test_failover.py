@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from iconsdk.wallet.wallet import KeyWallet
+from requests.exceptions import ReadTimeout
+
+from governor.constants import CACHE_DIR_ENV
+from governor.failover import FailoverProvider
+from governor.governance import GovernanceReader, GovernanceWriter, create_icon_service
+from governor.provider import BatchHTTPProvider, BatchIconService
+from tests.node import MockNode
+
+DOWN_URL = "http://127.0.0.1:1"
+
+
+def _base_url(node: MockNode) -> str:
+    return node.url[:-len("/api/v3")]
+
+
+class TimeoutProvider(BatchHTTPProvider):
+    """Delivers requests to the node and loses its responses
+    """
+
+    def make_request(self, method: str, params=None, full_response: bool = False):
+        super().make_request(method, params, full_response)
+        raise ReadTimeout("Read timed out")
+
+
+class TestFailoverProvider(unittest.TestCase):
+    def setUp(self):
+        self.nodes = [MockNode().start(), MockNode().start()]
+        self.directory = tempfile.mkdtemp()
+        self.health_path = os.path.join(self.directory, "health.json")
+
+    def tearDown(self):
+        for node in self.nodes:
+            node.stop()
+        shutil.rmtree(self.directory)
+
+    def _create_provider(self, *urls: str, **kwargs) -> FailoverProvider:
+        providers = [BatchHTTPProvider(url, 3) for url in urls]
+        return FailoverProvider(providers, health_path=self.health_path, **kwargs)
+
+    def test_failover(self):
+        provider = self._create_provider(DOWN_URL, _base_url(self.nodes[0]), failure_threshold=2)
+        reader = GovernanceReader(BatchIconService(provider), 3)
+
+        for _ in range(3):
+            assert reader.get_version() == "1.0.0"
+
+        down, alive = provider.health
+        assert down.failures == 2 and down.is_open(down.open_until - 1)
+        assert alive.failures == 0 and alive.latency is not None
+        assert len(self.nodes[0].requests) == 3
+
+        # Batch requests fail over as well
+        batch = reader.batch()
+        batch.get_version()
+        batch.get_revision()
+        assert batch.execute()[0] == "1.0.0"
+
+        # The next process skips the dead node from the start
+        provider = self._create_provider(DOWN_URL, _base_url(self.nodes[0]))
+        assert provider.health[0].failures == 2 and provider.health[0].open_until == down.open_until
+
+    def test_application_error(self):
+        provider = self._create_provider(_base_url(self.nodes[0]), _base_url(self.nodes[1]))
+        reader = GovernanceReader(BatchIconService(provider), 3)
+
+        # An invalid request isn't sent to another node
+        with self.assertRaises(BaseException):
+            reader.get_max_step_limit("unknown")
+        assert len(self.nodes[1].requests) == 0
+        assert provider.health[0].failures == 0
+
+    def test_latency(self):
+        provider = self._create_provider(_base_url(self.nodes[0]), _base_url(self.nodes[1]))
+        provider.health[0].latency = 1.0
+        provider.health[1].latency = 0.1
+
+        GovernanceReader(BatchIconService(provider), 3).get_version()
+
+        assert len(self.nodes[0].requests) == 0
+        assert len(self.nodes[1].requests) == 1
+        assert provider.health[1].latency < 0.1
+
+    def test_resend(self):
+        url: str = _base_url(self.nodes[0])
+        provider = FailoverProvider([TimeoutProvider(url, 3), BatchHTTPProvider(url, 3)])
+
+        writer = GovernanceWriter(BatchIconService(provider), 3, KeyWallet.create())
+        writer.set_on_send_request(lambda content: True)
+        tx_hash: str = writer.set_step_price(10)
+
+        # The node got the transaction from the first attempt and only once
+        assert list(self.nodes[0].tx_results) == [tx_hash]
+
+    def test_long_polling_timeout(self):
+        provider = FailoverProvider([
+            TimeoutProvider(_base_url(self.nodes[0]), 3),
+            BatchHTTPProvider(_base_url(self.nodes[1]), 3),
+        ])
+
+        writer = GovernanceWriter(create_icon_service(self.nodes[0].url), 3, KeyWallet.create())
+        writer.set_on_send_request(lambda content: True)
+        tx_hash: str = writer.set_step_price(10)
+
+        # No result until the read timeout is not a failure of the node
+        with self.assertRaises(ReadTimeout):
+            provider.make_request("icx_waitTransactionResult", {"txHash": tx_hash})
+
+        assert provider.health[0].failures == 0
+        assert len(self.nodes[1].requests) == 0
+
+    def test_create_icon_service(self):
+        urls = f"{self.nodes[0].url}, {self.nodes[1].url}"
+        with mock.patch.dict(os.environ, {CACHE_DIR_ENV: self.directory}):
+            icon_service = create_icon_service(urls)
+
+        assert isinstance(icon_service.provider, FailoverProvider)
+        assert icon_service.provider.rpc_url == f"{self.nodes[0].url},{self.nodes[1].url}"
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from governor.__main__ import create_parser
+from governor.constants import PREDEFINED_URLS
+from governor.fan_out import fan_out, get_fan_out_urls, is_fan_out, run_fan_out
+from tests.node import MockNode
+
+DOWN_URL = "http://127.0.0.1:1/api/v3"
+
+
+class TestFanOut(unittest.TestCase):
+    def setUp(self):
+        self.nodes = [MockNode().start(), MockNode().start()]
+        self.nodes[1].state["stepCosts"]["apiCall"] = "0x3a98"
+
+    def tearDown(self):
+        for node in self.nodes:
+            node.stop()
+
+    def _parse(self, *argv):
+        return create_parser(argv=list(argv)).parse_args(list(argv))
+
+    def test_get_fan_out_urls(self):
+        args = self._parse("getVersion", "--url", "all")
+        assert is_fan_out(args)
+        assert get_fan_out_urls(args) == PREDEFINED_URLS
+
+        args = self._parse("getVersion", "--urls", f"mainnet, {DOWN_URL}")
+        assert get_fan_out_urls(args) == {"mainnet": PREDEFINED_URLS["mainnet"], DOWN_URL: DOWN_URL}
+
+        assert not is_fan_out(self._parse("getVersion", "--url", "mainnet"))
+
+    def test_fan_out(self):
+        urls = {"a": self.nodes[0].url, "b": self.nodes[1].url, "down": DOWN_URL}
+        results = fan_out(urls, 3, "get_step_costs", [])
+
+        assert results["a"]["apiCall"] == "0x2710"
+        assert results["b"]["apiCall"] == "0x3a98"
+        assert isinstance(results["down"], Exception)
+
+    def test_run_fan_out(self):
+        urls = ",".join(node.url for node in self.nodes)
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            assert run_fan_out(self._parse("getStepCosts", "--urls", urls)) == 0
+
+        lines = output.getvalue().splitlines()
+        assert [line.split()[0] for line in lines if "apiCall" in line] == ["*"]
+        assert [line.split()[0] for line in lines if "contractCall" in line] == ["contractCall"]
+
+        with self.assertRaises(ValueError):
+            run_fan_out(self._parse("addDeployer", "hx" + "1" * 40, "-k", "ks.json", "--urls", urls))
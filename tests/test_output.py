@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+from iconsdk.wallet.wallet import KeyWallet
+
+from governor.__main__ import create_parser, run
+from governor.utils import dumps, set_output
+from tests.node import MockNode
+
+
+class TestOutput(unittest.TestCase):
+    def setUp(self):
+        self.node = MockNode().start()
+        # run() writes governor.log in the current directory
+        self.cwd = os.getcwd()
+        self.directory = tempfile.mkdtemp()
+        os.chdir(self.directory)
+
+    def tearDown(self):
+        self.node.stop()
+        set_output("table")
+        os.chdir(self.cwd)
+        shutil.rmtree(self.directory)
+
+    def _run(self, *argv) -> (int, str, str):
+        argv = list(argv) + ["--url", self.node.url]
+        args = create_parser(argv=argv).parse_args(argv)
+
+        out, err = io.StringIO(), io.StringIO()
+        with redirect_stdout(out), redirect_stderr(err):
+            ret = run(args)
+
+        return ret, out.getvalue(), err.getvalue()
+
+    def test_dumps(self):
+        assert dumps({"a": [1, "b"], "c": b"\x01"}) == '{"a":[1,"b"],"c":"0x01"}'
+        assert dumps({"a": {"hx2", "hx1"}}) == '{"a":["hx1","hx2"]}'
+        # Falls back to json for what orjson doesn't support
+        assert dumps({1: 2 ** 70}) == '{"1":%d}' % 2 ** 70
+
+    def test_json(self):
+        ret, out, err = self._run("getStepCosts", "--output", "json")
+
+        assert ret == 0
+        assert json.loads(out)["apiCall"] == 10000
+        assert len(out.splitlines()) == 1
+        assert "[Arguments]" in err and "[Request]" in err
+
+    def test_json_step_price(self):
+        ret, out, _ = self._run("getStepPrice", "--output", "json")
+
+        assert ret == 0
+        assert json.loads(out) == {"stepPrice": int(self.node.state["stepPrice"], 16)}
+
+    def test_table(self):
+        ret, out, err = self._run("getStepCosts")
+
+        assert ret == 0
+        assert "[Response]" in out and "[Arguments]" not in out
+        assert "[Arguments]" in err
+
+    def test_ndjson(self):
+        urls = f"{self.node.url},{self.node.url}"
+        ret, out, _ = self._run("getStepCosts", "--urls", urls, "--output", "ndjson")
+
+        rows = {row["key"]: row for row in map(json.loads, out.splitlines())}
+        assert ret == 0
+        assert rows["apiCall"] == {"changed": False, "key": "apiCall", self.node.url: "0x2710"}
+
+    def test_quiet(self):
+        ret, out, err = self._run("getStepCosts", "--output", "quiet")
+
+        assert ret == 0
+        assert out == "" and err == ""
+
+    def test_write(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "keystore.json")
+            KeyWallet.create().store(path, "password1!")
+
+            ret, out, _ = self._run(
+                "addDeployer", "hx" + "1" * 40, "-k", path, "-p", "password1!", "-y", "--output", "json"
+            )
+
+        tx_result = json.loads(out)
+        assert ret == 0
+        assert tx_result["status"] == 1
+        assert tx_result["txHash"] in self.node.tx_results
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+
+from iconsdk.libs.in_memory_zip import gen_deploy_data_content
+from iconsdk.wallet.wallet import KeyWallet
+
+from governor.constants import GOVERNANCE_ADDRESS
+from governor.governance import TxBuildHelper, TxHandler
+from governor.package import build_package, get_content_preview
+
+
+class TestPackage(unittest.TestCase):
+    def setUp(self):
+        self.score_path = tempfile.mkdtemp()
+
+        with open(os.path.join(self.score_path, "package.json"), "w") as f:
+            f.write('{"version": "1.0.0", "main_score": "Governance"}')
+        with open(os.path.join(self.score_path, "data.bin"), "wb") as f:
+            f.write(os.urandom(256 * 1024))
+
+    def tearDown(self):
+        shutil.rmtree(self.score_path)
+
+    def test_build_package(self):
+        expected: bytes = gen_deploy_data_content(self.score_path)
+
+        with build_package(self.score_path, spool_size=64 * 1024) as package:
+            # Spooled to disk instead of being kept in memory
+            assert package.spilled
+            assert package.size == len(expected)
+            assert package.digest == f"0x{hashlib.sha3_256(expected).hexdigest()}"
+            assert package.read() == expected
+
+    def test_build_small_package(self):
+        with build_package(self.score_path) as package:
+            assert not package.spilled
+            assert package.read() == gen_deploy_data_content(self.score_path)
+
+    def test_request_content_preview(self):
+        content: bytes = gen_deploy_data_content(self.score_path)
+        transaction = TxBuildHelper(None, 3).update(KeyWallet.create(), GOVERNANCE_ADDRESS, content)
+
+        request: dict = TxHandler._to_request_content(transaction)
+        assert request["content"] == get_content_preview(content)
+        assert request["content"]["size"] == len(content)
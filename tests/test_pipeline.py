@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest import mock
+
+from iconsdk.signed_transaction import SignedTransaction
+from iconsdk.wallet.wallet import KeyWallet
+import urllib3
+
+from governor.constants import MAX_IN_FLIGHT
+from governor.governance import GovernanceWriter, create_icon_service
+from governor.pipeline import TxPipeline, Operation
+from tests.node import MockNode
+
+
+class TestTxPipeline(unittest.TestCase):
+    def setUp(self):
+        self.node = MockNode().start()
+        self.writer = GovernanceWriter(create_icon_service(self.node.url), 3, KeyWallet.create())
+        self.writer.set_on_send_request(lambda content: True)
+
+    def tearDown(self):
+        self.node.stop()
+
+    def test_run(self):
+        addresses = [f"hx{i:040x}" for i in range(20)]
+        operations = [Operation("addDeployer", {"address": address}) for address in addresses]
+        operations.append(Operation("setStepCost", {"step_type": "apiCall", "cost": 100}))
+
+        results = TxPipeline(self.writer, workers=4, max_in_flight=8, timeout=5).run(operations)
+
+        assert len(results) == len(operations)
+        for operation, result in zip(operations, results):
+            assert result.operation is operation
+            assert result.success
+        assert self.node.state["deployers"] == set(addresses)
+        assert self.node.state["stepCosts"]["apiCall"] == "0x64"
+        assert not self.writer.sign_only
+
+    def _run_with_pool_warnings(self, writer: GovernanceWriter, max_in_flight: int) -> list:
+        operations = [Operation("addDeployer", {"address": f"hx{i:040x}"}) for i in range(64)]
+
+        with mock.patch.object(urllib3.connectionpool.log, "warning") as warning:
+            results = TxPipeline(writer, max_in_flight=max_in_flight, timeout=5).run(operations)
+        assert all(result.success for result in results)
+
+        return [c for c in warning.call_args_list if "pool is full" in c.args[0]]
+
+    def test_pool_size(self):
+        # Every connection is kept alive and reused, none is discarded for a full pool
+        assert self._run_with_pool_warnings(self.writer, MAX_IN_FLIGHT) == []
+
+        # The shared pool grows for more transactions in flight
+        writer = GovernanceWriter(create_icon_service(self.node.url, pool_size=64), 3, KeyWallet.create())
+        writer.set_on_send_request(lambda content: True)
+        assert self._run_with_pool_warnings(writer, 64) == []
+
+    def test_sign_only(self):
+        self.writer.set_sign_only(True)
+        signed = self.writer.set_step_price(10)
+
+        assert isinstance(signed, SignedTransaction)
+        assert self.node.http_requests == 0
+
+    def test_cancel(self):
+        self.writer.set_on_send_request(lambda content: False)
+        results = TxPipeline(self.writer).run([Operation("addDeployer", {"address": "hx" + "1" * 40})])
+
+        assert results == []
+        assert self.node.http_requests == 0
+
+    def test_invalid_operation(self):
+        with self.assertRaises(ValueError):
+            Operation("getVersion")
+
+        with self.assertRaises(ValueError):
+            TxPipeline(self.writer).run([Operation("setStepCost", {"step_type": "unknown", "cost": 1})])
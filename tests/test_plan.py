@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from iconsdk.exception import JSONRPCException
+from iconsdk.wallet.wallet import KeyWallet
+from requests.exceptions import ConnectionError, ReadTimeout
+
+from governor.constants import CACHE_DIR_ENV
+from governor.governance import GovernanceWriter, create_icon_service
+from governor.plan import Journal, Plan, PlanExecutor, PlanStep, load_plan
+from tests.node import MockNode
+
+
+def _step(step_id: str, command: str, params: dict, depends_on=None) -> PlanStep:
+    return PlanStep.from_dict({"id": step_id, "command": command, "params": params, "depends_on": depends_on})
+
+
+def _address(i: int) -> str:
+    return f"hx{i:040x}"
+
+
+class TestPlan(unittest.TestCase):
+    def test_dependencies(self):
+        plan = Plan([
+            _step("revision", "setRevision", {"revision": 9, "name": "1.7.0"}),
+            _step("deployer", "addDeployer", {"address": _address(1)}),
+            _step("update", "update", {"score_path": "./governance"}),
+            _step("price", "setStepPrice", {"step_price": 10}),
+            _step("deployer2", "removeDeployer", {"address": _address(1)}),
+            _step("cost", "setStepCost", {"step_type": "apiCall", "cost": 100}, depends_on="deployer"),
+            _step("price2", "setStepPrice", {"step_price": 20}),
+        ])
+
+        assert plan.dependencies == {
+            "revision": {"update"},
+            "deployer": set(),
+            "update": {"deployer"},
+            "price": {"update"},
+            "deployer2": {"update", "deployer"},
+            "cost": {"update", "deployer"},
+            "price2": {"update", "price"},
+        }
+        assert plan.order == ["deployer", "update", "revision", "price", "deployer2", "cost", "price2"]
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            Plan([_step("a", "setStepPrice", {"step_price": 1}, ["b"])])
+        with self.assertRaises(ValueError):
+            Plan([_step("a", "setStepPrice", {"step_price": 1}), _step("a", "setStepPrice", {"step_price": 2})])
+        with self.assertRaises(ValueError):
+            Plan([
+                _step("a", "addDeployer", {"address": _address(1)}, ["b"]),
+                _step("b", "addDeployer", {"address": _address(2)}, ["a"]),
+            ])
+
+    def test_default_id(self):
+        first = PlanStep.from_dict({"command": "addDeployer", "params": {"address": _address(1)}})
+        second = PlanStep.from_dict({"command": "addDeployer", "params": {"address": _address(1)}})
+
+        assert first.id == second.id
+        assert first.id.startswith("addDeployer-")
+
+
+class TestPlanExecutor(unittest.TestCase):
+    def setUp(self):
+        self.node = MockNode().start()
+        self.directory = tempfile.mkdtemp()
+        self.journal_path = os.path.join(self.directory, "plan.json.journal.json")
+
+        self.writer = GovernanceWriter(create_icon_service(self.node.url), 3, KeyWallet.create())
+        self.writer.set_on_send_request(lambda content: True)
+
+    def tearDown(self):
+        self.node.stop()
+        shutil.rmtree(self.directory)
+
+    def _write_plan(self, steps: list) -> str:
+        path = os.path.join(self.directory, "plan.json")
+        with open(path, "w") as f:
+            json.dump({"steps": steps}, f)
+
+        return path
+
+    def _run(self, plan: Plan) -> list:
+        return PlanExecutor(self.writer, Journal(self.journal_path), max_in_flight=4, timeout=5).run(plan)
+
+    def _sent_methods(self) -> list:
+        return [
+            block["confirmed_transaction_list"][0].get("data", {}).get("method", "deploy")
+            for _, block in sorted(self.node.blocks.items())
+        ]
+
+    def test_run(self):
+        score_path = os.path.join(self.directory, "governance")
+        os.makedirs(score_path)
+        with open(os.path.join(score_path, "package.json"), "w") as f:
+            json.dump({"version": "1.0.0", "main_module": "governance", "main_score": "Governance"}, f)
+
+        steps = [{"command": "addDeployer", "params": {"address": _address(i)}} for i in range(5)]
+        steps += [
+            {"command": "setRevision", "params": {"revision": 9, "name": "1.7.0"}},
+            {"id": "update", "command": "update", "params": {"score_path": "governance"}},
+        ]
+        plan = load_plan(self._write_plan(steps))
+
+        with mock.patch.dict(os.environ, {CACHE_DIR_ENV: os.path.join(self.directory, "cache")}):
+            results = self._run(plan)
+
+        assert all(result.success for result in results)
+        assert self.node.state["deployers"] == {_address(i) for i in range(5)}
+        assert self._sent_methods()[-2:] == ["deploy", "setRevision"]
+
+        # Finished steps are skipped on re-run
+        sent = len(self.node.tx_results)
+        results = self._run(plan)
+        assert all(result.success and result.resumed for result in results)
+        assert len(self.node.tx_results) == sent
+
+    def test_failure(self):
+        self.node.failing_methods.add("setStepPrice")
+        plan = Plan([
+            _step("price", "setStepPrice", {"step_price": 10}),
+            _step("cost", "setStepCost", {"step_type": "apiCall", "cost": 100}, ["price"]),
+            _step("deployer", "addDeployer", {"address": _address(1)}),
+        ])
+
+        results = {result.step.id: result for result in self._run(plan)}
+
+        assert not results["price"].success and results["price"].tx_result["status"] == 0
+        assert results["cost"].skipped and results["cost"].tx_hash is None
+        assert results["deployer"].success
+
+        # Only the failed and skipped steps run again
+        self.node.failing_methods.clear()
+        results = {result.step.id: result for result in self._run(plan)}
+        assert all(result.success for result in results.values())
+        assert results["deployer"].resumed
+        methods = self._sent_methods()
+        assert sorted(methods[:2]) == ["addDeployer", "setStepPrice"]
+        assert methods[2:] == ["setStepPrice", "setStepCost"]
+
+    def test_resume_submitted(self):
+        plan = Plan([_step("deployer", "addDeployer", {"address": _address(1)})])
+        self._run(plan)
+
+        # A run interrupted after sending the transaction
+        journal = Journal(self.journal_path)
+        entry = journal.get(plan.steps[0])
+        journal.record(plan.steps[0], entry["txHash"], Journal.SUBMITTED)
+
+        results = self._run(plan)
+        assert results[0].success and not results[0].resumed
+        assert results[0].tx_hash == entry["txHash"]
+        assert len(self.node.tx_results) == 1
+
+    def test_resume_timed_out(self):
+        plan = Plan([_step("deployer", "addDeployer", {"address": _address(1)})])
+        icon_service = self.writer.icon_service
+        send_raw_transaction = icon_service.send_raw_transaction
+
+        # The node accepts the transaction but the response does not arrive in time
+        def _send_raw_transaction(params: dict) -> str:
+            send_raw_transaction(params)
+            raise ReadTimeout("Read timed out")
+
+        with mock.patch.object(icon_service, "send_raw_transaction", _send_raw_transaction):
+            results = self._run(plan)
+        assert isinstance(results[0].error, ReadTimeout)
+        assert Journal(self.journal_path).get(plan.steps[0])["status"] == Journal.SUBMITTED
+
+        results = self._run(plan)
+        assert results[0].success
+        assert len(self.node.tx_results) == 1
+        assert Journal(self.journal_path).get(plan.steps[0])["status"] == Journal.SUCCEEDED
+
+    def test_resume_unsent(self):
+        plan = Plan([_step("deployer", "addDeployer", {"address": _address(1)})])
+
+        # A run which stopped after recording the transaction but before the node received it
+        with mock.patch.object(self.writer.icon_service, "send_raw_transaction", side_effect=ConnectionError):
+            results = self._run(plan)
+        assert isinstance(results[0].error, ConnectionError)
+        assert len(self.node.tx_results) == 0
+
+        results = self._run(plan)
+        assert results[0].success
+        assert results[0].tx_hash == Journal(self.journal_path).get(plan.steps[0])["txHash"]
+        assert self.node.state["deployers"] == {_address(1)}
+
+    def test_resume_rejected(self):
+        plan = Plan([_step("deployer", "addDeployer", {"address": _address(1)})])
+
+        # A run which stopped before sending the transaction, which the node rejects later. ex) expired
+        with mock.patch.object(self.writer.icon_service, "send_raw_transaction", side_effect=ConnectionError):
+            self._run(plan)
+        stale: dict = Journal(self.journal_path).get(plan.steps[0])
+
+        send_raw_transaction = self.writer.icon_service.send_raw_transaction
+
+        def _send_raw_transaction(params: dict) -> str:
+            if params == stale["transaction"]:
+                raise JSONRPCException("Invalid timestamp", -32602, None)
+            return send_raw_transaction(params)
+
+        with mock.patch.object(self.writer.icon_service, "send_raw_transaction", _send_raw_transaction):
+            results = self._run(plan)
+
+        # Signed again and the journal has the new transaction
+        assert results[0].success
+        assert results[0].tx_hash != stale["txHash"]
+        entry: dict = Journal(self.journal_path).get(plan.steps[0])
+        assert entry["txHash"] == results[0].tx_hash and entry["status"] == Journal.SUCCEEDED
+        assert len(self.node.tx_results) == 1
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from governor.governance import create_icon_service, create_reader
+from tests.node import MockNode
+
+
+class TestProvider(unittest.TestCase):
+    def setUp(self):
+        self.node = MockNode().start()
+
+    def tearDown(self):
+        self.node.stop()
+
+    def test_shared_icon_service(self):
+        assert create_icon_service(self.node.url) is create_icon_service(self.node.url)
+
+    def test_keep_alive(self):
+        reader = create_reader(self.node.url, 3)
+        reader.set_on_send_request(lambda content: True)
+
+        for _ in range(5):
+            reader.get_version()
+
+        assert self.node.http_requests == 5
+        assert self.node.connections == 1
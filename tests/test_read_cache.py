@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from governor.governance import create_reader
+from governor.read_cache import ReadCache, MemoryBackend, DiskBackend
+from tests.node import MockNode
+
+
+class TestReadCache(unittest.TestCase):
+    def setUp(self):
+        self.node = MockNode().start()
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.node.stop()
+        shutil.rmtree(self.directory)
+
+    def _count(self, method: str) -> int:
+        return sum(1 for request in self.node.requests if request["method"] == method)
+
+    def _create_reader(self, backend, interval: float = 0.0):
+        reader = create_reader(self.node.url, 3)
+        reader.set_read_cache(ReadCache(self.node.url, backend, reader.get_block_height, interval))
+        return reader
+
+    def test_invalidate_on_new_block(self):
+        reader = self._create_reader(MemoryBackend())
+
+        assert reader.get_step_costs() == self.node.state["stepCosts"]
+        assert reader.get_step_costs() == self.node.state["stepCosts"]
+        assert reader.get_max_step_limit("invoke") == self.node.state["maxStepLimits"]["invoke"]
+        assert self._count("icx_call") == 2
+
+        self.node.state["stepCosts"]["apiCall"] = "0x3a98"
+        self.node.block_height += 1
+        assert reader.get_step_costs()["apiCall"] == "0x3a98"
+        assert self._count("icx_call") == 3
+
+    def test_block_height_interval(self):
+        reader = self._create_reader(MemoryBackend(), interval=60)
+
+        for _ in range(3):
+            reader.get_service_config()
+        self.node.block_height += 1
+        reader.get_service_config()
+
+        assert self._count("icx_getLastBlock") == 1
+        assert self._count("icx_call") == 1
+
+    def test_disk_backend(self):
+        self._create_reader(DiskBackend(self.directory)).get_revision()
+        # Another process with the same cache directory
+        assert self._create_reader(DiskBackend(self.directory)).get_revision() == self.node.state["revision"]
+        assert self._count("icx_call") == 1
+
+    def test_disk_backend_size(self):
+        backend = DiskBackend(self.directory, size=3)
+        for i in range(3):
+            backend.put(f"key{i}", 1, i)
+            time.sleep(0.01)
+        assert backend.get("key0") == (1, 0)
+
+        for i in range(3, 5):
+            time.sleep(0.01)
+            backend.put(f"key{i}", 1, i)
+
+        # The least recently used ones are removed
+        assert len(os.listdir(self.directory)) == 3
+        assert [backend.get(f"key{i}") for i in range(5)] == [(1, 0), None, None, (1, 3), (1, 4)]
+
+    def test_coalesce(self):
+        started = threading.Event()
+        calls = []
+
+        def call():
+            calls.append(1)
+            started.set()
+            time.sleep(0.2)
+            return "0x1"
+
+        cache = ReadCache(self.node.url, MemoryBackend(), lambda: 1)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(cache.call, "getStepPrice", None, call)]
+            started.wait()
+            futures += [executor.submit(cache.call, "getStepPrice", None, call) for _ in range(3)]
+
+        assert [future.result() for future in futures] == ["0x1"] * 4
+        assert len(calls) == 1
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+from governor.__main__ import create_parser, run
+from governor.timings import Tracer, get_tracer
+from governor.utils import set_output
+from tests.node import MockNode
+
+
+class TestShell(unittest.TestCase):
+    def setUp(self):
+        self.node = MockNode().start()
+        # run() writes governor.log in the current directory
+        self.cwd = os.getcwd()
+        self.directory = tempfile.mkdtemp()
+        os.chdir(self.directory)
+
+    def tearDown(self):
+        self.node.stop()
+        set_output("table")
+        os.chdir(self.cwd)
+        shutil.rmtree(self.directory)
+
+    def _shell(self, *lines) -> (int, str, str):
+        """Runs 'governor shell' with the lines piped through stdin
+        """
+        argv = ["shell", "--url", self.node.url]
+        args = create_parser(argv=argv).parse_args(argv)
+
+        stdin = io.StringIO("".join(f"{line}\n" for line in lines))
+        out, err = io.StringIO(), io.StringIO()
+        with mock.patch("sys.stdin", stdin), redirect_stdout(out), redirect_stderr(err):
+            ret = run(args)
+
+        return ret, out.getvalue(), err.getvalue()
+
+    def _count(self, method: str) -> int:
+        return sum(1 for request in self.node.requests if request["method"] == method)
+
+    def test_dispatch(self):
+        ret, out, _ = self._shell("getVersion --output json", "getStepPrice --output json", "exit")
+
+        assert ret == 0
+        assert '"1.0.0"' in out
+        assert '{"stepPrice":10000000000}' in out
+
+    def test_error_recovery(self):
+        ret, out, err = self._shell(
+            "unknownCommand",
+            "getVersion --bogus",
+            'getVersion "unterminated',
+            "shell",
+            f"txresult 0x{'ab' * 32}",
+            "getVersion --output json",
+        )
+
+        assert ret == 0
+        assert "invalid choice: 'unknownCommand'" in err
+        assert "unrecognized arguments: --bogus" in err
+        assert "Error: No closing quotation" in out
+        assert "Error: already in shell" in out
+        # An error from the node
+        assert "Error: Invalid params" in out
+        # The session goes on after every error
+        assert '"1.0.0"' in out
+
+    def test_exit(self):
+        for line in ("exit", "quit"):
+            ret, out, _ = self._shell(line, "getVersion --output json")
+            assert ret == 0
+            # Nothing is run after exit
+            assert '"1.0.0"' not in out
+            assert self._count("icx_call") == 0
+
+        # End of input ends the session as well
+        ret, _, _ = self._shell()
+        assert ret == 0
+
+    def test_read_cache_is_kept_only_with_read_cache(self):
+        self._shell("getStepCosts", "getStepCosts")
+        assert self._count("icx_call") == 2
+
+        self.node.requests.clear()
+        self._shell("getStepCosts --read-cache memory", "getStepCosts --read-cache memory", "getStepCosts")
+        # Only the command without --read-cache goes to the node again
+        assert self._count("icx_call") == 2
+
+    def test_timings_per_command(self):
+        summaries = []
+
+        def print_summary(tracer: Tracer):
+            summaries.append({row[0]: row[1] for row in tracer.summarize()})
+
+        with mock.patch.object(Tracer, "print_summary", autospec=True, side_effect=print_summary):
+            self._shell("getVersion --timings", "getRevision", "getStepCosts --timings")
+
+        assert len(summaries) == 2
+        for summary in summaries:
+            assert summary["command"] == 1
+        assert get_tracer() is None
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from governor.__main__ import create_parser
+from governor.governance import create_reader
+from governor.snapshot import take_snapshot, save_snapshot, load_snapshot, diff_snapshots
+from tests.node import MockNode
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.node = MockNode().start()
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.node.stop()
+        shutil.rmtree(self.directory)
+
+    def _take_snapshot(self) -> dict:
+        return take_snapshot(create_reader(self.node.url, 3), self.node.url, 3)
+
+    def test_take_snapshot(self):
+        snapshot = self._take_snapshot()
+
+        # A single batch request
+        assert self.node.http_requests == 1
+        assert snapshot["url"] == self.node.url
+        assert snapshot["blockHeight"] == self.node.block_height
+        assert snapshot["state"]["revision"] == self.node.state["revision"]
+        assert snapshot["state"]["maxStepLimits"] == self.node.state["maxStepLimits"]
+
+        path = os.path.join(self.directory, "snapshot.json")
+        save_snapshot(snapshot, path)
+        assert load_snapshot(path) == snapshot
+
+    def test_diff_snapshots(self):
+        a = self._take_snapshot()
+        self.node.state["stepCosts"]["apiCall"] = "0x3a98"
+        self.node.state["revision"] = {"code": "0x6", "name": "1.6.0"}
+        b = self._take_snapshot()
+
+        assert diff_snapshots(a, a) == {}
+        assert diff_snapshots(a, b) == {
+            "revision.code": ("0x5", "0x6"),
+            "revision.name": ("1.5.0", "1.6.0"),
+            "stepCosts.apiCall": ("0x2710", "0x3a98"),
+        }
+
+        del b["state"]["stepCosts"]["apiCall"]
+        assert diff_snapshots(a, b)["stepCosts.apiCall"] == ("0x2710", None)
+
+    def test_diff_command(self):
+        path = os.path.join(self.directory, "snapshot.json")
+        save_snapshot(self._take_snapshot(), path)
+        self.node.http_requests = 0
+
+        argv = ["diff", path, self.node.url]
+        args = create_parser(argv=argv).parse_args(argv)
+        assert args.func(args) == 0
+        assert self.node.http_requests == 1
+
+        self.node.state["stepPrice"] = "0x0"
+        assert args.func(args) == 1
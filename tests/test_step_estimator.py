@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from iconsdk.signed_transaction import SignedTransaction
+from iconsdk.wallet.wallet import KeyWallet
+
+from governor.governance import GovernanceWriter, create_icon_service
+from governor.step_estimator import StepEstimateCache, StepEstimator
+from tests.node import MockNode
+
+
+class TestStepEstimator(unittest.TestCase):
+    def setUp(self):
+        self.node = MockNode().start()
+        self.icon_service = create_icon_service(self.node.url)
+        self.cache = StepEstimateCache()
+
+        self.writer = GovernanceWriter(self.icon_service, 3, KeyWallet.create())
+        self.writer.set_on_send_request(lambda content: True)
+        self.writer.set_step_estimator(StepEstimator(self.icon_service, 3, self.cache, margin=0.5))
+
+    def tearDown(self):
+        self.node.stop()
+
+    def _count(self, method: str) -> int:
+        return sum(1 for request in self.node.requests if request["method"] == method)
+
+    def test_estimate(self):
+        self.writer.set_estimate(True)
+
+        assert self.writer.set_step_price(10) == 0x1000
+        assert self.writer.set_step_price(10) == 0x1000
+        assert self._count("debug_estimateStep") == 1
+        # Different params
+        assert self.writer.set_step_price(20) == 0x1000
+        assert self._count("debug_estimateStep") == 2
+
+        # A new revision invalidates estimates
+        self.node.state["revision"] = {"code": "0x6", "name": "1.6.0"}
+        self.writer.set_step_estimator(StepEstimator(self.icon_service, 3, self.cache))
+        self.writer.set_step_price(10)
+        assert self._count("debug_estimateStep") == 3
+
+    def test_auto_step_limit(self):
+        self.writer.set_sign_only(True)
+
+        signed: SignedTransaction = self.writer.add_deployer("hx" + "1" * 40)
+        assert signed.signed_transaction_dict["stepLimit"] == hex(int(0x1000 * 1.5))
+
+    def test_cache_file(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "step", "estimates.json")
+
+        try:
+            cache = StepEstimateCache(path, size=2)
+            for i in range(3):
+                cache.put(f"key{i}", i)
+
+            cache = StepEstimateCache(path, size=2)
+            assert cache.get("key0") is None
+            assert cache.get("key1") == 1
+            assert cache.get("key2") == 2
+        finally:
+            shutil.rmtree(directory)
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from iconsdk.wallet.wallet import KeyWallet
+
+from governor.governance import GovernanceWriter, create_icon_service, create_reader
+from governor.pipeline import TxPipeline
+from governor.sync import StateSynchronizer
+from tests.node import MockNode
+
+
+def _address(i: int) -> str:
+    return f"hx{i:040x}"
+
+
+class TestStateSynchronizer(unittest.TestCase):
+    def setUp(self):
+        self.node = MockNode().start()
+        self.node.state["deployers"] = {_address(1), _address(2)}
+        self.synchronizer = StateSynchronizer(create_reader(self.node.url, 3), batch_size=2)
+
+        self.desired = {
+            "deployers": {"present": [_address(1), _address(3)], "absent": [_address(2), _address(4)]},
+            "importWhiteList": ["os"],
+            "stepCosts": {"apiCall": 10000, "contractCall": "0x6000"},
+            "stepPrice": "0x2540be400",
+            "maxStepLimits": {"invoke": 3000000000},
+        }
+
+    def tearDown(self):
+        self.node.stop()
+
+    def test_diff(self):
+        operations = [operation.to_dict() for operation in self.synchronizer.diff(self.desired)]
+
+        assert operations == [
+            {"command": "addDeployer", "params": {"address": _address(3)}},
+            {"command": "removeDeployer", "params": {"address": _address(2)}},
+            {"command": "setStepCost", "params": {"step_type": "contractCall", "cost": 0x6000}},
+            {"command": "setMaxStepLimit", "params": {"context_type": "invoke", "value": 3000000000}},
+        ]
+
+    def test_sync(self):
+        writer = GovernanceWriter(create_icon_service(self.node.url), 3, KeyWallet.create())
+        writer.set_on_send_request(lambda content: True)
+
+        results = TxPipeline(writer, timeout=5).run(self.synchronizer.diff(self.desired))
+        assert all(result.success for result in results)
+        assert self.node.state["deployers"] == {_address(1), _address(3)}
+
+        # Nothing to send once in sync
+        self.node.requests.clear()
+        assert self.synchronizer.diff(self.desired) == []
+        assert len(self.node.requests) == 8
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            self.synchronizer.diff({"deployers": {"present": [_address(1)], "absent": [_address(1)]}})
+        with self.assertRaises(ValueError):
+            self.synchronizer.diff({"deployers": _address(1)})
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from iconsdk.wallet.wallet import KeyWallet
+
+from governor.governance import GovernanceWriter, create_icon_service
+from governor.timings import enable_timings, disable_timings, get_tracer, span
+from tests.node import MockNode
+
+
+class TestTimings(unittest.TestCase):
+    def setUp(self):
+        self.node = MockNode().start()
+
+    def tearDown(self):
+        self.node.stop()
+        disable_timings()
+
+    def test_disabled(self):
+        with span("phase"):
+            pass
+
+        assert get_tracer() is None
+
+    def test_write(self):
+        tracer = enable_timings()
+
+        writer = GovernanceWriter(create_icon_service(self.node.url), 3, KeyWallet.create())
+        writer.set_on_send_request(lambda content: True)
+        writer.set_step_price(10)
+
+        names = [item.name for item in tracer.spans]
+        assert names == ["confirm", "tx.sign", "rpc icx_sendTransaction"]
+
+        rows = tracer.summarize()
+        assert [row[0] for row in rows] == names
+        assert all(row[1] == 1 for row in rows)
+
+    def test_save(self):
+        tracer = enable_timings()
+        with span("outer", command="test"):
+            with span("inner"):
+                pass
+
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, "trace.json")
+            tracer.save(path)
+            with open(path, "r") as f:
+                events: list = json.load(f)["traceEvents"]
+        finally:
+            shutil.rmtree(directory)
+
+        inner, outer = events
+        assert (inner["name"], outer["name"]) == ("inner", "outer")
+        assert outer["args"]["command"] == "test"
+        assert outer["ts"] <= inner["ts"] and inner["dur"] <= outer["dur"]
+        assert all(event["ph"] == "X" for event in events)
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import unittest
+
+from governor.governance import create_icon_service
+from governor.waiter import TxResultWaiter, TxResultTimeoutError
+from tests.node import MockNode
+
+TX_HASH = "0x" + "a" * 64
+
+
+class TestTxResultWaiter(unittest.TestCase):
+    def setUp(self):
+        self.node = MockNode().start()
+        self.icon_service = create_icon_service(self.node.url)
+
+    def tearDown(self):
+        self.node.stop()
+
+    def _commit_later(self, delay: float):
+        result = {"txHash": TX_HASH, "status": "0x1", "blockHeight": "0x65"}
+        timer = threading.Timer(delay, self.node.tx_results.__setitem__, (TX_HASH, result))
+        timer.start()
+
+    def _methods(self) -> set:
+        return set(request["method"] for request in self.node.requests)
+
+    def test_wait_with_long_poll(self):
+        self._commit_later(0.3)
+
+        tx_result = TxResultWaiter(self.icon_service, timeout=5).wait(TX_HASH)
+        assert tx_result["status"] == 1
+        assert self._methods() == {"icx_waitTransactionResult"}
+
+    def test_wait_with_polling(self):
+        self.node.support_wait = False
+        self._commit_later(0.3)
+
+        tx_result = TxResultWaiter(self.icon_service, timeout=5).wait(TX_HASH)
+        assert tx_result["status"] == 1
+        assert "icx_getTransactionResult" in self._methods()
+
+    def test_timeout(self):
+        with self.assertRaises(TxResultTimeoutError):
+            TxResultWaiter(self.icon_service, timeout=0.5).wait(TX_HASH)
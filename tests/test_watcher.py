@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+import urllib.request
+
+from governor.governance import create_reader
+from governor.metrics import Histogram, start_metrics_server
+from governor.watcher import GovernanceWatcher
+from tests.node import MockNode
+
+
+class TestWatcher(unittest.TestCase):
+    def setUp(self):
+        self.node = MockNode().start()
+        self.events = []
+        self.watcher = GovernanceWatcher(create_reader(self.node.url, 3), self.node.url, 3, self.events.append)
+
+    def tearDown(self):
+        self.node.stop()
+
+    def test_poll(self):
+        assert self.watcher.poll()
+        assert self.events[0]["event"] == "state"
+        assert self.events[0]["state"]["stepPrice"] == self.node.state["stepPrice"]
+
+        # The state is not read again in the same block
+        requests = len(self.node.requests)
+        assert not self.watcher.poll()
+        assert len(self.node.requests) == requests + 1
+
+        self.node.block_height += 1
+        self.node.state["stepCosts"]["apiCall"] = "0x3a98"
+        self.node.state["stepPrice"] = "0x1"
+        assert self.watcher.poll()
+
+        changes = {event["key"]: event for event in self.events[1:]}
+        assert list(changes) == ["stepCosts", "stepPrice"]
+        assert changes["stepCosts"]["changes"] == {"stepCosts.apiCall": ["0x2710", "0x3a98"]}
+        assert changes["stepPrice"]["old"] == "0x2540be400"
+        assert changes["stepPrice"]["new"] == "0x1"
+
+        metrics = self.watcher.metrics
+        assert metrics.step_cost.get(type="apiCall") == 0x3a98
+        assert metrics.step_price.get() == 1
+        assert metrics.changes.get() == 2
+
+    def test_metrics_server(self):
+        self.watcher.poll()
+        server = start_metrics_server(self.watcher.metrics.registry, "127.0.0.1", 0)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+            text: str = urllib.request.urlopen(url).read().decode()
+        finally:
+            server.shutdown()
+
+        assert f"governor_block_height {float(self.node.block_height)}" in text
+        assert 'governor_max_step_limit{context_type="invoke"}' in text
+        assert "# TYPE governor_changes_total counter" in text
+        assert 'governor_rpc_latency_seconds_count{method="batch"} 1' in text
+
+    def test_run(self):
+        stop_event = threading.Event()
+
+        def on_event(event: dict):
+            self.events.append(event)
+            stop_event.set()
+
+        url = self.node.url
+        self.node.stop()
+        watcher = GovernanceWatcher(create_reader(url, 3), url, 3, on_event, interval=0.01)
+        watcher.run(stop_event)
+
+        assert self.events[0]["event"] == "error"
+        assert watcher.metrics.errors.get() == 1
+
+    def test_command_stdout(self):
+        directory = tempfile.mkdtemp()
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        process = subprocess.Popen(
+            [sys.executable, "-m", "governor", "watch", "--url", self.node.url, "--interval", "0.05"],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+            cwd=directory, env=dict(os.environ, PYTHONPATH=root)
+        )
+        timer = threading.Timer(10, process.kill)
+        timer.start()
+        try:
+            # The first line of stdout is an event, not the arguments of the command
+            event = json.loads(process.stdout.readline())
+        finally:
+            timer.cancel()
+            process.terminate()
+            _, err = process.communicate()
+            shutil.rmtree(directory)
+
+        assert event["event"] == "state"
+        assert event["state"]["version"] == self.node.state["version"]
+        assert "Arguments" in err
+
+    def test_histogram(self):
+        histogram = Histogram("latency", "", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value, method="a")
+
+        assert histogram.render()[2:] == [
+            'latency_bucket{method="a",le="0.1"} 2',
+            'latency_bucket{method="a",le="1.0"} 3',
+            'latency_bucket{method="a",le="+Inf"} 4',
+            'latency_sum{method="a"} 3.65',
+            'latency_count{method="a"} 4',
+        ]